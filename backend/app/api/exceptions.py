@@ -1,14 +1,168 @@
-"""Standard HTTP exceptions for common cases."""
-from typing import Optional
-from fastapi import HTTPException, status
+"""
+Standard HTTP exceptions for common cases.
+
+All message-style helpers share one builder, ``_build``, which looks up the
+default message for a status code in ``_DEFAULTS``. Each public helper is a
+thin wrapper that passes its status code and message to the builder.
+
+The ``*_response`` siblings return a ready JSON ``Response`` with the same
+body instead of an exception. They are for middleware and other code that
+can return a response directly, skipping the raise/catch round-trip through
+Starlette's exception middleware. Route handlers should keep raising.
+
+The app's HTTPException handler encodes ``detail`` with orjson directly, so
+details must stay JSON-native types (str, int, None, or lists/dicts of them).
+
+The module is kept fully annotated with ``Final`` module constants and no
+dynamic attribute access so it passes ``mypy --strict`` and can be compiled
+with mypyc unchanged if a compiled build is ever introduced.
+"""
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from typing import Final
+
+import orjson
+from fastapi import HTTPException, Response, status
+
+__all__ = [
+    "not_found",
+    "forbidden",
+    "bad_request",
+    "conflict",
+    "unauthorized",
+    "server_error",
+    "rate_limited",
+    "not_found_response",
+    "forbidden_response",
+    "encode_error_body",
+]
+
+
+class _HTTPError(HTTPException):
+    """
+    HTTPException with a flat constructor.
+
+    Still an HTTPException, so existing ``except HTTPException`` blocks and the
+    app's exception handler treat it the same. The constructor sets the three
+    attributes Starlette reads directly instead of going through the
+    FastAPI -> Starlette ``__init__`` chain (detail is always given here, so the
+    HTTPStatus phrase fallback is never needed). ``__slots__ = ()`` keeps the
+    subclass from adding any per-instance storage of its own.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, status_code: int, detail: str, headers: dict[str, str] | None = None) -> None:
+        self.status_code = status_code
+        self.detail = detail
+        self.headers = headers
+
+
+# Status codes bound once as plain ints so helpers skip the module attribute
+# lookup on every call.
+_HTTP_400: Final[int] = status.HTTP_400_BAD_REQUEST
+_HTTP_401: Final[int] = status.HTTP_401_UNAUTHORIZED
+_HTTP_403: Final[int] = status.HTTP_403_FORBIDDEN
+_HTTP_404: Final[int] = status.HTTP_404_NOT_FOUND
+_HTTP_409: Final[int] = status.HTTP_409_CONFLICT
+_HTTP_429: Final[int] = status.HTTP_429_TOO_MANY_REQUESTS
+_HTTP_500: Final[int] = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+# Default detail message per status code, used when a helper is called
+# without a message. Interned so every default detail is one shared object.
+_DEFAULTS: Final[dict[int, str]] = {
+    code: sys.intern(message) for code, message in {
+        _HTTP_401: "Incorrect username or password",
+        _HTTP_403: "Not authorized to perform this action",
+        _HTTP_429: "Too many requests. Please try again later.",
+        _HTTP_500: "Internal server error",
+    }.items()
+}
+
+# Encoded JSON bodies for the default messages, built once at import so the
+# exception handler can emit them without serializing anything.
+_PRESERIALIZED: Final[dict[int, bytes]] = {
+    code: orjson.dumps({"detail": message}) for code, message in _DEFAULTS.items()
+}
+
+# "<resource> not found" details, keyed by resource name. Callers pass a small
+# fixed set of literals ("Event", "User", ...) so this stays tiny.
+_NOT_FOUND_CACHE: Final[dict[str, str]] = {}
+
+
+def _build(status_code: int, message: str | None = None) -> HTTPException:
+    """
+    Return an HTTPException for a status code.
+
+    Args:
+        status_code: HTTP status code (a key of ``_DEFAULTS`` if message is omitted)
+        message: Custom error message; the status code's default if omitted
+
+    Returns:
+        HTTPException with the given status code
+    """
+    if message is None:
+        # A dict lookup, not match/case: CPython compiles integer case patterns
+        # to sequential comparisons, so a match over these four codes is no
+        # faster for the first case and slower for later ones.
+        return _HTTPError(status_code, _DEFAULTS[status_code])
+    return _HTTPError(status_code, message)
+
+
+def encode_error_body(status_code: int, detail: object) -> bytes:
+    """
+    Return the encoded ``{"detail": ...}`` body for an HTTPException.
+
+    Default-message details are the interned strings from ``_DEFAULTS``, so an
+    identity check finds their pre-encoded body; anything else is encoded
+    with orjson.
+
+    Args:
+        status_code: Exception status code
+        detail: Exception detail (must be a JSON-native type)
 
+    Returns:
+        JSON body as bytes
+    """
+    if detail is _DEFAULTS.get(status_code):
+        return _PRESERIALIZED[status_code]
+    return orjson.dumps({"detail": detail})
+
+
+@lru_cache(maxsize=256)
+def _error_body(status_code: int, detail: str) -> bytes:
+    """Return the encoded ``{"detail": ...}`` body for a status code and message."""
+    return encode_error_body(status_code, detail)
 
-def not_found(resource: str = "Resource", resource_id: Optional[int] = None) -> HTTPException:
+
+def _build_response(status_code: int, message: str | None = None) -> Response:
+    """
+    Return a JSON error Response for a status code.
+
+    Args:
+        status_code: HTTP status code (a key of ``_DEFAULTS`` if message is omitted)
+        message: Custom error message; the status code's default if omitted
+
+    Returns:
+        Response with a ``{"detail": ...}`` JSON body
+    """
+    detail = _DEFAULTS[status_code] if message is None else message
+    return Response(
+        content=_error_body(status_code, detail),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+def not_found(resource: str = "Resource", resource_id: int | None = None) -> HTTPException:
     """
     Return 404 Not Found exception.
 
     Args:
-        resource: Name of the resource that wasn't found
+        resource: Name of the resource that wasn't found (a fixed name such as
+            "Event"; the resulting detail string is cached per name)
         resource_id: Optional ID of the resource
 
     Returns:
@@ -18,16 +172,15 @@ def not_found(resource: str = "Resource", resource_id: Optional[int] = None) ->
         raise not_found("Event", 123)  # "Event with ID 123 not found"
         raise not_found("User")         # "User not found"
     """
-    detail = f"{resource} not found"
-    if resource_id:
-        detail = f"{resource} with ID {resource_id} not found"
-    return HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=detail
+    if resource_id is not None:
+        return _HTTPError(_HTTP_404, f"{resource} with ID {resource_id} not found")
+    detail = _NOT_FOUND_CACHE.get(resource) or _NOT_FOUND_CACHE.setdefault(
+        resource, sys.intern(f"{resource} not found")
     )
+    return _HTTPError(_HTTP_404, detail)
 
 
-def forbidden(message: str = "Not authorized to perform this action") -> HTTPException:
+def forbidden(message: str | None = None) -> HTTPException:
     """
     Return 403 Forbidden exception.
 
@@ -41,10 +194,7 @@ def forbidden(message: str = "Not authorized to perform this action") -> HTTPExc
         raise forbidden()  # Uses default message
         raise forbidden("Only administrators can perform this action")
     """
-    return HTTPException(
-        status_code=status.HTTP_403_FORBIDDEN,
-        detail=message
-    )
+    return _build(_HTTP_403, message)
 
 
 def bad_request(message: str) -> HTTPException:
@@ -61,10 +211,7 @@ def bad_request(message: str) -> HTTPException:
         raise bad_request("Invalid email format")
         raise bad_request("Missing required field: name")
     """
-    return HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        detail=message
-    )
+    return _build(_HTTP_400, message)
 
 
 def conflict(message: str) -> HTTPException:
@@ -81,13 +228,10 @@ def conflict(message: str) -> HTTPException:
         raise conflict("Email already exists")
         raise conflict("Cannot delete active event")
     """
-    return HTTPException(
-        status_code=status.HTTP_409_CONFLICT,
-        detail=message
-    )
+    return _build(_HTTP_409, message)
 
 
-def unauthorized(message: str = "Incorrect username or password") -> HTTPException:
+def unauthorized(message: str | None = None) -> HTTPException:
     """
     Return 401 Unauthorized exception.
 
@@ -101,13 +245,10 @@ def unauthorized(message: str = "Incorrect username or password") -> HTTPExcepti
         raise unauthorized()  # Uses default message
         raise unauthorized("Invalid API token")
     """
-    return HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail=message
-    )
+    return _build(_HTTP_401, message)
 
 
-def server_error(message: str = "Internal server error") -> HTTPException:
+def server_error(message: str | None = None) -> HTTPException:
     """
     Return 500 Internal Server Error exception.
 
@@ -121,13 +262,10 @@ def server_error(message: str = "Internal server error") -> HTTPException:
         raise server_error("Failed to connect to database")
         raise server_error("Unexpected error during processing")
     """
-    return HTTPException(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail=message
-    )
+    return _build(_HTTP_500, message)
 
 
-def rate_limited(message: str = "Too many requests. Please try again later.") -> HTTPException:
+def rate_limited(message: str | None = None) -> HTTPException:
     """
     Return 429 Too Many Requests exception.
 
@@ -141,7 +279,44 @@ def rate_limited(message: str = "Too many requests. Please try again later.") ->
         raise rate_limited()  # Uses default message
         raise rate_limited("VPN request limit exceeded. Please wait before requesting more.")
     """
-    return HTTPException(
-        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-        detail=message
-    )
+    return _build(_HTTP_429, message)
+
+
+def not_found_response(resource: str = "Resource", resource_id: int | None = None) -> Response:
+    """
+    Return a 404 JSON Response with the same body as not_found().
+
+    Args:
+        resource: Name of the resource that wasn't found
+        resource_id: Optional ID of the resource
+
+    Returns:
+        Response with 404 status code
+
+    Examples:
+        return not_found_response("Event", 123)
+    """
+    if resource_id is not None:
+        body = orjson.dumps({"detail": f"{resource} with ID {resource_id} not found"})
+    else:
+        detail = _NOT_FOUND_CACHE.get(resource) or _NOT_FOUND_CACHE.setdefault(
+            resource, sys.intern(f"{resource} not found")
+        )
+        body = _error_body(_HTTP_404, detail)
+    return Response(content=body, status_code=_HTTP_404, media_type="application/json")
+
+
+def forbidden_response(message: str | None = None) -> Response:
+    """
+    Return a 403 JSON Response with the same body as forbidden().
+
+    Args:
+        message: Custom error message
+
+    Returns:
+        Response with 403 status code
+
+    Examples:
+        return forbidden_response("CSRF token missing")
+    """
+    return _build_response(_HTTP_403, message)
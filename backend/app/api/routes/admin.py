@@ -1,11 +1,14 @@
 """Admin API routes for participant management."""
 import logging
 import secrets
+from functools import lru_cache
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Select, bindparam, exists, select, func, and_, or_
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.api.exceptions import not_found, forbidden, bad_request, conflict, unauthorized, server_error
 
@@ -16,8 +19,14 @@ from app.dependencies import (
     permissions
 )
 from app.api.utils.request import extract_client_metadata
-from app.api.utils.pagination import calculate_pagination
-from app.api.utils.response_builders import build_participant_response
+from app.api.utils.event import get_active_event_cached
+from app.api.utils.pagination import calculate_pagination, fetch_sorted_page
+from app.api.utils import stats_cache
+from app.api.utils.response_builders import (
+    build_participant_response,
+    build_participant_responses,
+    json_response,
+)
 from app.api.utils.dependencies import (
     get_participant_service,
     get_vpn_service
@@ -56,11 +65,59 @@ from app.models.email_queue import EmailQueue, EmailBatchLog, EmailQueueStatus
 from app.services.email_queue_service import EmailQueueService
 from datetime import datetime, timedelta, timezone, date
 from app.services.vpn_service import VPNService
+from app.services.event_service import EventService, invalidate_active_event_cache
+from app.services.workflow_service import WorkflowService
+from app.services.email_service import queue_invitation_email_for_user
+from app.services.discord_invite_service import DiscordInviteService
+from app.services.instance_sync_scheduler import get_scheduler as get_instance_scheduler
+from app.models.event import Event, EventParticipation, ParticipationStatus, generate_slug
+from app.models.email_workflow import EmailWorkflow, WorkflowTriggerEvent
+from app.models.scheduler_status import SchedulerStatus
+from app.schemas.workflow import WorkflowCreate, WorkflowUpdate, WorkflowResponse
+from app.tasks.scheduler import list_jobs
+from app.tasks.invitation_reminders import queue_reminders
+from app.tasks.invitation_emails import schedule_invitation_emails
+from app.config import get_settings
 
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
 logger = logging.getLogger(__name__)
 
+# Permission checks bound once at import instead of per request
+_can_view_participant = permissions.can_view_participant
+_can_edit_participant = permissions.can_edit_participant
+_can_delete_participant = permissions.can_delete_participant
+
+# Dashboard statistics are global (not per-user) and expensive to aggregate,
+# so they are served from a short-lived in-process cache.
+STATS_CACHE_TTL_SECONDS = 15
+PARTICIPANT_STATS_CACHE_KEY = "participant_stats"
+VPN_STATS_CACHE_KEY = "vpn_stats"
+
+# Welcome workflow trigger for admin/sponsor accounts created from the admin panel
+_ROLE_TO_TRIGGER = {
+    UserRole.ADMIN.value: WorkflowTriggerEvent.ADMIN_CREATED,
+    UserRole.SPONSOR.value: WorkflowTriggerEvent.SPONSOR_CREATED,
+}
+
+# Role-specific template variables for the welcome email
+_ROLE_TEMPLATE_VARS = {
+    UserRole.ADMIN.value: {
+        "role": "Admin",
+        "role_label": "ADMIN",
+        "role_upper": "ADMINISTRATOR",
+        "role_display": "Administrator",
+        "a_or_an": "an",
+    },
+    UserRole.SPONSOR.value: {
+        "role": "Sponsor",
+        "role_label": "SPONSOR",
+        "role_upper": "SPONSOR",
+        "role_display": "Sponsor",
+        "a_or_an": "a",
+    },
+}
+
 
 @router.get("/participants", response_model=ParticipantListResponse)
 async def list_participants(
@@ -106,29 +163,26 @@ async def list_participants(
     )
 
     # Build responses with VPN info
-    items = []
-    for p in participants:
-        item = await build_participant_response(p, db)
-        items.append(item)
+    items = await build_participant_responses(participants, db)
 
     if group_by:
-        return ParticipantListResponse(
+        return json_response(ParticipantListResponse(
             items=items,
             total=total,
             page=1,
             page_size=total or 1,
             total_pages=1
-        )
+        ))
 
     _, total_pages = calculate_pagination(total, page, page_size)
 
-    return ParticipantListResponse(
+    return json_response(ParticipantListResponse(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages
-    )
+    ))
 
 
 @router.get("/participants/stats", response_model=ParticipantStats)
@@ -141,8 +195,11 @@ async def get_participant_stats(
 
     Both admins and sponsors see stats for all participants.
     """
-    stats = await service.get_statistics()
-    return ParticipantStats(**stats)
+    stats = await stats_cache.cached(
+        PARTICIPANT_STATS_CACHE_KEY, STATS_CACHE_TTL_SECONDS, service.get_statistics
+    )
+    # Counts come straight from our own aggregate queries, so skip validation
+    return json_response(ParticipantStats.model_construct(**stats))
 
 
 @router.get("/dashboard", response_model=DashboardResponse)
@@ -156,17 +213,22 @@ async def get_dashboard(
 
     Both admins and sponsors see all stats.
     """
-    participant_stats = await participant_service.get_statistics()
-    vpn_stats = await vpn_service.get_statistics()
+    participant_stats = await stats_cache.cached(
+        PARTICIPANT_STATS_CACHE_KEY, STATS_CACHE_TTL_SECONDS, participant_service.get_statistics
+    )
+    vpn_stats = await stats_cache.cached(
+        VPN_STATS_CACHE_KEY, STATS_CACHE_TTL_SECONDS, vpn_service.get_statistics
+    )
 
-    return DashboardResponse(
-        stats=DashboardStats(
-            participants=ParticipantStats(**participant_stats),
-            vpn=VPNStats(**vpn_stats)
+    # Counts come straight from our own aggregate queries, so skip validation
+    return json_response(DashboardResponse.model_construct(
+        stats=DashboardStats.model_construct(
+            participants=ParticipantStats.model_construct(**participant_stats),
+            vpn=VPNStats.model_construct(**vpn_stats)
         ),
         recent_participants=[],
         recent_vpn_assignments=[]
-    )
+    ))
 
 
 @router.get("/participants/{participant_id}", response_model=ParticipantResponse)
@@ -177,12 +239,7 @@ async def get_participant(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific participant by ID."""
-    participant = await service.get_participant(participant_id)
-    if not participant:
-        raise not_found("Participant")
-
-    # Check permission to view this participant
-    permissions.can_view_participant(current_user, participant)
+    participant = await service.get_participant_for(current_user, participant_id, _can_view_participant)
 
     return await build_participant_response(participant, db)
 
@@ -201,9 +258,9 @@ async def create_participant(
     - Admins can create participants with any role and sponsor
     - Sponsors can only create participants with themselves as sponsor
     """
-    # Check if email already exists
-    existing = await service.get_participant_by_email(data.email)
-    if existing:
+    # Check if email already exists; the full row is only loaded for the error message
+    if await service.email_exists(data.email):
+        existing = await service.get_participant_by_email(data.email)
         sponsor_info = "no sponsor"
         if existing.sponsor_id:
             sponsor = await service.get_participant(existing.sponsor_id)
@@ -266,13 +323,14 @@ async def create_participant(
         role_id=target_role_id,
         is_admin=data.is_admin
     )
+    stats_cache.invalidate(PARTICIPANT_STATS_CACHE_KEY)
 
-    # Re-fetch with relationships
-    participant = await service.get_participant(participant.id)
+    # Load the relationships the response builder reads
+    await service.load_relationships(participant)
 
     # Audit log
     ip_address, user_agent = extract_client_metadata(request)
-    audit_service = AuditService(db)
+    audit_service = AuditService(db, deferred=True)
     await audit_service.log_user_create(
         user_id=current_user.id,
         created_user_id=participant.id,
@@ -285,30 +343,17 @@ async def create_participant(
         user_agent=user_agent
     )
 
-    # Reload participant with relationships for response
-    participant = await service.get_participant(participant.id)
-
     # Trigger workflow for admin/sponsor creation (send welcome email with portal password)
     # Both admins and sponsors need immediate portal access to manage participants.
     # IMPORTANT: Use the password already generated by create_participant() rather than
     # generating a second one. A separate temp_password override via ORM attribute
     # assignment does not persist reliably due to expire_on_commit=False causing
     # identity map staleness after create_participant()'s multiple commits.
-    if participant.role in [UserRole.ADMIN.value, UserRole.SPONSOR.value]:
-        from app.services.workflow_service import WorkflowService
-        from app.models.email_workflow import WorkflowTriggerEvent
-        from app.config import get_settings
-
+    trigger_event = _ROLE_TO_TRIGGER.get(participant.role)
+    if trigger_event is not None:
         settings = get_settings()
         workflow_service = WorkflowService(db)
 
-        # Determine trigger event based on role
-        trigger_event = (
-            WorkflowTriggerEvent.ADMIN_CREATED
-            if participant.role == UserRole.ADMIN.value
-            else WorkflowTriggerEvent.SPONSOR_CREATED
-        )
-
         # Use the password and hash already set by create_participant().
         # This guarantees the emailed password matches the stored hash.
         portal_password = participant.pandas_password
@@ -320,28 +365,10 @@ async def create_participant(
                 participant.role, participant.id, participant.email
             )
         else:
-            # Role-specific template variables
-            role_template_vars = {
-                UserRole.ADMIN.value: {
-                    "role": "Admin",
-                    "role_label": "ADMIN",
-                    "role_upper": "ADMINISTRATOR",
-                    "role_display": "Administrator",
-                    "a_or_an": "an",
-                },
-                UserRole.SPONSOR.value: {
-                    "role": "Sponsor",
-                    "role_label": "SPONSOR",
-                    "role_upper": "SPONSOR",
-                    "role_display": "Sponsor",
-                    "a_or_an": "a",
-                },
-            }
-
             email_custom_vars = {
                 "first_name": participant.first_name,
                 "last_name": participant.last_name,
-                **role_template_vars[participant.role],
+                **_ROLE_TEMPLATE_VARS[participant.role],
                 "email": participant.email,
                 "password": portal_password,
                 "password_phonetic": portal_phonetic or "",
@@ -367,33 +394,29 @@ async def create_participant(
             )
 
     # Check if there's an active event and queue invitation email
-    from app.services.event_service import EventService
-    event_service = EventService(db)
-    active_event = await event_service.get_active_event()
+    active_event = await get_active_event_cached(request, db)
 
     # Determine if invitation should be sent based on event settings
     should_send_invitation = False
     if active_event and participant.role in ['invitee', 'sponsor']:
-        # Check EventParticipation status for current event
-        from app.models.event import ParticipationStatus
-        participation = await participant.get_current_event_participation(db)
+        # TEST MODE ALWAYS RESTRICTS: Only send to sponsors if test mode is enabled
+        if active_event.test_mode:
+            should_send_invitation = (participant.role == 'sponsor')
+        else:
+            # Normal mode: Send if registration is open
+            should_send_invitation = active_event.registration_open
 
+    if should_send_invitation:
+        # Only look up participation once the event settings allow sending.
         # Send only if not yet confirmed/declined (invited, no_response, or no record yet)
-        if not participation or participation.status in [
+        participation = await participant.get_participation_for_event(active_event.id, db)
+        should_send_invitation = not participation or participation.status in [
             ParticipationStatus.INVITED.value,
             ParticipationStatus.NO_RESPONSE.value
-        ]:
-            # TEST MODE ALWAYS RESTRICTS: Only send to sponsors if test mode is enabled
-            if active_event.test_mode:
-                should_send_invitation = (participant.role == 'sponsor')
-            else:
-                # Normal mode: Send if registration is open
-                should_send_invitation = active_event.registration_open
+        ]
 
     if should_send_invitation:
         # Queue invitation email using helper function
-        from app.services.email_service import queue_invitation_email_for_user
-
         await queue_invitation_email_for_user(
             user=participant,
             event=active_event,
@@ -425,13 +448,7 @@ async def update_participant(
 
     NOTE: Username (pandas_username) is auto-generated and cannot be manually edited.
     """
-    # Get the participant first to check permissions
-    participant = await service.get_participant(participant_id)
-    if not participant:
-        raise not_found("Participant")
-
-    # Check permission to edit this participant
-    permissions.can_edit_participant(current_user, participant)
+    participant = await service.get_participant_for(current_user, participant_id, _can_edit_participant)
 
     # Sponsors cannot change role or sponsor_id
     if not current_user.is_admin_role:
@@ -441,9 +458,9 @@ async def update_participant(
             raise forbidden("Only administrators can change sponsor assignments")
 
     # Check if email is being changed to one that already exists
-    if data.email:
+    if data.email and await service.email_exists(data.email, exclude_id=participant_id):
         existing = await service.get_participant_by_email(data.email)
-        if existing and existing.id != participant_id:
+        if existing:
             sponsor_info = "no sponsor"
             if existing.sponsor_id:
                 sponsor = await service.get_participant(existing.sponsor_id)
@@ -477,7 +494,6 @@ async def update_participant(
     # Block elevation to admin if user has event participation history
     new_role = update_data.get('role')
     if new_role == UserRole.ADMIN.value and participant.role != UserRole.ADMIN.value:
-        from app.models.event import EventParticipation
         ep_count_result = await db.execute(
             select(func.count(EventParticipation.id))
             .where(EventParticipation.user_id == participant_id)
@@ -493,10 +509,11 @@ async def update_participant(
         participant_id,
         **update_data
     )
+    stats_cache.invalidate(PARTICIPANT_STATS_CACHE_KEY)
 
     # Audit log
     ip_address, user_agent = extract_client_metadata(request)
-    audit_service = AuditService(db)
+    audit_service = AuditService(db, deferred=True)
     await audit_service.log_user_update(
         user_id=current_user.id,
         updated_user_id=participant_id,
@@ -522,13 +539,7 @@ async def delete_participant(
     - Admins can delete any participant
     - Sponsors can only delete participants they sponsor
     """
-    # Get the participant first to check permissions
-    participant = await service.get_participant(participant_id)
-    if not participant:
-        raise not_found("Participant")
-
-    # Check permission to delete this participant
-    permissions.can_delete_participant(current_user, participant)
+    participant = await service.get_participant_for(current_user, participant_id, _can_delete_participant)
 
     # Store details before deletion
     deleted_user_email = participant.email
@@ -537,10 +548,11 @@ async def delete_participant(
     success = await service.delete_participant(participant_id)
     if not success:
         raise not_found("Participant")
+    stats_cache.invalidate(PARTICIPANT_STATS_CACHE_KEY)
 
     # Audit log
     ip_address, user_agent = extract_client_metadata(request)
-    audit_service = AuditService(db)
+    audit_service = AuditService(db, deferred=True)
     await audit_service.log_user_delete(
         user_id=current_user.id,
         deleted_user_id=participant_id,
@@ -568,10 +580,11 @@ async def bulk_action(
 
     Requires admin role.
     """
-    audit_service = AuditService(db)
+    audit_service = AuditService(db, deferred=True)
 
     if data.action == "activate":
         count, failed = await service.bulk_activate(data.participant_ids)
+        stats_cache.invalidate(PARTICIPANT_STATS_CACHE_KEY)
 
         # Audit log
         ip_address, user_agent = extract_client_metadata(request)
@@ -591,6 +604,7 @@ async def bulk_action(
         )
     elif data.action == "deactivate":
         count, failed = await service.bulk_deactivate(data.participant_ids)
+        stats_cache.invalidate(PARTICIPANT_STATS_CACHE_KEY)
 
         # Audit log
         ip_address, user_agent = extract_client_metadata(request)
@@ -629,19 +643,7 @@ async def reset_participant_password(
     - Admins can reset any participant's password
     - Sponsors can only reset passwords for participants they sponsor
     """
-    import secrets
-    from datetime import timedelta
-    from app.services.workflow_service import WorkflowService
-    from app.models.email_workflow import WorkflowTriggerEvent
-    from app.config import get_settings
-
-    # Get the participant first to check permissions
-    participant = await service.get_participant(participant_id)
-    if not participant:
-        raise not_found("Participant")
-
-    # Check permission to edit this participant
-    permissions.can_edit_participant(current_user, participant)
+    participant = await service.get_participant_for(current_user, participant_id, _can_edit_participant)
 
     # Generate reset token (same flow as self-service)
     reset_token = secrets.token_urlsafe(32)
@@ -671,7 +673,7 @@ async def reset_participant_password(
 
     # Audit log
     ip_address, user_agent = extract_client_metadata(request)
-    audit_service = AuditService(db)
+    audit_service = AuditService(db, deferred=True)
     await audit_service.log_password_reset(
         user_id=current_user.id,
         target_user_id=participant_id,
@@ -701,39 +703,27 @@ async def resend_participant_invitation(
     - Generates a new confirmation code and bypasses 24-hour duplicate protection
     - Only sends to participants with role 'invitee' or 'sponsor' who haven't confirmed yet
     """
-    # Get the participant first to check permissions
-    participant = await service.get_participant(participant_id)
-    if not participant:
-        raise not_found("Participant")
-
-    # Check permission to edit this participant
-    permissions.can_edit_participant(current_user, participant)
+    participant = await service.get_participant_for(current_user, participant_id, _can_edit_participant)
 
     # Validate participant is eligible for invitation resend
     if participant.role not in ['invitee', 'sponsor']:
         raise bad_request(f"Cannot resend invitation to {participant.role} role. Only invitees and sponsors can receive invitations.")
 
+    # Active event is needed for both the participation check and the email
+    event = await get_active_event_cached(request, db)
+
     # Check EventParticipation status for current event
-    from app.models.event import ParticipationStatus
-    participation = await participant.get_current_event_participation(db)
+    participation = await participant.get_participation_for_event(event.id, db) if event else None
     if participation and participation.status == ParticipationStatus.CONFIRMED.value:
         raise bad_request("Participant has already confirmed for current event. Cannot resend invitation to confirmed users.")
 
     if not participant.is_active:
         raise bad_request("Cannot resend invitation to inactive participant.")
 
-    # Get active event for email context
-    from app.models.event import Event
-    event_result = await db.execute(
-        select(Event).where(Event.is_active == True)
-    )
-    event = event_result.scalar_one_or_none()
-
     if not event:
         raise bad_request("No active event found. Cannot resend invitation without an active event.")
 
     # Queue invitation email with force=True to bypass 24-hour duplicate check
-    from app.services.email_service import queue_invitation_email_for_user
     try:
         queue_entry = await queue_invitation_email_for_user(
             user=participant,
@@ -753,7 +743,7 @@ async def resend_participant_invitation(
 
     # Audit log
     ip_address, user_agent = extract_client_metadata(request)
-    audit_service = AuditService(db)
+    audit_service = AuditService(db, deferred=True)
     await audit_service.log(
         action="RESEND_INVITATION",
         user_id=current_user.id,
@@ -819,8 +809,7 @@ async def reset_participant_workflow(
     )
 
     # Audit log
-    from app.api.utils.request import extract_client_metadata
-    audit_service = AuditService(db)
+    audit_service = AuditService(db, deferred=True)
     ip_address, user_agent = extract_client_metadata(request)
 
     await audit_service.log(
@@ -883,8 +872,7 @@ async def bulk_reset_participant_workflows(
     )
 
     # Audit log
-    from app.api.utils.request import extract_client_metadata
-    audit_service = AuditService(db)
+    audit_service = AuditService(db, deferred=True)
     ip_address, user_agent = extract_client_metadata(request)
 
     await audit_service.log(
@@ -928,11 +916,7 @@ async def list_sponsors(
     Requires admin role.
     """
     sponsors = await service.list_sponsors()
-    items = []
-    for s in sponsors:
-        item = await build_participant_response(s, db)
-        items.append(item)
-    return items
+    return json_response(await build_participant_responses(sponsors, db))
 
 
 @router.put("/participants/{participant_id}/role")
@@ -960,7 +944,6 @@ async def update_participant_role(
 
     # Block elevation to admin if user has event participation history
     if data.role.value == UserRole.ADMIN.value and old_role != UserRole.ADMIN.value:
-        from app.models.event import EventParticipation
         ep_count_result = await db.execute(
             select(func.count(EventParticipation.id))
             .where(EventParticipation.user_id == participant_id)
@@ -975,10 +958,11 @@ async def update_participant_role(
     participant = await service.update_role(participant_id, data.role.value)
     if not participant:
         raise not_found("Participant")
+    stats_cache.invalidate(PARTICIPANT_STATS_CACHE_KEY)
 
     # Audit log
     ip_address, user_agent = extract_client_metadata(request)
-    audit_service = AuditService(db)
+    audit_service = AuditService(db, deferred=True)
     await audit_service.log_role_change(
         user_id=current_user.id,
         target_user_id=participant_id,
@@ -1040,19 +1024,54 @@ async def get_my_sponsored_participants(
         page_size=page_size
     )
 
-    items = []
-    for p in participants:
-        item = await build_participant_response(p, db)
-        items.append(item)
+    items = await build_participant_responses(participants, db)
 
-    return MySponsoredParticipantsResponse(
+    return json_response(MySponsoredParticipantsResponse.model_construct(
         items=items,
         total=total
-    )
+    ))
 
 
 # ============== Audit Log Viewing ==============
 
+# Audit log sort order; id breaks created_at ties so keyset cursors are unique
+_AUDIT_LOG_SORT = (AuditLog.created_at, AuditLog.id)
+
+
+@lru_cache(maxsize=32)
+def _audit_log_statement(
+    has_action: bool,
+    has_user: bool,
+    has_resource: bool,
+    has_start: bool,
+    has_end: bool,
+) -> Select:
+    """
+    Build the filtered and sorted audit log statement for a set of active filters.
+
+    Filter values are bind parameters, so each of the 32 filter combinations
+    is built once and reused for every request.
+    """
+    filters = []
+    if has_action:
+        filters.append(AuditLog.action == bindparam("action"))
+    if has_user:
+        filters.append(AuditLog.user_id == bindparam("user_id"))
+    if has_resource:
+        filters.append(AuditLog.resource_type == bindparam("resource_type"))
+    if has_start:
+        filters.append(AuditLog.created_at >= bindparam("start_date"))
+    if has_end:
+        filters.append(AuditLog.created_at <= bindparam("end_date"))
+
+    return (
+        select(AuditLog)
+        .options(raiseload("*"))
+        .where(*filters)
+        .order_by(*(column.desc() for column in _AUDIT_LOG_SORT))
+    )
+
+
 @router.get("/audit-logs", response_model=AuditLogListResponse)
 async def list_audit_logs(
     page: int = Query(1, ge=1, description="Page number"),
@@ -1062,67 +1081,61 @@ async def list_audit_logs(
     resource_type: Optional[str] = Query(None, description="Filter by resource type"),
     start_date: Optional[datetime] = Query(None, description="Start date filter"),
     end_date: Optional[datetime] = Query(None, description="End date filter"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; replaces page"),
     current_user: User = Depends(require_permission("admin.view_audit_log")),
     db: AsyncSession = Depends(get_db)
 ):
     """
     List audit logs with filtering and pagination.
 
+    Pages by page number, or with cursor by seeking past the previous page's
+    last row, which stays fast however deep the page is. Cursor pages take
+    total from the cached count of the same filters, recounting only once it
+    has expired; page and total_pages are echoed but do not apply to them.
+
     Requires admin role.
     """
-    # Build base query
-    query = select(AuditLog).order_by(AuditLog.created_at.desc())
-    count_query = select(func.count(AuditLog.id))
-
-    # Apply filters
-    if action:
-        query = query.where(AuditLog.action == action)
-        count_query = count_query.where(AuditLog.action == action)
-
-    if user_id:
-        query = query.where(AuditLog.user_id == user_id)
-        count_query = count_query.where(AuditLog.user_id == user_id)
-
-    if resource_type:
-        query = query.where(AuditLog.resource_type == resource_type)
-        count_query = count_query.where(AuditLog.resource_type == resource_type)
-
-    if start_date:
-        query = query.where(AuditLog.created_at >= start_date)
-        count_query = count_query.where(AuditLog.created_at >= start_date)
-
-    if end_date:
-        query = query.where(AuditLog.created_at <= end_date)
-        count_query = count_query.where(AuditLog.created_at <= end_date)
-
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
-
-    # Apply pagination
-    offset, _ = calculate_pagination(total, page, page_size)
-    query = query.offset(offset).limit(page_size)
-
-    # Execute query
-    result = await db.execute(query)
-    audit_logs = result.scalars().all()
+    params = {
+        "action": action,
+        "user_id": user_id,
+        "resource_type": resource_type,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+    list_stmt = _audit_log_statement(
+        bool(action), bool(user_id), bool(resource_type), bool(start_date), bool(end_date)
+    )
+    listing = await fetch_sorted_page(
+        db, list_stmt, _AUDIT_LOG_SORT, page, page_size, cursor, descending=True,
+        count_key=f"audit_logs:{action}:{user_id}:{resource_type}:{start_date}:{end_date}",
+        estimate=True, params=params,
+    )
+    audit_logs = listing.items
+
+    # Prefer snapshot fields; older logs without one fall back to the live
+    # user, looked up for the whole page in one query
+    lookup_ids = {log.user_id for log in audit_logs if not log.user_email and log.user_id}
+    users = {}
+    if lookup_ids:
+        user_rows = await db.execute(
+            select(User.id, User.email, User.first_name, User.last_name)
+            .where(User.id.in_(lookup_ids))
+        )
+        users = {row.id: row for row in user_rows}
 
     # Build responses with user info
     items = []
     for log in audit_logs:
-        # Prefer snapshot fields; fall back to live user lookup for older logs
         user_email = log.user_email
         user_name = log.user_name
         if not user_email and log.user_id:
-            user_result = await db.execute(
-                select(User).where(User.id == log.user_id)
-            )
-            user = user_result.scalar_one_or_none()
+            user = users.get(log.user_id)
             if user:
                 user_email = user.email
                 user_name = f"{user.first_name} {user.last_name}"
 
-        item = AuditLogResponse(
+        # Built from our own rows; skip per-field validation
+        item = AuditLogResponse.model_construct(
             id=log.id,
             user_id=log.user_id,
             action=log.action,
@@ -1137,15 +1150,17 @@ async def list_audit_logs(
         )
         items.append(item)
 
-    _, total_pages = calculate_pagination(total, page, page_size)
+    _, total_pages = calculate_pagination(listing.total, page, page_size)
 
-    return AuditLogListResponse(
+    return json_response(AuditLogListResponse(
         items=items,
-        total=total,
+        total=listing.total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
-    )
+        total_pages=total_pages,
+        next_cursor=listing.next_cursor,
+        total_is_estimate=listing.total_is_estimate
+    ))
 
 
 @router.get("/audit-logs/stats", response_model=AuditLogStats)
@@ -1156,90 +1171,41 @@ async def get_audit_log_stats(
     """
     Get audit log statistics.
 
+    Served from the summary row refreshed every minute by the scheduler;
+    computed live when that row is more than five minutes old.
+
     Requires admin role.
     """
-    # Total events
-    total_result = await db.execute(select(func.count(AuditLog.id)))
-    total_events = total_result.scalar() or 0
+    return AuditLogStats(**await AuditService(db).get_stats())
 
-    # Count by action type
-    login_result = await db.execute(
-        select(func.count(AuditLog.id)).where(AuditLog.action == "LOGIN_SUCCESS")
-    )
-    login_count = login_result.scalar() or 0
-
-    logout_result = await db.execute(
-        select(func.count(AuditLog.id)).where(AuditLog.action == "LOGOUT")
-    )
-    logout_count = logout_result.scalar() or 0
-
-    user_create_result = await db.execute(
-        select(func.count(AuditLog.id)).where(AuditLog.action == "USER_CREATE")
-    )
-    user_create_count = user_create_result.scalar() or 0
-
-    user_update_result = await db.execute(
-        select(func.count(AuditLog.id)).where(AuditLog.action == "USER_UPDATE")
-    )
-    user_update_count = user_update_result.scalar() or 0
-
-    user_delete_result = await db.execute(
-        select(func.count(AuditLog.id)).where(AuditLog.action == "USER_DELETE")
-    )
-    user_delete_count = user_delete_result.scalar() or 0
-
-    role_change_result = await db.execute(
-        select(func.count(AuditLog.id)).where(AuditLog.action == "ROLE_CHANGE")
-    )
-    role_change_count = role_change_result.scalar() or 0
-
-    password_reset_result = await db.execute(
-        select(func.count(AuditLog.id)).where(AuditLog.action == "PASSWORD_RESET")
-    )
-    password_reset_count = password_reset_result.scalar() or 0
-
-    # VPN request statistics
-    vpn_success_result = await db.execute(
-        select(func.count(AuditLog.id)).where(AuditLog.action == "VPN_REQUEST_SUCCESS")
-    )
-    vpn_request_success_count = vpn_success_result.scalar() or 0
 
-    vpn_failed_result = await db.execute(
-        select(func.count(AuditLog.id)).where(AuditLog.action == "VPN_REQUEST_FAILED")
-    )
-    vpn_request_failed_count = vpn_failed_result.scalar() or 0
-
-    vpn_rate_limited_result = await db.execute(
-        select(func.count(AuditLog.id)).where(AuditLog.action == "VPN_REQUEST_RATE_LIMITED")
-    )
-    vpn_request_rate_limited_count = vpn_rate_limited_result.scalar() or 0
+# ============== Email Queue Management ==============
 
-    # Recent 24h
-    twenty_four_hours_ago = datetime.now(timezone.utc) - timedelta(hours=24)
-    recent_result = await db.execute(
-        select(func.count(AuditLog.id)).where(AuditLog.created_at >= twenty_four_hours_ago)
-    )
-    recent_24h = recent_result.scalar() or 0
-
-    return AuditLogStats(
-        total_events=total_events,
-        login_count=login_count,
-        logout_count=logout_count,
-        user_create_count=user_create_count,
-        user_update_count=user_update_count,
-        user_delete_count=user_delete_count,
-        role_change_count=role_change_count,
-        password_reset_count=password_reset_count,
-        vpn_request_success_count=vpn_request_success_count,
-        vpn_request_failed_count=vpn_request_failed_count,
-        vpn_request_rate_limited_count=vpn_request_rate_limited_count,
-        recent_24h=recent_24h
-    )
+# Email queue sort order (send order); id breaks ties so keyset cursors are unique
+_EMAIL_QUEUE_SORT = (EmailQueue.priority, EmailQueue.created_at, EmailQueue.id)
+
+# Columns returned per email queue item; rows are returned as plain dicts
+_EMAIL_QUEUE_LIST_COLUMNS = (
+    EmailQueue.id,
+    EmailQueue.user_id,
+    EmailQueue.template_name,
+    EmailQueue.recipient_email,
+    EmailQueue.recipient_name,
+    EmailQueue.priority,
+    EmailQueue.status,
+    EmailQueue.attempts,
+    EmailQueue.max_attempts,
+    EmailQueue.created_at,
+    EmailQueue.scheduled_for,
+    EmailQueue.sent_at,
+    EmailQueue.processed_at,
+    EmailQueue.batch_id,
+    EmailQueue.processed_by,
+    EmailQueue.error_message,
+)
 
 
-# ============== Email Queue Management ==============
-
-@router.get("/email-queue")
+@router.get("/email-queue", response_class=ORJSONResponse)
 async def list_email_queue(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
@@ -1247,32 +1213,27 @@ async def list_email_queue(
     exclude_status: Optional[str] = Query(None, description="Exclude specific status"),
     since: Optional[str] = Query(None, description="Filter by created/updated since (ISO datetime)"),
     template_name: Optional[str] = Query(None, description="Filter by template"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; replaces page"),
     current_user: User = Depends(require_permission("email.manage_queue")),
     db: AsyncSession = Depends(get_db)
 ):
     """
     List email queue items with filtering and pagination.
 
+    Pages by page number, or with cursor by seeking past the previous page's
+    last row.
+
     Requires admin role.
     """
-    from datetime import datetime
-    from sqlalchemy import or_
-
     # Build query
-    query = select(EmailQueue).order_by(
-        EmailQueue.priority.asc(),
-        EmailQueue.created_at.asc()
-    )
-    count_query = select(func.count(EmailQueue.id))
+    query = select(*_EMAIL_QUEUE_LIST_COLUMNS).order_by(*_EMAIL_QUEUE_SORT)
 
     # Apply filters
     if status:
         query = query.where(EmailQueue.status == status)
-        count_query = count_query.where(EmailQueue.status == status)
 
     if exclude_status:
         query = query.where(EmailQueue.status != exclude_status)
-        count_query = count_query.where(EmailQueue.status != exclude_status)
 
     if since:
         try:
@@ -1286,55 +1247,29 @@ async def list_email_queue(
                 EmailQueue.processed_at >= since_dt
             )
             query = query.where(since_filter)
-            count_query = count_query.where(since_filter)
         except ValueError:
             pass  # Ignore invalid datetime
 
     if template_name:
         query = query.where(EmailQueue.template_name == template_name)
-        count_query = count_query.where(EmailQueue.template_name == template_name)
-
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Apply pagination
-    offset, total_pages = calculate_pagination(total, page, page_size)
-    query = query.offset(offset).limit(page_size)
-
-    # Execute query
-    result = await db.execute(query)
-    queue_items = result.scalars().all()
 
-    # Build response
-    items = []
-    for item in queue_items:
-        items.append({
-            "id": item.id,
-            "user_id": item.user_id,
-            "template_name": item.template_name,
-            "recipient_email": item.recipient_email,
-            "recipient_name": item.recipient_name,
-            "priority": item.priority,
-            "status": item.status,
-            "attempts": item.attempts,
-            "max_attempts": item.max_attempts,
-            "created_at": item.created_at,
-            "scheduled_for": item.scheduled_for,
-            "sent_at": item.sent_at,
-            "processed_at": item.processed_at,
-            "batch_id": item.batch_id,
-            "processed_by": item.processed_by,
-            "error_message": item.error_message
-        })
+    listing = await fetch_sorted_page(
+        db, query, _EMAIL_QUEUE_SORT, page, page_size, cursor,
+        count_key=f"email_queue:{status}:{exclude_status}:{since}:{template_name}",
+        estimate=True,
+    )
+    _, total_pages = calculate_pagination(listing.total, page, page_size)
 
-    return {
-        "items": items,
-        "total": total,
+    # Plain dicts of JSON-native values; encode with orjson directly
+    return ORJSONResponse({
+        "items": listing.items,
+        "total": listing.total,
         "page": page,
         "page_size": page_size,
-        "total_pages": total_pages
-    }
+        "total_pages": total_pages,
+        "next_cursor": listing.next_cursor,
+        "total_is_estimate": listing.total_is_estimate
+    })
 
 
 @router.get("/email-queue/stats")
@@ -1432,57 +1367,41 @@ async def bulk_cancel_queued_emails(
     return {"success": True, "message": message, "affected_count": affected_count, "failed_ids": failed_ids}
 
 
-@router.get("/email-batch-logs")
+@router.get("/email-batch-logs", response_class=ORJSONResponse)
 async def list_email_batch_logs(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; replaces page"),
     current_user: User = Depends(require_permission("email.manage_queue")),
     db: AsyncSession = Depends(get_db)
 ):
     """
     List email batch processing logs.
 
+    Pages by page number, or with cursor by seeking past the previous page's
+    last row.
+
     Requires admin role.
     """
-    # Build query
-    query = select(EmailBatchLog).order_by(EmailBatchLog.started_at.desc())
+    # Newest first; id breaks started_at ties so keyset cursors are unique
+    sort = (EmailBatchLog.started_at, EmailBatchLog.id)
+    query = select(*EmailBatchLog.__table__.c).order_by(*(column.desc() for column in sort))
 
-    # Get total count
-    count_result = await db.execute(select(func.count(EmailBatchLog.id)))
-    total = count_result.scalar() or 0
-
-    # Apply pagination
-    offset, total_pages = calculate_pagination(total, page, page_size)
-    query = query.offset(offset).limit(page_size)
-
-    # Execute query
-    result = await db.execute(query)
-    batch_logs = result.scalars().all()
-
-    # Build response
-    items = []
-    for log in batch_logs:
-        items.append({
-            "id": log.id,
-            "batch_id": log.batch_id,
-            "batch_size": log.batch_size,
-            "total_processed": log.total_processed,
-            "total_sent": log.total_sent,
-            "total_failed": log.total_failed,
-            "started_at": log.started_at,
-            "completed_at": log.completed_at,
-            "duration_seconds": log.duration_seconds,
-            "processed_by": log.processed_by,
-            "error_message": log.error_message
-        })
+    listing = await fetch_sorted_page(
+        db, query, sort, page, page_size, cursor, descending=True, estimate=True
+    )
+    _, total_pages = calculate_pagination(listing.total, page, page_size)
 
-    return {
-        "items": items,
-        "total": total,
+    # Plain dicts of JSON-native values; encode with orjson directly
+    return ORJSONResponse({
+        "items": listing.items,
+        "total": listing.total,
         "page": page,
         "page_size": page_size,
-        "total_pages": total_pages
-    }
+        "total_pages": total_pages,
+        "next_cursor": listing.next_cursor,
+        "total_is_estimate": listing.total_is_estimate
+    })
 
 
 # ============== Scheduler Management ==============
@@ -1496,8 +1415,6 @@ async def list_scheduler_jobs(
 
     Requires admin role.
     """
-    from app.tasks.scheduler import list_jobs
-
     jobs = list_jobs()
 
     return {
@@ -1519,14 +1436,15 @@ async def get_scheduler_status(
     The background worker updates its status in the database every 60 seconds.
     This endpoint reads that status.
     """
-    from app.models.scheduler_status import SchedulerStatus
-    from datetime import datetime, timezone, timedelta
-
-    # Get latest status from database
+    # Get latest status from database (only the columns reported)
     result = await db.execute(
-        select(SchedulerStatus).where(SchedulerStatus.service_name == "web-service")
+        select(
+            SchedulerStatus.is_running,
+            SchedulerStatus.jobs,
+            SchedulerStatus.last_heartbeat,
+        ).where(SchedulerStatus.service_name == "web-service")
     )
-    status = result.scalar_one_or_none()
+    status = result.one_or_none()
 
     if not status:
         # Scheduler hasn't started yet or hasn't written status
@@ -1560,7 +1478,6 @@ async def get_instance_sync_status(
     current_user: User = Depends(require_permission("scheduler.view")),
 ):
     """Get instance sync scheduler status and statistics."""
-    from app.services.instance_sync_scheduler import get_scheduler as get_instance_scheduler
     instance_scheduler = get_instance_scheduler()
 
     return {
@@ -1605,11 +1522,6 @@ async def trigger_reminders(
 
     Requires admin role.
     """
-    from app.models.event import Event, EventParticipation, ParticipationStatus
-    from app.tasks.invitation_reminders import queue_reminders
-    from sqlalchemy import and_
-    from datetime import datetime, timezone
-
     # Validate stage
     if stage is not None and stage not in (1, 2, 3):
         raise bad_request("Stage must be 1, 2, or 3")
@@ -1624,10 +1536,9 @@ async def trigger_reminders(
 
     now = datetime.now(timezone.utc)
     if event.start_date:
-        import datetime as dt_mod
         if isinstance(event.start_date, datetime):
             event_start_utc = event.start_date if event.start_date.tzinfo else event.start_date.replace(tzinfo=timezone.utc)
-        elif isinstance(event.start_date, dt_mod.date):
+        elif isinstance(event.start_date, date):
             event_start_utc = datetime.combine(event.start_date, datetime.min.time(), tzinfo=timezone.utc)
         else:
             event_start_utc = now
@@ -1733,8 +1644,6 @@ async def get_current_event(
     current_user: User = Depends(require_permission("events.view"))
 ):
     """Get current event configuration."""
-    from app.services.event_service import EventService
-
     event_service = EventService(db)
     event = await event_service.get_current_event()
 
@@ -1750,8 +1659,6 @@ async def toggle_event_active(
     current_user: User = Depends(require_permission("events.edit"))
 ):
     """Toggle event active status - ADMIN ONLY."""
-    from app.services.event_service import EventService
-
     if current_user.role != UserRole.ADMIN.value:
         raise forbidden("Only administrators can toggle event status")
 
@@ -1761,8 +1668,13 @@ async def toggle_event_active(
     if not event:
         raise not_found("No event configured")
 
-    event.is_active = not event.is_active
+    if event.is_active:
+        event.is_active = False
+    else:
+        # Activating keeps the single-active-event invariant in one UPDATE
+        await event_service.activate_event(event.id)
     await db.commit()
+    invalidate_active_event_cache()
 
     return {
         "success": True,
@@ -1807,8 +1719,6 @@ async def list_events(
     include_archived: bool = Query(False, description="Include archived events")
 ):
     """List all events."""
-    from app.services.event_service import EventService
-
     service = EventService(db)
     events = await service.list_events(include_archived=include_archived)
 
@@ -1825,9 +1735,6 @@ async def create_event(
     current_user: User = Depends(require_permission("events.create"))
 ):
     """Create a new event."""
-    from app.services.event_service import EventService
-    from datetime import datetime as dt
-
     if current_user.role != UserRole.ADMIN.value:
         raise forbidden("Only administrators can create events")
 
@@ -1839,7 +1746,6 @@ async def create_event(
         raise bad_request(f"A non-archived event for year {data.get('year')} already exists")
 
     # Auto-generate slug from name if not provided
-    from app.models.event import generate_slug
     slug = data.get("slug") or generate_slug(data["name"])
     existing_slug = await service.get_event_by_slug(slug)
     if existing_slug:
@@ -1849,9 +1755,9 @@ async def create_event(
     start_date = None
     end_date = None
     if data.get("start_date"):
-        start_date = dt.fromisoformat(data["start_date"].replace("Z", "+00:00")).date()
+        start_date = datetime.fromisoformat(data["start_date"].replace("Z", "+00:00")).date()
     if data.get("end_date"):
-        end_date = dt.fromisoformat(data["end_date"].replace("Z", "+00:00")).date()
+        end_date = datetime.fromisoformat(data["end_date"].replace("Z", "+00:00")).date()
 
     # Create event using service
     event = await service.create_event(
@@ -1898,8 +1804,6 @@ async def get_event(
     current_user: User = Depends(require_permission("events.view"))
 ):
     """Get event details."""
-    from app.services.event_service import EventService
-
     service = EventService(db)
     event = await service.get_event(event_id)
 
@@ -1909,18 +1813,77 @@ async def get_event(
     return {"event": _build_event_dict(event)}
 
 
+def _json_value(value):
+    """Convert a field value to a JSON-serializable form for change records."""
+    if value is None:
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _parse_event_date(date_str):
+    """Parse an ISO date/datetime string from the event form into a date."""
+    return datetime.fromisoformat(date_str.replace("Z", "+00:00")).date() if date_str else None
+
+
+def _flipped(change, old, new):
+    """True if a tracked change went from old to new (compared by identity)."""
+    return change is not None and change["old_value"] is old and change["new_value"] is new
+
+
+def _compute_event_triggers(changes):
+    """
+    Derive the invitation-workflow trigger flags from update_event's changes.
+
+    Uses old_value/new_value (actual types) instead of old/new (strings).
+
+    Returns:
+        Tuple of (became_active, entered_test_mode, exited_test_mode,
+        registration_opened)
+    """
+    test_mode = changes.get("test_mode")
+    return (
+        _flipped(changes.get("is_active"), False, True),
+        _flipped(test_mode, False, True),
+        _flipped(test_mode, True, False),
+        _flipped(changes.get("registration_open"), False, True),
+    )
+
+
+# Event fields update_event accepts, with the parser applied to submitted values
+# (is_active is handled separately since activating deactivates other events)
+_EVENT_UPDATE_FIELDS = (
+    ("name", None),
+    ("start_date", _parse_event_date),
+    ("end_date", _parse_event_date),
+    ("event_time", None),
+    ("event_location", None),
+    ("registration_open", None),
+    ("vpn_available", None),
+    ("test_mode", None),
+    ("terms_content", None),
+    ("terms_version", None),
+    ("max_participants", None),
+    ("confirmation_expires_days", None),
+    ("ssh_public_key", None),
+    ("ssh_private_key", None),
+    ("discord_channel_id", None),
+)
+
+
 @router.put("/events/{event_id}")
 async def update_event(
     event_id: int,
     data: dict,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_permission("events.edit"))
 ):
     """Update event details."""
-    from app.services.event_service import EventService
-    from datetime import datetime as dt
-
     if current_user.role != UserRole.ADMIN.value:
         raise forbidden("Only administrators can update events")
 
@@ -1934,17 +1897,6 @@ async def update_event(
     changes = {}
     update_data = {}
 
-    # Helper to make values JSON-serializable
-    def make_json_serializable(value):
-        """Convert Python objects to JSON-serializable format."""
-        if value is None:
-            return None
-        if isinstance(value, (datetime, date)):
-            return value.isoformat()
-        if isinstance(value, (str, int, float, bool)):
-            return value
-        return str(value)
-
     # Helper to track and stage field updates
     def track_field(field_name, new_value, parse_fn=None):
         old_value = getattr(event, field_name)
@@ -1961,46 +1913,15 @@ async def update_event(
                 changes[field_name] = {
                     "old": old_str,
                     "new": new_str,
-                    "old_value": make_json_serializable(old_value),
-                    "new_value": make_json_serializable(parsed_value)
+                    "old_value": _json_value(old_value),
+                    "new_value": _json_value(parsed_value)
                 }
             update_data[field_name] = parsed_value
 
-    # Date parser
-    def parse_date(date_str):
-        return dt.fromisoformat(date_str.replace("Z", "+00:00")).date() if date_str else None
-
     # Track all potential field updates
-    if "name" in data:
-        track_field("name", data["name"])
-    if "start_date" in data:
-        track_field("start_date", data["start_date"], parse_date)
-    if "end_date" in data:
-        track_field("end_date", data["end_date"], parse_date)
-    if "event_time" in data:
-        track_field("event_time", data["event_time"])
-    if "event_location" in data:
-        track_field("event_location", data["event_location"])
-    if "registration_open" in data:
-        track_field("registration_open", data["registration_open"])
-    if "vpn_available" in data:
-        track_field("vpn_available", data["vpn_available"])
-    if "test_mode" in data:
-        track_field("test_mode", data["test_mode"])
-    if "terms_content" in data:
-        track_field("terms_content", data["terms_content"])
-    if "terms_version" in data:
-        track_field("terms_version", data["terms_version"])
-    if "max_participants" in data:
-        track_field("max_participants", data["max_participants"])
-    if "confirmation_expires_days" in data:
-        track_field("confirmation_expires_days", data["confirmation_expires_days"])
-    if "ssh_public_key" in data:
-        track_field("ssh_public_key", data["ssh_public_key"])
-    if "ssh_private_key" in data:
-        track_field("ssh_private_key", data["ssh_private_key"])
-    if "discord_channel_id" in data:
-        track_field("discord_channel_id", data["discord_channel_id"])
+    for field_name, parse_fn in _EVENT_UPDATE_FIELDS:
+        if field_name in data:
+            track_field(field_name, data[field_name], parse_fn)
 
     # Handle is_active separately (requires deactivating other events)
     if "is_active" in data and data["is_active"] != event.is_active:
@@ -2010,23 +1931,26 @@ async def update_event(
         changes["is_active"] = {
             "old": str(old_is_active),
             "new": str(new_is_active),
-            "old_value": make_json_serializable(old_is_active),
-            "new_value": make_json_serializable(new_is_active)
+            "old_value": _json_value(old_is_active),
+            "new_value": _json_value(new_is_active)
         }
         if data["is_active"]:
-            await service.deactivate_other_events(except_event_id=event_id)
-        update_data["is_active"] = data["is_active"]
+            # One UPDATE activates this event and deactivates all others
+            await service.activate_event(event_id)
+        else:
+            update_data["is_active"] = False
+
+    # Nothing differs from the stored event (e.g. an unchanged form was saved)
+    if not changes:
+        return {"success": True, "message": "No changes"}
 
-    # Apply all updates using service
-    if update_data:
-        event = await service.update_event(event_id, **update_data)
+    # Apply all updates to the loaded event (commits the activation with them)
+    await service.apply_updates(event, **update_data)
 
     # Check what changed that could trigger invitation workflow
-    # Use old_value/new_value (actual types) instead of old/new (strings)
-    became_active = changes.get("is_active", {}).get("new_value") is True and changes.get("is_active", {}).get("old_value") is False
-    entered_test_mode = changes.get("test_mode", {}).get("new_value") is True and changes.get("test_mode", {}).get("old_value") is False
-    exited_test_mode = changes.get("test_mode", {}).get("old_value") is True and changes.get("test_mode", {}).get("new_value") is False
-    registration_opened = changes.get("registration_open", {}).get("new_value") is True and changes.get("registration_open", {}).get("old_value") is False
+    became_active, entered_test_mode, exited_test_mode, registration_opened = (
+        _compute_event_triggers(changes)
+    )
 
     logger.info(
         f"Event {event_id} update check: "
@@ -2054,24 +1978,25 @@ async def update_event(
             f"exited_test_mode={exited_test_mode}, registration_opened={registration_opened}, "
             f"test_mode={event.test_mode}]"
         )
-        from app.tasks.invitation_emails import schedule_invitation_emails
-        schedule_invitation_emails(event.id, event.name, test_mode=event.test_mode)
+        # Registered after the response is sent
+        background_tasks.add_task(
+            schedule_invitation_emails, event.id, event.name, test_mode=event.test_mode
+        )
         logger.info(
             f"Invitation email workflow scheduled for event {event.name} "
             f"[test_mode={event.test_mode}]"
         )
 
     # Audit log
-    if changes:
-        ip_address, user_agent = extract_client_metadata(request)
-        audit_service = AuditService(db)
-        await audit_service.log_event_update(
-            user_id=current_user.id,
-            event_id=event.id,
-            changes=changes,
-            ip_address=ip_address,
-            user_agent=user_agent
-        )
+    ip_address, user_agent = extract_client_metadata(request)
+    audit_service = AuditService(db)
+    await audit_service.log_event_update(
+        user_id=current_user.id,
+        event_id=event.id,
+        changes=changes,
+        ip_address=ip_address,
+        user_agent=user_agent
+    )
 
     # Activation sanity check: warn about unreset users
     response = {"success": True, "message": "Event updated successfully"}
@@ -2100,8 +2025,6 @@ async def activate_event(
     current_user: User = Depends(require_permission("events.edit"))
 ):
     """Set an event as the active event (deactivates all others)."""
-    from app.services.event_service import EventService
-
     if current_user.role != UserRole.ADMIN.value:
         raise forbidden("Only administrators can activate events")
 
@@ -2114,9 +2037,10 @@ async def activate_event(
     if event.is_archived:
         raise bad_request("Cannot activate an archived event")
 
-    # Deactivate all other events and activate this one
-    await service.deactivate_other_events(except_event_id=event_id)
-    event = await service.update_event(event_id, is_active=True)
+    # Activate this event and deactivate all others in one UPDATE
+    await service.activate_event(event_id)
+    await db.commit()
+    invalidate_active_event_cache()
 
     # Audit log
     ip_address, user_agent = extract_client_metadata(request)
@@ -2154,8 +2078,6 @@ async def archive_event(
     current_user: User = Depends(require_permission("events.edit"))
 ):
     """Archive an event."""
-    from app.services.event_service import EventService
-
     if current_user.role != UserRole.ADMIN.value:
         raise forbidden("Only administrators can archive events")
 
@@ -2187,12 +2109,43 @@ async def archive_event(
 # Email Workflow Management Endpoints
 # =============================================================================
 
+# list_workflows bodies are cached briefly, per worker process; a workflow
+# change bumps the generation in the key, which retires every cached page of
+# the worker that made it at once
+WORKFLOW_LIST_CACHE_TTL = 30
+_workflow_list_generation = 0
+
+
+def _invalidate_workflow_list() -> None:
+    """Retire this worker's cached list_workflows bodies after a workflow change."""
+    global _workflow_list_generation
+    _workflow_list_generation += 1
+
+
+# Workflow fields where an empty string clears the stored value
+_WORKFLOW_EMPTY_AS_NULL = frozenset({"from_email", "from_name"})
+
+# Workflow listing order, newest first; id breaks ties so keyset cursors are unique
+_WORKFLOW_SORT = (EmailWorkflow.created_at, EmailWorkflow.id)
+
+# WorkflowResponse fields, all read straight off EmailWorkflow columns
+_WORKFLOW_RESPONSE_FIELDS = tuple(WorkflowResponse.model_fields)
+
+
+def _workflow_response(workflow: EmailWorkflow) -> WorkflowResponse:
+    """Build a WorkflowResponse from a stored workflow without re-validating it."""
+    return WorkflowResponse.model_construct(
+        **{field: getattr(workflow, field) for field in _WORKFLOW_RESPONSE_FIELDS}
+    )
+
+
 @router.get("/email-workflows")
 async def list_workflows(
     enabled_only: bool = False,
     trigger_event: Optional[str] = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; replaces page"),
     current_user: User = Depends(require_permission("email.manage_workflows")),
     db: AsyncSession = Depends(get_db)
 ):
@@ -2204,8 +2157,18 @@ async def list_workflows(
     - trigger_event: Filter by trigger event
     - page: Page number
     - page_size: Items per page
+    - cursor: next_cursor from the previous page; seeks past its last row
+      instead of paging by number
+
+    Responses are cached per worker for WORKFLOW_LIST_CACHE_TTL seconds.
+    A workflow change made through this API retires the cache of the worker
+    that handled it at once; other workers show it within the TTL.
     """
-    from app.models.email_workflow import EmailWorkflow
+    filters_key = f"workflows:{_workflow_list_generation}:{enabled_only}:{trigger_event}"
+    cache_key = f"{filters_key}:{page}:{page_size}:{cursor}"
+    body = stats_cache.get(cache_key)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
 
     # Build query
     query = select(EmailWorkflow)
@@ -2216,32 +2179,183 @@ async def list_workflows(
     if trigger_event:
         query = query.where(EmailWorkflow.trigger_event == trigger_event)
 
-    query = query.order_by(EmailWorkflow.created_at.desc())
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+    query = query.order_by(*(column.desc() for column in _WORKFLOW_SORT))
 
-    # Apply pagination
-    offset, total_pages = calculate_pagination(total, page, page_size)
-    query = query.offset(offset).limit(page_size)
-
-    # Execute query
-    result = await db.execute(query)
-    workflows = result.scalars().all()
+    listing = await fetch_sorted_page(
+        db, query, _WORKFLOW_SORT, page, page_size, cursor, descending=True,
+        count_key=f"{filters_key}:total"
+    )
+    _, total_pages = calculate_pagination(listing.total, page, page_size)
 
     # Build response
-    from app.schemas.workflow import WorkflowResponse
-    items = [WorkflowResponse.model_validate(wf) for wf in workflows]
+    items = [_workflow_response(wf).model_dump() for wf in listing.items]
 
-    return {
+    body = orjson.dumps({
         "items": items,
-        "total": total,
+        "total": listing.total,
         "page": page,
         "page_size": page_size,
-        "total_pages": total_pages
+        "total_pages": total_pages,
+        "next_cursor": listing.next_cursor
+    })
+    stats_cache.put(cache_key, WORKFLOW_LIST_CACHE_TTL, body)
+    return Response(content=body, media_type="application/json")
+
+
+# Available trigger events and their template variables; static, so the
+# response body is serialized once at import
+_TRIGGER_EVENTS = [
+    # User Events
+    {
+        "event": WorkflowTriggerEvent.USER_CREATED,
+        "display_name": "User Created",
+        "description": "Triggered when a new participant user is created",
+        "available_variables": ["first_name", "last_name", "email", "login_url"]
+    },
+    {
+        "event": WorkflowTriggerEvent.ADMIN_CREATED,
+        "display_name": "Admin Created",
+        "description": "Triggered when a new admin account is created",
+        "available_variables": ["first_name", "last_name", "email", "password", "login_url", "role", "role_label", "role_upper", "role_display", "a_or_an"]
+    },
+    {
+        "event": WorkflowTriggerEvent.SPONSOR_CREATED,
+        "display_name": "Sponsor Created",
+        "description": "Triggered when a new sponsor account is created",
+        "available_variables": ["first_name", "last_name", "email", "password", "login_url", "role", "role_label", "role_upper", "role_display", "a_or_an"]
+    },
+    {
+        "event": WorkflowTriggerEvent.USER_CONFIRMED,
+        "display_name": "User Confirmed",
+        "description": "Triggered when a user confirms participation",
+        "available_variables": ["first_name", "last_name", "email", "login_url", "event_name"]
+    },
+    {
+        "event": WorkflowTriggerEvent.USER_ACTIVATED,
+        "display_name": "User Activated",
+        "description": "Triggered when a user account is activated",
+        "available_variables": ["first_name", "last_name", "email", "login_url"]
+    },
+    {
+        "event": WorkflowTriggerEvent.USER_DEACTIVATED,
+        "display_name": "User Deactivated",
+        "description": "Triggered when a user account is deactivated",
+        "available_variables": ["first_name", "last_name", "email"]
+    },
+
+    # Credential Events
+    {
+        "event": WorkflowTriggerEvent.PASSWORD_RESET,
+        "display_name": "Password Reset",
+        "description": "Triggered when a password reset is requested",
+        "available_variables": ["first_name", "last_name", "email", "reset_url", "reset_code"]
+    },
+    {
+        "event": WorkflowTriggerEvent.VPN_ASSIGNED,
+        "display_name": "VPN Assigned",
+        "description": "Triggered when VPN credentials are assigned",
+        "available_variables": ["first_name", "last_name", "email", "pandas_username", "pandas_password"]
+    },
+
+    # Event Participation
+    {
+        "event": WorkflowTriggerEvent.PARTICIPATION_CONFIRMED,
+        "display_name": "Participation Confirmed",
+        "description": "Triggered when a user confirms they will attend the event",
+        "available_variables": ["first_name", "last_name", "email", "event_name", "event_date_range", "event_time", "event_location"]
+    },
+    {
+        "event": WorkflowTriggerEvent.USER_DECLINED,
+        "display_name": "Participation Declined",
+        "description": "Triggered when a user declines their invitation. Can notify admins or sponsors.",
+        "available_variables": ["first_name", "last_name", "email", "event_name", "decline_reason", "sponsor_first_name", "sponsor_last_name", "sponsor_name", "sponsor_email"]
+    },
+    {
+        "event": WorkflowTriggerEvent.BULK_INVITE,
+        "display_name": "Bulk Invite",
+        "description": "Template used for bulk invitation emails sent to participants",
+        "available_variables": ["first_name", "last_name", "email", "confirmation_url", "event_name", "event_date_range", "event_time", "event_location", "sponsor_first_name", "sponsor_last_name", "sponsor_name", "sponsor_email"]
+    },
+    {
+        "event": WorkflowTriggerEvent.EVENT_REMINDER_1,
+        "display_name": "Invitation Reminder — Stage 1",
+        "description": "First follow-up sent ~7 days after initial invitation",
+        "available_variables": ["first_name", "last_name", "email", "event_name", "event_date_range", "event_time", "event_location", "event_start_date", "days_until_event", "confirmation_url", "reminder_stage"]
+    },
+    {
+        "event": WorkflowTriggerEvent.EVENT_REMINDER_2,
+        "display_name": "Invitation Reminder — Stage 2",
+        "description": "Second follow-up sent ~14 days after initial invitation",
+        "available_variables": ["first_name", "last_name", "email", "event_name", "event_date_range", "event_time", "event_location", "event_start_date", "days_until_event", "confirmation_url", "reminder_stage"]
+    },
+    {
+        "event": WorkflowTriggerEvent.EVENT_REMINDER_FINAL,
+        "display_name": "Invitation Reminder — Final",
+        "description": "Last-chance reminder sent ~3 days before event starts",
+        "available_variables": ["first_name", "last_name", "email", "event_name", "event_date_range", "event_time", "event_location", "event_start_date", "days_until_event", "confirmation_url", "reminder_stage", "is_final_reminder"]
+    },
+    {
+        "event": WorkflowTriggerEvent.EVENT_STARTED,
+        "display_name": "Event Started",
+        "description": "Triggered when the event officially begins",
+        "available_variables": ["first_name", "last_name", "email", "event_name", "event_date_range", "event_time", "event_location", "login_url"]
+    },
+    {
+        "event": WorkflowTriggerEvent.EVENT_ENDED,
+        "display_name": "Event Ended",
+        "description": "Triggered when the event concludes",
+        "available_variables": ["first_name", "last_name", "email", "event_name", "survey_url"]
+    },
+
+    # Feedback
+    {
+        "event": WorkflowTriggerEvent.SURVEY_REQUEST,
+        "display_name": "Survey Request",
+        "description": "Triggered after event completion for feedback",
+        "available_variables": ["first_name", "last_name", "email", "survey_url"]
+    },
+
+    # Admin Actions
+    {
+        "event": WorkflowTriggerEvent.CUSTOM_EMAIL,
+        "display_name": "Custom Email",
+        "description": "Used for ad-hoc custom emails sent by admins",
+        "available_variables": ["first_name", "last_name", "email"]
+    },
+    {
+        "event": WorkflowTriggerEvent.ACTION_ASSIGNED,
+        "display_name": "Action Assigned (Generic)",
+        "description": "Fallback trigger for custom or unknown action types",
+        "available_variables": ["first_name", "last_name", "email", "action_title", "action_description", "action_url", "deadline", "event_name"]
+    },
+
+    # Per-Action-Type Triggers
+    {
+        "event": WorkflowTriggerEvent.ACTION_ASSIGNED_IN_PERSON_ATTENDANCE,
+        "display_name": "Action: In-Person Attendance",
+        "description": "Triggered when an in-person attendance confirmation is assigned",
+        "available_variables": ["first_name", "last_name", "email", "action_title", "action_description", "action_url", "deadline", "event_name"]
+    },
+    {
+        "event": WorkflowTriggerEvent.ACTION_ASSIGNED_SURVEY_COMPLETION,
+        "display_name": "Action: Survey Completion",
+        "description": "Triggered when a survey completion action is assigned",
+        "available_variables": ["first_name", "last_name", "email", "action_title", "action_description", "action_url", "deadline", "event_name"]
+    },
+    {
+        "event": WorkflowTriggerEvent.ACTION_ASSIGNED_ORIENTATION_RSVP,
+        "display_name": "Action: Orientation RSVP",
+        "description": "Triggered when an orientation RSVP action is assigned",
+        "available_variables": ["first_name", "last_name", "email", "action_title", "action_description", "action_url", "deadline", "event_name"]
+    },
+    {
+        "event": WorkflowTriggerEvent.ACTION_ASSIGNED_DOCUMENT_REVIEW,
+        "display_name": "Action: Document Review",
+        "description": "Triggered when a document review action is assigned",
+        "available_variables": ["first_name", "last_name", "email", "action_title", "action_description", "action_url", "deadline", "event_name"]
     }
+]
+_TRIGGER_EVENTS_BODY = orjson.dumps({"events": _TRIGGER_EVENTS})
 
 
 @router.get("/email-workflows/trigger-events")
@@ -2249,161 +2363,7 @@ async def get_trigger_events(
     current_user: User = Depends(require_permission("email.manage_workflows"))
 ):
     """Get available trigger events and their metadata."""
-    from app.models.email_workflow import WorkflowTriggerEvent
-
-    events = [
-        # User Events
-        {
-            "event": WorkflowTriggerEvent.USER_CREATED,
-            "display_name": "User Created",
-            "description": "Triggered when a new participant user is created",
-            "available_variables": ["first_name", "last_name", "email", "login_url"]
-        },
-        {
-            "event": WorkflowTriggerEvent.ADMIN_CREATED,
-            "display_name": "Admin Created",
-            "description": "Triggered when a new admin account is created",
-            "available_variables": ["first_name", "last_name", "email", "password", "login_url", "role", "role_label", "role_upper", "role_display", "a_or_an"]
-        },
-        {
-            "event": WorkflowTriggerEvent.SPONSOR_CREATED,
-            "display_name": "Sponsor Created",
-            "description": "Triggered when a new sponsor account is created",
-            "available_variables": ["first_name", "last_name", "email", "password", "login_url", "role", "role_label", "role_upper", "role_display", "a_or_an"]
-        },
-        {
-            "event": WorkflowTriggerEvent.USER_CONFIRMED,
-            "display_name": "User Confirmed",
-            "description": "Triggered when a user confirms participation",
-            "available_variables": ["first_name", "last_name", "email", "login_url", "event_name"]
-        },
-        {
-            "event": WorkflowTriggerEvent.USER_ACTIVATED,
-            "display_name": "User Activated",
-            "description": "Triggered when a user account is activated",
-            "available_variables": ["first_name", "last_name", "email", "login_url"]
-        },
-        {
-            "event": WorkflowTriggerEvent.USER_DEACTIVATED,
-            "display_name": "User Deactivated",
-            "description": "Triggered when a user account is deactivated",
-            "available_variables": ["first_name", "last_name", "email"]
-        },
-
-        # Credential Events
-        {
-            "event": WorkflowTriggerEvent.PASSWORD_RESET,
-            "display_name": "Password Reset",
-            "description": "Triggered when a password reset is requested",
-            "available_variables": ["first_name", "last_name", "email", "reset_url", "reset_code"]
-        },
-        {
-            "event": WorkflowTriggerEvent.VPN_ASSIGNED,
-            "display_name": "VPN Assigned",
-            "description": "Triggered when VPN credentials are assigned",
-            "available_variables": ["first_name", "last_name", "email", "pandas_username", "pandas_password"]
-        },
-
-        # Event Participation
-        {
-            "event": WorkflowTriggerEvent.PARTICIPATION_CONFIRMED,
-            "display_name": "Participation Confirmed",
-            "description": "Triggered when a user confirms they will attend the event",
-            "available_variables": ["first_name", "last_name", "email", "event_name", "event_date_range", "event_time", "event_location"]
-        },
-        {
-            "event": WorkflowTriggerEvent.USER_DECLINED,
-            "display_name": "Participation Declined",
-            "description": "Triggered when a user declines their invitation. Can notify admins or sponsors.",
-            "available_variables": ["first_name", "last_name", "email", "event_name", "decline_reason", "sponsor_first_name", "sponsor_last_name", "sponsor_name", "sponsor_email"]
-        },
-        {
-            "event": WorkflowTriggerEvent.BULK_INVITE,
-            "display_name": "Bulk Invite",
-            "description": "Template used for bulk invitation emails sent to participants",
-            "available_variables": ["first_name", "last_name", "email", "confirmation_url", "event_name", "event_date_range", "event_time", "event_location", "sponsor_first_name", "sponsor_last_name", "sponsor_name", "sponsor_email"]
-        },
-        {
-            "event": WorkflowTriggerEvent.EVENT_REMINDER_1,
-            "display_name": "Invitation Reminder — Stage 1",
-            "description": "First follow-up sent ~7 days after initial invitation",
-            "available_variables": ["first_name", "last_name", "email", "event_name", "event_date_range", "event_time", "event_location", "event_start_date", "days_until_event", "confirmation_url", "reminder_stage"]
-        },
-        {
-            "event": WorkflowTriggerEvent.EVENT_REMINDER_2,
-            "display_name": "Invitation Reminder — Stage 2",
-            "description": "Second follow-up sent ~14 days after initial invitation",
-            "available_variables": ["first_name", "last_name", "email", "event_name", "event_date_range", "event_time", "event_location", "event_start_date", "days_until_event", "confirmation_url", "reminder_stage"]
-        },
-        {
-            "event": WorkflowTriggerEvent.EVENT_REMINDER_FINAL,
-            "display_name": "Invitation Reminder — Final",
-            "description": "Last-chance reminder sent ~3 days before event starts",
-            "available_variables": ["first_name", "last_name", "email", "event_name", "event_date_range", "event_time", "event_location", "event_start_date", "days_until_event", "confirmation_url", "reminder_stage", "is_final_reminder"]
-        },
-        {
-            "event": WorkflowTriggerEvent.EVENT_STARTED,
-            "display_name": "Event Started",
-            "description": "Triggered when the event officially begins",
-            "available_variables": ["first_name", "last_name", "email", "event_name", "event_date_range", "event_time", "event_location", "login_url"]
-        },
-        {
-            "event": WorkflowTriggerEvent.EVENT_ENDED,
-            "display_name": "Event Ended",
-            "description": "Triggered when the event concludes",
-            "available_variables": ["first_name", "last_name", "email", "event_name", "survey_url"]
-        },
-
-        # Feedback
-        {
-            "event": WorkflowTriggerEvent.SURVEY_REQUEST,
-            "display_name": "Survey Request",
-            "description": "Triggered after event completion for feedback",
-            "available_variables": ["first_name", "last_name", "email", "survey_url"]
-        },
-
-        # Admin Actions
-        {
-            "event": WorkflowTriggerEvent.CUSTOM_EMAIL,
-            "display_name": "Custom Email",
-            "description": "Used for ad-hoc custom emails sent by admins",
-            "available_variables": ["first_name", "last_name", "email"]
-        },
-        {
-            "event": WorkflowTriggerEvent.ACTION_ASSIGNED,
-            "display_name": "Action Assigned (Generic)",
-            "description": "Fallback trigger for custom or unknown action types",
-            "available_variables": ["first_name", "last_name", "email", "action_title", "action_description", "action_url", "deadline", "event_name"]
-        },
-
-        # Per-Action-Type Triggers
-        {
-            "event": WorkflowTriggerEvent.ACTION_ASSIGNED_IN_PERSON_ATTENDANCE,
-            "display_name": "Action: In-Person Attendance",
-            "description": "Triggered when an in-person attendance confirmation is assigned",
-            "available_variables": ["first_name", "last_name", "email", "action_title", "action_description", "action_url", "deadline", "event_name"]
-        },
-        {
-            "event": WorkflowTriggerEvent.ACTION_ASSIGNED_SURVEY_COMPLETION,
-            "display_name": "Action: Survey Completion",
-            "description": "Triggered when a survey completion action is assigned",
-            "available_variables": ["first_name", "last_name", "email", "action_title", "action_description", "action_url", "deadline", "event_name"]
-        },
-        {
-            "event": WorkflowTriggerEvent.ACTION_ASSIGNED_ORIENTATION_RSVP,
-            "display_name": "Action: Orientation RSVP",
-            "description": "Triggered when an orientation RSVP action is assigned",
-            "available_variables": ["first_name", "last_name", "email", "action_title", "action_description", "action_url", "deadline", "event_name"]
-        },
-        {
-            "event": WorkflowTriggerEvent.ACTION_ASSIGNED_DOCUMENT_REVIEW,
-            "display_name": "Action: Document Review",
-            "description": "Triggered when a document review action is assigned",
-            "available_variables": ["first_name", "last_name", "email", "action_title", "action_description", "action_url", "deadline", "event_name"]
-        }
-    ]
-
-    return {"events": events}
+    return Response(content=_TRIGGER_EVENTS_BODY, media_type="application/json")
 
 
 @router.get("/email-workflows/{workflow_id}")
@@ -2413,9 +2373,6 @@ async def get_workflow(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a single workflow by ID."""
-    from app.models.email_workflow import EmailWorkflow
-    from app.schemas.workflow import WorkflowResponse
-
     result = await db.execute(
         select(EmailWorkflow).where(EmailWorkflow.id == workflow_id)
     )
@@ -2424,27 +2381,18 @@ async def get_workflow(
     if not workflow:
         raise not_found("Workflow")
 
-    return WorkflowResponse.model_validate(workflow)
+    return _workflow_response(workflow)
 
 
 @router.post("/email-workflows")
 async def create_workflow(
-    workflow_data: dict,
+    workflow_create: WorkflowCreate,
     current_user: User = Depends(require_permission("email.manage_workflows")),
     db: AsyncSession = Depends(get_db)
 ):
     """Create a new email workflow."""
-    from app.models.email_workflow import EmailWorkflow
-    from app.schemas.workflow import WorkflowCreate, WorkflowResponse
-
-    # Validate with schema
-    workflow_create = WorkflowCreate(**workflow_data)
-
     # Check if name already exists
-    existing = await db.execute(
-        select(EmailWorkflow).where(EmailWorkflow.name == workflow_create.name)
-    )
-    if existing.scalar_one_or_none():
+    if await db.scalar(select(exists().where(EmailWorkflow.name == workflow_create.name))):
         raise bad_request(f"Workflow with name '{workflow_create.name}' already exists")
 
     # Create workflow
@@ -2466,7 +2414,7 @@ async def create_workflow(
 
     db.add(workflow)
     await db.commit()
-    await db.refresh(workflow)
+    _invalidate_workflow_list()
 
     # Audit log
     audit_service = AuditService(db)
@@ -2483,20 +2431,17 @@ async def create_workflow(
         }
     )
 
-    return WorkflowResponse.model_validate(workflow)
+    return _workflow_response(workflow)
 
 
 @router.put("/email-workflows/{workflow_id}")
 async def update_workflow(
     workflow_id: int,
-    workflow_data: dict,
+    workflow_update: WorkflowUpdate,
     current_user: User = Depends(require_permission("email.manage_workflows")),
     db: AsyncSession = Depends(get_db)
 ):
     """Update an existing workflow."""
-    from app.models.email_workflow import EmailWorkflow
-    from app.schemas.workflow import WorkflowUpdate, WorkflowResponse
-
     # Get workflow
     result = await db.execute(
         select(EmailWorkflow).where(EmailWorkflow.id == workflow_id)
@@ -2506,49 +2451,18 @@ async def update_workflow(
     if not workflow:
         raise not_found("Workflow")
 
-    # Validate with schema
-    workflow_update = WorkflowUpdate(**workflow_data)
-
-    # Track changes for audit log
+    # Apply the fields that were sent and differ, tracking changes for the audit log
     changes = {}
-
-    # Update fields
-    if workflow_update.display_name is not None:
-        changes["display_name"] = {"old": workflow.display_name, "new": workflow_update.display_name}
-        workflow.display_name = workflow_update.display_name
-    if workflow_update.description is not None:
-        changes["description"] = {"old": workflow.description, "new": workflow_update.description}
-        workflow.description = workflow_update.description
-    if workflow_update.trigger_event is not None:
-        changes["trigger_event"] = {"old": workflow.trigger_event, "new": workflow_update.trigger_event}
-        workflow.trigger_event = workflow_update.trigger_event
-    if workflow_update.template_name is not None:
-        changes["template_name"] = {"old": workflow.template_name, "new": workflow_update.template_name}
-        workflow.template_name = workflow_update.template_name
-    if workflow_update.priority is not None:
-        changes["priority"] = {"old": workflow.priority, "new": workflow_update.priority}
-        workflow.priority = workflow_update.priority
-    if workflow_update.custom_vars is not None:
-        changes["custom_vars"] = {"old": workflow.custom_vars, "new": workflow_update.custom_vars}
-        workflow.custom_vars = workflow_update.custom_vars
-    if workflow_update.delay_minutes is not None:
-        changes["delay_minutes"] = {"old": workflow.delay_minutes, "new": workflow_update.delay_minutes}
-        workflow.delay_minutes = workflow_update.delay_minutes
-    if workflow_update.send_immediately is not None:
-        changes["send_immediately"] = {"old": workflow.send_immediately, "new": workflow_update.send_immediately}
-        workflow.send_immediately = workflow_update.send_immediately
-    if workflow_update.is_enabled is not None:
-        changes["is_enabled"] = {"old": workflow.is_enabled, "new": workflow_update.is_enabled}
-        workflow.is_enabled = workflow_update.is_enabled
-    if workflow_update.from_email is not None:
-        changes["from_email"] = {"old": workflow.from_email, "new": workflow_update.from_email}
-        workflow.from_email = workflow_update.from_email or None  # empty string → NULL
-    if workflow_update.from_name is not None:
-        changes["from_name"] = {"old": workflow.from_name, "new": workflow_update.from_name}
-        workflow.from_name = workflow_update.from_name or None  # empty string → NULL
+    for field, new_value in workflow_update.model_dump(exclude_none=True).items():
+        if field in _WORKFLOW_EMPTY_AS_NULL:
+            new_value = new_value or None  # empty string → NULL
+        old_value = getattr(workflow, field)
+        if new_value != old_value:
+            changes[field] = {"old": old_value, "new": new_value}
+            setattr(workflow, field, new_value)
 
     await db.commit()
-    await db.refresh(workflow)
+    _invalidate_workflow_list()
 
     # Audit log
     if changes:
@@ -2559,7 +2473,7 @@ async def update_workflow(
             changes=changes
         )
 
-    return WorkflowResponse.model_validate(workflow)
+    return _workflow_response(workflow)
 
 
 @router.delete("/email-workflows/{workflow_id}")
@@ -2569,8 +2483,6 @@ async def delete_workflow(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a workflow (system workflows cannot be deleted)."""
-    from app.models.email_workflow import EmailWorkflow
-
     # Get workflow
     result = await db.execute(
         select(EmailWorkflow).where(EmailWorkflow.id == workflow_id)
@@ -2598,6 +2510,7 @@ async def delete_workflow(
 
     await db.delete(workflow)
     await db.commit()
+    _invalidate_workflow_list()
 
     return {"success": True, "message": "Workflow deleted successfully"}
 
@@ -2611,12 +2524,6 @@ async def regenerate_discord_invite(
     current_user: User = Depends(require_permission("discord.manage"))
 ):
     """Regenerate a Discord invite for a participant's current event."""
-    from app.models.event import EventParticipation
-    from app.services.event_service import EventService
-    from app.services.discord_invite_service import DiscordInviteService
-    from app.config import get_settings
-    from datetime import datetime, timezone
-
     settings = get_settings()
     if not settings.DISCORD_INVITE_ENABLED or not settings.DISCORD_BOT_TOKEN:
         raise bad_request("Discord invite generation is not enabled")
@@ -2760,7 +2667,6 @@ async def assign_participant_role(
 
     # Block elevation to admin if user has event participation history
     if role.base_type == UserRole.ADMIN.value and participant.role != UserRole.ADMIN.value:
-        from app.models.event import EventParticipation
         ep_count_result = await db.execute(
             select(func.count(EventParticipation.id))
             .where(EventParticipation.user_id == participant_id)
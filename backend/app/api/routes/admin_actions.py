@@ -1,25 +1,174 @@
 """Admin routes for managing participant actions."""
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import and_, bindparam, func, insert, select, update
 from typing import List, Optional
 from datetime import datetime, timezone
+import asyncio
+import logging
 import uuid
 
-from app.database import get_db
+from app.config import get_settings
+from app.database import AsyncSessionLocal, get_db
 from app.models.user import User
 from app.models.participant_action import ParticipantAction, ActionType, ActionStatus
-from app.models.event import Event
+from app.models.event import Event, EventParticipation, ParticipationStatus
 from app.models.email_template import EmailTemplate
 from app.dependencies import require_permission
+from app.services.event_service import EventService
 from app.services.workflow_service import WorkflowService
 from app.services.email_queue_service import EmailQueueService
 from app.models.email_workflow import WorkflowTriggerEvent
 from app.services.audit_service import AuditService
 from pydantic import BaseModel
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/admin/actions", tags=["admin-actions"])
 
+# Status values used by the query builders below, looked up once
+_PENDING = ActionStatus.PENDING.value
+_CONFIRMED = ActionStatus.CONFIRMED.value
+_DECLINED = ActionStatus.DECLINED.value
+_CANCELLED = ActionStatus.CANCELLED.value
+_PARTICIPATION_CONFIRMED = ParticipationStatus.CONFIRMED.value
+
+# Per-status counts for the statistics query, built once
+_ACTION_STATUS_COUNTS = (
+    func.count().filter(ParticipantAction.status == _CONFIRMED).label('confirmed'),
+    func.count().filter(ParticipantAction.status == _DECLINED).label('declined'),
+    func.count().filter(ParticipantAction.status == _PENDING).label('pending'),
+    func.count().filter(ParticipantAction.status == _CANCELLED).label('cancelled'),
+)
+
+# Active users confirmed for an event, built once; event_id is bound per request
+_CONFIRMED_PARTICIPANTS_STMT = (
+    select(User)
+    .join(EventParticipation, EventParticipation.user_id == User.id)
+    .where(EventParticipation.event_id == bindparam("event_id"))
+    .where(EventParticipation.status == _PARTICIPATION_CONFIRMED)
+    .where(User.is_active == True)
+)
+
+# Action listing projected to the ActionResponse fields. User info prefers
+# live user data and falls back to the denormalized columns once deleted.
+_LIST_ACTIONS_STMT = select(
+    ParticipantAction.id,
+    func.coalesce(User.id, ParticipantAction.user_id).label("user_id"),
+    func.coalesce(User.email, ParticipantAction.user_email, "deleted user").label("user_email"),
+    func.coalesce(
+        User.first_name + " " + User.last_name, ParticipantAction.user_name, "Deleted User"
+    ).label("user_name"),
+    ParticipantAction.event_id,
+    ParticipantAction.batch_id,
+    ParticipantAction.action_type,
+    ParticipantAction.title,
+    ParticipantAction.description,
+    ParticipantAction.status,
+    ParticipantAction.responded_at,
+    ParticipantAction.response_note,
+    ParticipantAction.deadline,
+    ParticipantAction.created_at,
+).outerjoin(User, User.id == ParticipantAction.user_id).order_by(ParticipantAction.id)
+
+# Action-type-specific workflow triggers; other types use ACTION_ASSIGNED
+_ACTION_TYPE_TRIGGERS = {
+    ActionType.IN_PERSON_ATTENDANCE.value: WorkflowTriggerEvent.ACTION_ASSIGNED_IN_PERSON_ATTENDANCE,
+    ActionType.SURVEY_COMPLETION.value: WorkflowTriggerEvent.ACTION_ASSIGNED_SURVEY_COMPLETION,
+    ActionType.ORIENTATION_RSVP.value: WorkflowTriggerEvent.ACTION_ASSIGNED_ORIENTATION_RSVP,
+    ActionType.DOCUMENT_REVIEW.value: WorkflowTriggerEvent.ACTION_ASSIGNED_DOCUMENT_REVIEW,
+}
+
+# Batches at least this large are inserted with COPY on PostgreSQL
+_COPY_THRESHOLD = 100
+
+# Where action notifications send participants
+_ACTIONS_PORTAL_URL = "https://staging.events.cyberxredteam.org/portal#actions"
+
+
+async def _insert_actions(db: AsyncSession, rows: List[dict]) -> list:
+    """
+    Insert participant action rows for one batch.
+
+    Small batches use one executemany INSERT ... RETURNING. On PostgreSQL,
+    batches of _COPY_THRESHOLD rows or more are streamed with COPY and
+    their ids read back by batch_id.
+
+    Args:
+        db: Database session
+        rows: Column values per action, all sharing one batch_id
+
+    Returns:
+        (id, user_id) rows for the inserted actions
+    """
+    connection = await db.connection()
+    if len(rows) < _COPY_THRESHOLD or connection.dialect.name != "postgresql":
+        result = await db.execute(
+            insert(ParticipantAction).returning(ParticipantAction.id, ParticipantAction.user_id),
+            rows
+        )
+        return result.all()
+
+    columns = list(rows[0])
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        ParticipantAction.__tablename__,
+        records=[tuple(row[column] for column in columns) for row in rows],
+        columns=columns,
+    )
+
+    # The batch may already hold actions for other users (assign), so keep only ours
+    inserted_user_ids = {row["user_id"] for row in rows}
+    result = await db.execute(
+        select(ParticipantAction.id, ParticipantAction.user_id)
+        .where(ParticipantAction.batch_id == rows[0]["batch_id"])
+    )
+    return [row for row in result.all() if row.user_id in inserted_user_ids]
+
+
+async def _trigger_action_workflows(
+    trigger_event: str,
+    created_actions: list,
+    users_by_id: dict,
+    custom_vars: dict,
+) -> List[int]:
+    """
+    Trigger the action workflow for each created action concurrently.
+
+    Each trigger runs in its own session (an AsyncSession cannot be shared
+    between tasks), bounded by ACTION_NOTIFY_PARALLELISM.
+
+    Returns:
+        IDs of the actions whose workflow was triggered without error
+    """
+    sem = asyncio.Semaphore(get_settings().ACTION_NOTIFY_PARALLELISM)
+
+    async def trigger_one(action) -> int:
+        async with sem, AsyncSessionLocal() as session:
+            await WorkflowService(session).trigger_workflow(
+                trigger_event=trigger_event,
+                user_id=action.user_id,
+                custom_vars=custom_vars,
+                force=True,
+                user=users_by_id[action.user_id],
+            )
+        return action.id
+
+    results = await asyncio.gather(
+        *(trigger_one(action) for action in created_actions),
+        return_exceptions=True,
+    )
+
+    notified_ids = []
+    for action, result in zip(created_actions, results, strict=True):
+        # gather may return a CancelledError, which is not an Exception
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to notify user {action.user_id} of action {action.id}: {result}")
+            continue
+        notified_ids.append(result)
+    return notified_ids
+
 
 # Schemas
 class BulkActionCreate(BaseModel):
@@ -62,65 +211,63 @@ async def create_bulk_action(
 
     If user_ids is empty, applies to all confirmed participants for current event.
     """
-    # Get current active event
-    event_result = await db.execute(
-        select(Event).where(Event.is_active == True)
-    )
-    event = event_result.scalar_one_or_none()
+    # Get current active event (id and name, cached across requests); the
+    # actions are written against it, so confirm it is still the active one
+    event = await EventService(db).get_active_event_ref(verify=True)
     if not event:
         raise HTTPException(status_code=400, detail="No active event found")
 
     # Determine target users
     if data.user_ids:
-        # Specific users selected
+        # Specific users selected; bind each id once
         user_result = await db.execute(
-            select(User).where(User.id.in_(data.user_ids))
+            select(User).where(User.id.in_(set(data.user_ids)))
         )
         target_users = user_result.scalars().all()
     else:
         # All confirmed participants for current event
-        from app.models.event import EventParticipation, ParticipationStatus
-        user_result = await db.execute(
-            select(User)
-            .join(EventParticipation, EventParticipation.user_id == User.id)
-            .where(EventParticipation.event_id == event.id)
-            .where(EventParticipation.status == ParticipationStatus.CONFIRMED.value)
-            .where(User.is_active == True)
-        )
+        user_result = await db.execute(_CONFIRMED_PARTICIPANTS_STMT, {"event_id": event.id})
         target_users = user_result.scalars().all()
 
     if not target_users:
         raise HTTPException(status_code=400, detail="No target users found")
 
-    # Create actions
+    # Create actions in one batched INSERT (COPY for large batches)
     batch_id = f"action_{uuid.uuid4().hex[:12]}"
-    created_actions = []
-    for user in target_users:
-        action = ParticipantAction(
-            user_id=user.id,
-            user_email=user.email,
-            user_name=f"{user.first_name} {user.last_name}",
-            event_id=event.id,
-            created_by_id=current_user.id,
-            batch_id=batch_id,
-            action_type=data.action_type,
-            title=data.title,
-            description=data.description,
-            status=ActionStatus.PENDING.value,
-            deadline=data.deadline,
-            email_template_id=data.email_template_id
-        )
-        db.add(action)
-        created_actions.append(action)
-
-    await db.commit()
+    created_actions = await _insert_actions(
+        db,
+        [
+            {
+                "user_id": user.id,
+                "user_email": user.email,
+                "user_name": f"{user.first_name} {user.last_name}",
+                "event_id": event.id,
+                "created_by_id": current_user.id,
+                "batch_id": batch_id,
+                "action_type": data.action_type,
+                "title": data.title,
+                "description": data.description,
+                "status": _PENDING,
+                "deadline": data.deadline,
+                "email_template_id": data.email_template_id,
+                "notification_sent": False,
+            }
+            for user in target_users
+        ]
+    )
 
-    # Send notifications
+    # Send notifications. Template emails are queued in this session and commit
+    # together with the actions and flags; workflows commit on their own
+    # sessions and may send at once, so the actions are committed first.
     if data.send_notification:
+        # Notifications reuse the target users loaded above
+        users_by_id = {user.id: user for user in target_users}
+        notified_ids = []
+
         notification_vars = {
             "action_title": data.title,
             "action_description": data.description or "",
-            "action_url": f"https://staging.events.cyberxredteam.org/portal#actions",
+            "action_url": _ACTIONS_PORTAL_URL,
             "deadline": str(data.deadline) if data.deadline else "No deadline",
             "event_name": event.name
         }
@@ -133,40 +280,38 @@ async def create_bulk_action(
             template = template_result.scalar_one_or_none()
 
             if template:
-                queue_service = EmailQueueService(db)
-                for action in created_actions:
-                    await queue_service.enqueue_email(
-                        user_id=action.user_id,
-                        template_name=template.name,
-                        priority=3,
-                        custom_vars=notification_vars,
-                        force=True,
-                    )
-                    action.notification_sent = True
-                    action.notification_sent_at = datetime.now(timezone.utc)
+                # Queue every recipient in one INSERT
+                await EmailQueueService(db).enqueue_emails_bulk(
+                    users=target_users,
+                    template_name=template.name,
+                    priority=3,
+                    custom_vars=notification_vars,
+                )
+                notified_ids.extend(action.id for action in created_actions)
         else:
             # Use workflow system (default)
             # Try action-type-specific trigger first, fall back to generic ACTION_ASSIGNED
-            action_type_trigger_map = {
-                ActionType.IN_PERSON_ATTENDANCE.value: WorkflowTriggerEvent.ACTION_ASSIGNED_IN_PERSON_ATTENDANCE,
-                ActionType.SURVEY_COMPLETION.value: WorkflowTriggerEvent.ACTION_ASSIGNED_SURVEY_COMPLETION,
-                ActionType.ORIENTATION_RSVP.value: WorkflowTriggerEvent.ACTION_ASSIGNED_ORIENTATION_RSVP,
-                ActionType.DOCUMENT_REVIEW.value: WorkflowTriggerEvent.ACTION_ASSIGNED_DOCUMENT_REVIEW,
-            }
-            trigger_event = action_type_trigger_map.get(data.action_type, WorkflowTriggerEvent.ACTION_ASSIGNED)
+            trigger_event = _ACTION_TYPE_TRIGGERS.get(data.action_type, WorkflowTriggerEvent.ACTION_ASSIGNED)
 
-            workflow_service = WorkflowService(db)
-            for action in created_actions:
-                await workflow_service.trigger_workflow(
-                    trigger_event=trigger_event,
-                    user_id=action.user_id,
-                    custom_vars=notification_vars,
-                    force=True,
-                )
-                action.notification_sent = True
-                action.notification_sent_at = datetime.now(timezone.utc)
+            await db.commit()
+            notified_ids = await _trigger_action_workflows(
+                trigger_event, created_actions, users_by_id, notification_vars
+            )
 
-        await db.commit()
+        # Flag every notified action in one UPDATE; the batch is new, so when
+        # nothing failed it can be matched by batch_id instead of a long id list
+        if notified_ids:
+            if len(notified_ids) == len(created_actions):
+                notified = ParticipantAction.batch_id == batch_id
+            else:
+                notified = ParticipantAction.id.in_(notified_ids)
+            await db.execute(
+                update(ParticipantAction)
+                .where(notified)
+                .values(notification_sent=True, notification_sent_at=datetime.now(timezone.utc))
+            )
+
+    await db.commit()
 
     # Audit log
     audit_service = AuditService(db)
@@ -203,8 +348,6 @@ async def assign_action_to_participants(
     Copies action_type, title, description, deadline, and email_template_id
     from the existing batch. Skips users who already have this action.
     """
-    from sqlalchemy import and_
-
     # Find an existing action in this batch to copy properties from
     result = await db.execute(
         select(ParticipantAction).where(
@@ -223,8 +366,8 @@ async def assign_action_to_participants(
     )
     existing_user_ids = {row[0] for row in existing_result.all()}
 
-    # Filter to only new users
-    new_user_ids = [uid for uid in data.user_ids if uid not in existing_user_ids]
+    # Filter to only new users, each once
+    new_user_ids = set(data.user_ids) - existing_user_ids
     if not new_user_ids:
         return {
             "success": True,
@@ -240,30 +383,38 @@ async def assign_action_to_participants(
     if not target_users:
         raise HTTPException(status_code=400, detail="No valid users found")
 
-    # Create actions with same properties as existing batch
-    created_actions = []
-    for user in target_users:
-        action = ParticipantAction(
-            user_id=user.id,
-            user_email=user.email,
-            user_name=f"{user.first_name} {user.last_name}",
-            event_id=reference_action.event_id,
-            created_by_id=current_user.id,
-            batch_id=data.batch_id,
-            action_type=reference_action.action_type,
-            title=reference_action.title,
-            description=reference_action.description,
-            status=ActionStatus.PENDING.value,
-            deadline=reference_action.deadline,
-            email_template_id=reference_action.email_template_id,
-        )
-        db.add(action)
-        created_actions.append(action)
-
-    await db.commit()
+    # Create actions with same properties as existing batch, in one batched INSERT
+    # (COPY for large batches)
+    created_actions = await _insert_actions(
+        db,
+        [
+            {
+                "user_id": user.id,
+                "user_email": user.email,
+                "user_name": f"{user.first_name} {user.last_name}",
+                "event_id": reference_action.event_id,
+                "created_by_id": current_user.id,
+                "batch_id": data.batch_id,
+                "action_type": reference_action.action_type,
+                "title": reference_action.title,
+                "description": reference_action.description,
+                "status": _PENDING,
+                "deadline": reference_action.deadline,
+                "email_template_id": reference_action.email_template_id,
+                "notification_sent": False,
+            }
+            for user in target_users
+        ]
+    )
 
-    # Send notifications
+    # Send notifications. Template emails are queued in this session and commit
+    # together with the actions and flags; workflows commit on their own
+    # sessions and may send at once, so the actions are committed first.
     if data.send_notification:
+        # Notifications reuse the target users loaded above
+        users_by_id = {user.id: user for user in target_users}
+        notified_ids = []
+
         # Load event for notification vars
         event_result = await db.execute(
             select(Event).where(Event.id == reference_action.event_id)
@@ -273,7 +424,7 @@ async def assign_action_to_participants(
         notification_vars = {
             "action_title": reference_action.title,
             "action_description": reference_action.description or "",
-            "action_url": f"https://staging.events.cyberxredteam.org/portal#actions",
+            "action_url": _ACTIONS_PORTAL_URL,
             "deadline": str(reference_action.deadline) if reference_action.deadline else "No deadline",
             "event_name": event.name if event else "",
         }
@@ -286,39 +437,32 @@ async def assign_action_to_participants(
             )
             template = template_result.scalar_one_or_none()
             if template:
-                queue_service = EmailQueueService(db)
-                for action in created_actions:
-                    await queue_service.enqueue_email(
-                        user_id=action.user_id,
-                        template_name=template.name,
-                        priority=3,
-                        custom_vars=notification_vars,
-                        force=True,
-                    )
-                    action.notification_sent = True
-                    action.notification_sent_at = datetime.now(timezone.utc)
+                # Queue every recipient in one INSERT
+                await EmailQueueService(db).enqueue_emails_bulk(
+                    users=target_users,
+                    template_name=template.name,
+                    priority=3,
+                    custom_vars=notification_vars,
+                )
+                notified_ids.extend(action.id for action in created_actions)
         else:
-            action_type_trigger_map = {
-                ActionType.IN_PERSON_ATTENDANCE.value: WorkflowTriggerEvent.ACTION_ASSIGNED_IN_PERSON_ATTENDANCE,
-                ActionType.SURVEY_COMPLETION.value: WorkflowTriggerEvent.ACTION_ASSIGNED_SURVEY_COMPLETION,
-                ActionType.ORIENTATION_RSVP.value: WorkflowTriggerEvent.ACTION_ASSIGNED_ORIENTATION_RSVP,
-                ActionType.DOCUMENT_REVIEW.value: WorkflowTriggerEvent.ACTION_ASSIGNED_DOCUMENT_REVIEW,
-            }
-            trigger_event = action_type_trigger_map.get(
+            trigger_event = _ACTION_TYPE_TRIGGERS.get(
                 reference_action.action_type, WorkflowTriggerEvent.ACTION_ASSIGNED
             )
-            workflow_service = WorkflowService(db)
-            for action in created_actions:
-                await workflow_service.trigger_workflow(
-                    trigger_event=trigger_event,
-                    user_id=action.user_id,
-                    custom_vars=notification_vars,
-                    force=True,
-                )
-                action.notification_sent = True
-                action.notification_sent_at = datetime.now(timezone.utc)
+            await db.commit()
+            notified_ids = await _trigger_action_workflows(
+                trigger_event, created_actions, users_by_id, notification_vars
+            )
 
-        await db.commit()
+        # Flag every notified action in one UPDATE
+        if notified_ids:
+            await db.execute(
+                update(ParticipantAction)
+                .where(ParticipantAction.id.in_(notified_ids))
+                .values(notification_sent=True, notification_sent_at=datetime.now(timezone.utc))
+            )
+
+    await db.commit()
 
     # Audit log
     audit_service = AuditService(db)
@@ -355,35 +499,33 @@ async def revoke_actions(
 
     Sets PENDING actions to CANCELLED. Already confirmed/declined actions are not changed.
     """
-    from sqlalchemy import and_
-
-    # Find all pending actions in this batch
+    # Cancel every pending action in this batch in one UPDATE
     result = await db.execute(
-        select(ParticipantAction).where(
+        update(ParticipantAction)
+        .where(
             and_(
                 ParticipantAction.batch_id == data.batch_id,
-                ParticipantAction.status == ActionStatus.PENDING.value
+                ParticipantAction.status == _PENDING
             )
         )
+        .values(
+            status=_CANCELLED,
+            responded_at=datetime.now(timezone.utc),
+            response_note=f"Revoked by admin {current_user.email}"
+        )
+        .returning(ParticipantAction.id)
+        .execution_options(synchronize_session=False)
     )
-    pending_actions = result.scalars().all()
+    revoked_ids = result.scalars().all()
+    await db.commit()
 
-    if not pending_actions:
+    if not revoked_ids:
         return {
             "success": True,
             "actions_revoked": 0,
             "message": "No pending actions to revoke"
         }
 
-    # Cancel the actions
-    now = datetime.now(timezone.utc)
-    for action in pending_actions:
-        action.status = ActionStatus.CANCELLED.value
-        action.responded_at = now
-        action.response_note = f"Revoked by admin {current_user.email}"
-
-    await db.commit()
-
     # Audit log
     audit_service = AuditService(db)
     await audit_service.log(
@@ -391,15 +533,15 @@ async def revoke_actions(
         action="bulk_action_revoke",
         resource_type="participant_action",
         details={
-            "message": f"Revoked {len(pending_actions)} pending actions",
+            "message": f"Revoked {len(revoked_ids)} pending actions",
             "batch_id": data.batch_id
         }
     )
 
     return {
         "success": True,
-        "actions_revoked": len(pending_actions),
-        "message": f"Revoked {len(pending_actions)} pending actions"
+        "actions_revoked": len(revoked_ids),
+        "message": f"Revoked {len(revoked_ids)} pending actions"
     }
 
 
@@ -427,13 +569,13 @@ async def revoke_participant_action(
     if not action:
         raise HTTPException(status_code=404, detail="Action not found")
 
-    if action.status != ActionStatus.PENDING.value:
+    if action.status != _PENDING:
         raise HTTPException(
             status_code=400,
             detail=f"Cannot revoke action with status '{action.status}'. Only pending actions can be revoked."
         )
 
-    action.status = ActionStatus.CANCELLED.value
+    action.status = _CANCELLED
     action.responded_at = datetime.now(timezone.utc)
     action.response_note = f"Revoked by admin {current_user.email}"
 
@@ -459,18 +601,23 @@ async def revoke_participant_action(
     }
 
 
-@router.get("")
+@router.get("", response_model=List[ActionResponse], response_class=ORJSONResponse)
 async def list_actions(
     event_id: Optional[int] = None,
     action_type: Optional[str] = None,
     status: Optional[str] = None,
+    after_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_permission("actions.manage"))
 ):
-    """List all participant actions with filters."""
-    from sqlalchemy.orm import selectinload
+    """
+    List participant actions with filters, ordered by id.
 
-    query = select(ParticipantAction).options(selectinload(ParticipantAction.user))
+    Pass limit to page by keyset: the next page starts after the last id
+    returned (after_id). Without limit every matching action is returned.
+    """
+    query = _LIST_ACTIONS_STMT
 
     if event_id:
         query = query.where(ParticipantAction.event_id == event_id)
@@ -478,35 +625,20 @@ async def list_actions(
         query = query.where(ParticipantAction.action_type == action_type)
     if status:
         query = query.where(ParticipantAction.status == status)
+    if after_id is not None:
+        query = query.where(ParticipantAction.id > after_id)
+    if limit is not None:
+        query = query.limit(limit)
 
+    # Columns are labelled with the ActionResponse fields, so each row maps straight to its dict
     result = await db.execute(query)
-    actions = result.scalars().all()
-
-    # Build response with user info (prefer live user data, fall back to denormalized columns)
-    response = []
-    for action in actions:
-        user = action.user
-        response.append(ActionResponse(
-            id=action.id,
-            user_id=user.id if user else action.user_id,
-            user_email=user.email if user else (action.user_email or "deleted user"),
-            user_name=f"{user.first_name} {user.last_name}" if user else (action.user_name or "Deleted User"),
-            event_id=action.event_id,
-            batch_id=action.batch_id,
-            action_type=action.action_type,
-            title=action.title,
-            description=action.description,
-            status=action.status,
-            responded_at=action.responded_at,
-            response_note=action.response_note,
-            deadline=action.deadline,
-            created_at=action.created_at
-        ))
-
-    return response
-
-
-@router.get("/statistics")
+    response = [dict(row) for row in result.mappings()]
+
+    # Encode with orjson directly instead of jsonable_encoder + json
+    return ORJSONResponse(response)
+
+
+@router.get("/statistics", response_class=ORJSONResponse)
 async def get_action_statistics(
     event_id: Optional[int] = None,
     action_type: Optional[str] = None,
@@ -514,8 +646,6 @@ async def get_action_statistics(
     current_user: User = Depends(require_permission("actions.manage"))
 ):
     """Get summary statistics for actions grouped by batch."""
-    from sqlalchemy import func, case
-
     # Group by batch_id for clean separation of batches.
     # Falls back to action_type+title grouping for legacy actions without batch_id.
     query = select(
@@ -523,11 +653,8 @@ async def get_action_statistics(
         ParticipantAction.action_type,
         ParticipantAction.title,
         func.min(ParticipantAction.created_at).label('created_at'),
-        func.count(ParticipantAction.id).label('total'),
-        func.sum(case((ParticipantAction.status == ActionStatus.CONFIRMED.value, 1), else_=0)).label('confirmed'),
-        func.sum(case((ParticipantAction.status == ActionStatus.DECLINED.value, 1), else_=0)).label('declined'),
-        func.sum(case((ParticipantAction.status == ActionStatus.PENDING.value, 1), else_=0)).label('pending'),
-        func.sum(case((ParticipantAction.status == ActionStatus.CANCELLED.value, 1), else_=0)).label('cancelled'),
+        func.count().label('total'),
+        *_ACTION_STATUS_COUNTS,
     ).group_by(
         ParticipantAction.batch_id,
         ParticipantAction.action_type,
@@ -539,20 +666,6 @@ async def get_action_statistics(
     if action_type:
         query = query.where(ParticipantAction.action_type == action_type)
 
+    # Columns are labelled with the response keys, so each row maps straight to its dict
     result = await db.execute(query)
-    stats = result.all()
-
-    return [
-        {
-            "batch_id": row.batch_id,
-            "action_type": row.action_type,
-            "title": row.title,
-            "created_at": row.created_at,
-            "total": row.total,
-            "confirmed": row.confirmed,
-            "declined": row.declined,
-            "pending": row.pending,
-            "cancelled": row.cancelled
-        }
-        for row in stats
-    ]
+    return ORJSONResponse([dict(row) for row in result.mappings()])
@@ -5,12 +5,12 @@ from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import exists, select, update
 
 from app.dependencies import get_db, require_permission
 from app.models.user import User
 from app.models.event import Event
-from app.models.cpe_certificate import CPECertificate
+from app.models.cpe_certificate import CPECertificate, CertificateStatus
 from app.services.cpe_certificate_service import CPECertificateService
 from app.services.audit_service import AuditService
 
@@ -118,7 +118,7 @@ async def issue_certificate(
 
     Automatically manages the Gotenberg service on Render for PDF generation.
     """
-    from app.services.render_service import RenderServiceManager
+    from app.services.render_service import GotenbergLease, RenderServiceManager
 
     render = RenderServiceManager()
     service = CPECertificateService(db)
@@ -134,42 +134,37 @@ async def issue_certificate(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    try:
-        if render.enabled:
-            ready = await render.start_gotenberg()
-            if not ready:
-                logger.warning("Gotenberg not ready - certificate will be created without PDF")
-
-        cert = await service.issue_certificate(
-            user_id=request_body.user_id,
-            event_id=request_body.event_id,
-            issued_by_user_id=current_user.id,
-            skip_eligibility=request_body.skip_eligibility,
-        )
-        await db.commit()
+    async with GotenbergLease(render) as ready:
+        if not ready:
+            logger.warning("Gotenberg not ready - certificate will be created without PDF")
 
-        await audit.log_certificate_issue(
-            user_id=current_user.id,
-            target_user_id=request_body.user_id,
-            certificate_id=cert.id,
-            event_id=request_body.event_id,
-            certificate_number=cert.certificate_number,
-            ip_address=request.client.host if request.client else None,
-        )
+        try:
+            cert = await service.issue_certificate(
+                user_id=request_body.user_id,
+                event_id=request_body.event_id,
+                issued_by_user_id=current_user.id,
+                skip_eligibility=request_body.skip_eligibility,
+            )
+            await db.commit()
 
-        return {
-            "status": "ok",
-            "certificate_id": cert.id,
-            "certificate_number": cert.certificate_number,
-            "pdf_generated": cert.pdf_storage_key is not None,
-        }
+            await audit.log_certificate_issue(
+                user_id=current_user.id,
+                target_user_id=request_body.user_id,
+                certificate_id=cert.id,
+                event_id=request_body.event_id,
+                certificate_number=cert.certificate_number,
+                ip_address=request.client.host if request.client else None,
+            )
 
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+            return {
+                "status": "ok",
+                "certificate_id": cert.id,
+                "certificate_number": cert.certificate_number,
+                "pdf_generated": cert.pdf_storage_key is not None,
+            }
 
-    finally:
-        if render.enabled:
-            await render.stop_gotenberg()
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/issue/bulk")
@@ -183,48 +178,43 @@ async def bulk_issue_certificates(
 
     Automatically manages the Gotenberg service on Render for PDF generation.
     """
-    from app.services.render_service import RenderServiceManager
+    from app.services.render_service import GotenbergLease, RenderServiceManager
 
     render = RenderServiceManager()
     service = CPECertificateService(db)
     audit = AuditService(db)
 
-    try:
-        if render.enabled:
-            ready = await render.start_gotenberg()
-            if not ready:
-                logger.warning("Gotenberg not ready - certificates will be created without PDFs")
-
-        result = await service.bulk_issue(
-            event_id=request_body.event_id,
-            user_ids=request_body.user_ids,
-            issued_by_user_id=current_user.id,
-            skip_eligibility=request_body.skip_eligibility,
-        )
+    async with GotenbergLease(render) as ready:
+        if not ready:
+            logger.warning("Gotenberg not ready - certificates will be created without PDFs")
 
-        if result["issued"]:
-            await audit.log_bulk_certificate_issue(
-                user_id=current_user.id,
+        try:
+            result = await service.bulk_issue(
                 event_id=request_body.event_id,
-                count=len(result["issued"]),
-                ip_address=request.client.host if request.client else None,
+                user_ids=request_body.user_ids,
+                issued_by_user_id=current_user.id,
+                skip_eligibility=request_body.skip_eligibility,
             )
 
-        return {
-            "status": "ok",
-            "issued_count": len(result["issued"]),
-            "skipped_ineligible_count": len(result["skipped_ineligible"]),
-            "skipped_existing_count": len(result["skipped_existing"]),
-            "failed_count": len(result["failed"]),
-            **result,
-        }
+            if result["issued"]:
+                await audit.log_bulk_certificate_issue(
+                    user_id=current_user.id,
+                    event_id=request_body.event_id,
+                    count=len(result["issued"]),
+                    ip_address=request.client.host if request.client else None,
+                )
 
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+            return {
+                "status": "ok",
+                "issued_count": len(result["issued"]),
+                "skipped_ineligible_count": len(result["skipped_ineligible"]),
+                "skipped_existing_count": len(result["skipped_existing"]),
+                "failed_count": len(result["failed"]),
+                **result,
+            }
 
-    finally:
-        if render.enabled:
-            await render.stop_gotenberg()
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/certificates/{event_id}")
@@ -242,14 +232,14 @@ async def list_certificates(
     service = CPECertificateService(db)
     certificates = await service.get_certificates_for_event(event_id, status=status_filter)
 
-    # Enrich with user info (prefer snapshots, fall back to live lookup)
+    # Enrich with user info (prefer snapshots, fall back to the loaded live user)
     items = []
     for cert in certificates:
         email = cert.user_email
         first_name = None
         last_name = None
         if cert.user_id:
-            user = await db.get(User, cert.user_id)
+            user = cert.user
             if user:
                 email = email or user.email
                 first_name = user.first_name
@@ -332,36 +322,48 @@ async def reinstate_certificate(
     current_user: User = Depends(require_permission("cpe.manage")),
 ):
     """Reinstate a revoked certificate (undo revocation)."""
-    service = CPECertificateService(db)
     audit = AuditService(db)
 
-    cert = await service.get_certificate_by_id(certificate_id)
-    if not cert:
-        raise HTTPException(status_code=404, detail="Certificate not found")
-
-    if cert.status != "revoked":
+    # Reinstate only if still revoked, in one atomic UPDATE
+    result = await db.execute(
+        update(CPECertificate)
+        .where(
+            CPECertificate.id == certificate_id,
+            CPECertificate.status == CertificateStatus.REVOKED.value,
+        )
+        .values(
+            status=CertificateStatus.ISSUED.value,
+            revoked_at=None,
+            revoked_by_user_id=None,
+            revocation_reason=None,
+        )
+        .returning(CPECertificate.certificate_number)
+        .execution_options(synchronize_session=False)
+    )
+    certificate_number = result.scalar_one_or_none()
+    if certificate_number is None:
+        exists_result = await db.execute(
+            select(exists().where(CPECertificate.id == certificate_id))
+        )
+        if not exists_result.scalar():
+            raise HTTPException(status_code=404, detail="Certificate not found")
         raise HTTPException(status_code=400, detail="Certificate is not revoked")
-
-    cert.status = "issued"
-    cert.revoked_at = None
-    cert.revoked_by_user_id = None
-    cert.revocation_reason = None
     await db.commit()
 
     await audit.log(
         action="CERTIFICATE_REINSTATE",
         user_id=current_user.id,
         resource_type="CERTIFICATE",
-        resource_id=cert.id,
+        resource_id=certificate_id,
         details={
-            "certificate_number": cert.certificate_number,
+            "certificate_number": certificate_number,
         },
         ip_address=request.client.host if request.client else None,
     )
 
     return {
         "status": "ok",
-        "certificate_number": cert.certificate_number,
+        "certificate_number": certificate_number,
     }
 
 
@@ -374,37 +376,32 @@ async def regenerate_certificate_pdf(
     """Regenerate the PDF for an existing certificate.
 
     Automatically manages the Gotenberg service on Render:
-    starts before conversion, suspends after.
+    starts before conversion, suspends once no PDF work has run for a while.
     """
-    from app.services.render_service import RenderServiceManager
+    from app.services.render_service import GotenbergLease, RenderServiceManager
 
     render = RenderServiceManager()
     service = CPECertificateService(db)
 
-    try:
-        if render.enabled:
-            ready = await render.start_gotenberg()
-            if not ready:
-                raise HTTPException(
-                    status_code=503,
-                    detail="Gotenberg service did not become ready in time"
-                )
+    async with GotenbergLease(render) as ready:
+        if not ready:
+            raise HTTPException(
+                status_code=503,
+                detail="Gotenberg service did not become ready in time"
+            )
 
-        cert = await service.regenerate_pdf(certificate_id)
-        await db.commit()
+        try:
+            cert = await service.regenerate_pdf(certificate_id)
+            await db.commit()
 
-        return {
-            "status": "ok",
-            "certificate_number": cert.certificate_number,
-            "pdf_generated_at": cert.pdf_generated_at.isoformat() if cert.pdf_generated_at else None,
-        }
+            return {
+                "status": "ok",
+                "certificate_number": cert.certificate_number,
+                "pdf_generated_at": cert.pdf_generated_at.isoformat() if cert.pdf_generated_at else None,
+            }
 
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-    finally:
-        if render.enabled:
-            await render.stop_gotenberg()
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/certificates/regenerate/bulk")
@@ -417,43 +414,37 @@ async def bulk_regenerate_pdfs(
     Bulk regenerate PDFs for certificates.
 
     Automatically manages the Gotenberg service on Render:
-    scales to Standard, resumes, waits for ready, then suspends after.
+    scales to Standard, resumes, waits for ready, then suspends once idle.
 
     If certificate_ids is omitted, regenerates all ISSUED certs missing PDFs for the event.
     """
-    from app.services.render_service import RenderServiceManager
+    from app.services.render_service import GotenbergLease, RenderServiceManager
 
     render = RenderServiceManager()
     service = CPECertificateService(db)
 
-    try:
-        # Start Gotenberg (scale + resume + wait)
-        if render.enabled:
-            ready = await render.start_gotenberg()
-            if not ready:
-                raise HTTPException(
-                    status_code=503,
-                    detail="Gotenberg service did not become ready in time"
-                )
-
-        result = await service.bulk_regenerate_pdfs(
-            event_id=request_body.event_id,
-            certificate_ids=request_body.certificate_ids,
-        )
-        await db.commit()
-
-        return {
-            "status": "ok",
-            "regenerated_count": len(result["regenerated"]),
-            "failed_count": len(result["failed"]),
-            "skipped_revoked_count": len(result["skipped_revoked"]),
-            **result,
-        }
-
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    # Start Gotenberg (scale + resume + wait), shared with any concurrent PDF work
+    async with GotenbergLease(render) as ready:
+        if not ready:
+            raise HTTPException(
+                status_code=503,
+                detail="Gotenberg service did not become ready in time"
+            )
 
-    finally:
-        # Always suspend Gotenberg after bulk operation
-        if render.enabled:
-            await render.stop_gotenberg()
+        try:
+            result = await service.bulk_regenerate_pdfs(
+                event_id=request_body.event_id,
+                certificate_ids=request_body.certificate_ids,
+            )
+            await db.commit()
+
+            return {
+                "status": "ok",
+                "regenerated_count": len(result["regenerated"]),
+                "failed_count": len(result["failed"]),
+                "skipped_revoked_count": len(result["skipped_revoked"]),
+                **result,
+            }
+
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
@@ -4,8 +4,9 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 
+from app.api.utils import stats_cache
 from app.dependencies import get_db, require_permission
 from app.models.user import User
 from app.models.password_sync_queue import PasswordSyncQueue, SyncOperation
@@ -14,9 +15,13 @@ from app.config import get_settings
 from app.utils.encryption import encrypt_field
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 router = APIRouter(prefix="/api/admin/keycloak", tags=["Admin - Keycloak"])
 
+KEYCLOAK_HEALTH_CACHE_KEY = "keycloak_health"
+KEYCLOAK_HEALTH_CACHE_TTL = 5
+
 
 @router.get("/sync-status")
 async def get_sync_status(
@@ -27,7 +32,6 @@ async def get_sync_status(
     service = KeycloakSyncService(db)
     stats = await service.get_queue_stats()
 
-    settings = get_settings()
     stats["sync_enabled"] = settings.PASSWORD_SYNC_ENABLED
     stats["keycloak_url"] = settings.KEYCLOAK_URL or "(not configured)"
     stats["keycloak_realm"] = settings.KEYCLOAK_REALM
@@ -41,8 +45,6 @@ async def trigger_sync_now(
     current_user: User = Depends(require_permission("keycloak.manage"))
 ):
     """Manually trigger Keycloak sync processing."""
-    settings = get_settings()
-
     if not settings.KEYCLOAK_URL:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -68,18 +70,18 @@ async def retry_sync_entry(
 ):
     """Reset retry count for a failed sync entry to allow reprocessing."""
     result = await db.execute(
-        select(PasswordSyncQueue).where(PasswordSyncQueue.id == queue_id)
+        update(PasswordSyncQueue)
+        .where(PasswordSyncQueue.id == queue_id)
+        .values(retry_count=0, last_error=None)
+        .returning(PasswordSyncQueue.id)
+        .execution_options(synchronize_session=False)
     )
-    entry = result.scalar_one_or_none()
-
-    if not entry:
+    if result.first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Sync queue entry not found"
         )
 
-    entry.retry_count = 0
-    entry.last_error = None
     await db.commit()
 
     return {"status": "ok", "message": f"Retry scheduled for queue entry {queue_id}"}
@@ -90,11 +92,11 @@ async def check_keycloak_health(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_permission("keycloak.manage"))
 ):
-    """Check if Keycloak is reachable."""
+    """Check if Keycloak is reachable (cached briefly so dashboard polling spares Keycloak)."""
     service = KeycloakSyncService(db)
-    healthy = await service.check_keycloak_health()
-
-    settings = get_settings()
+    healthy = await stats_cache.cached(
+        KEYCLOAK_HEALTH_CACHE_KEY, KEYCLOAK_HEALTH_CACHE_TTL, service.check_keycloak_health
+    )
 
     return {
         "status": "healthy" if healthy else "unreachable",
@@ -111,7 +113,6 @@ async def sync_single_user(
     current_user: User = Depends(require_permission("keycloak.manage"))
 ):
     """Queue and immediately sync a single confirmed user to Keycloak."""
-    settings = get_settings()
     if not settings.KEYCLOAK_URL:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -164,8 +165,6 @@ async def setup_keycloak_webhook(
     Uses KEYCLOAK_WEBHOOK_SECRET for HMAC signing and FRONTEND_URL as the
     webhook target.
     """
-    settings = get_settings()
-
     if not settings.KEYCLOAK_URL:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -208,7 +207,6 @@ async def sync_confirmed_users(
     If user_ids is empty, syncs all confirmed users who aren't yet synced.
     If force is True, syncs ALL users with credentials regardless of sync status.
     """
-    settings = get_settings()
     if not settings.KEYCLOAK_URL:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
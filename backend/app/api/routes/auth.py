@@ -1,4 +1,5 @@
 """Authentication API routes."""
+from collections import OrderedDict, deque
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
@@ -41,9 +42,11 @@ settings = get_settings()
 import logging
 logger = logging.getLogger(__name__)
 
-# Rate limiting storage (in production, use Redis)
-# Key: "{prefix}_{ip}", Value: list of attempt timestamps
-_rate_limit_cache: dict = {}
+# Rate limiting storage (per-process; in production, use Redis)
+# Key: "{prefix}_{ip}", Value: deque of attempt timestamps, oldest first.
+# Keys are kept in least-recently-used order so the table stays bounded.
+_RATE_LIMIT_MAX_KEYS = 10000
+_rate_limit_cache: "OrderedDict[str, deque]" = OrderedDict()
 
 
 def check_rate_limit(
@@ -67,29 +70,33 @@ def check_rate_limit(
     now = datetime.now(timezone.utc)
     cache_key = f"{prefix}_{ip_address}"
 
-    if cache_key not in _rate_limit_cache:
-        _rate_limit_cache[cache_key] = []
+    attempts = _rate_limit_cache.get(cache_key)
+    if attempts is None:
+        attempts = _rate_limit_cache[cache_key] = deque()
+        # Evict the least recently seen key once the table is full
+        if len(_rate_limit_cache) > _RATE_LIMIT_MAX_KEYS:
+            _rate_limit_cache.popitem(last=False)
+    else:
+        _rate_limit_cache.move_to_end(cache_key)
 
-    # Clean old entries outside the time window
+    # Drop entries that slid out of the time window
     window_start = now - timedelta(minutes=window_minutes)
-    _rate_limit_cache[cache_key] = [
-        ts for ts in _rate_limit_cache[cache_key] if ts > window_start
-    ]
+    while attempts and attempts[0] <= window_start:
+        attempts.popleft()
 
     # Check if limit exceeded
-    if len(_rate_limit_cache[cache_key]) >= max_attempts:
+    if len(attempts) >= max_attempts:
         return True
 
     # Record this attempt
-    _rate_limit_cache[cache_key].append(now)
+    attempts.append(now)
     return False
 
 
 def clear_rate_limit(prefix: str, ip_address: str) -> None:
     """Clear rate limit for an IP address after successful action."""
     cache_key = f"{prefix}_{ip_address}"
-    if cache_key in _rate_limit_cache:
-        del _rate_limit_cache[cache_key]
+    _rate_limit_cache.pop(cache_key, None)
 
 
 def get_rate_limit_count(prefix: str, ip_address: str) -> int:
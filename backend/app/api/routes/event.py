@@ -591,7 +591,7 @@ async def get_event_ssh_private_key(
     """
     event = await service.get_event(event_id)
     if not event:
-        raise not_found(f"Event {event_id} not found")
+        raise not_found("Event", event_id)
 
     # Check if user is a confirmed participant for this event (or is admin)
     if current_user.role != "admin" and current_user.role != "sponsor":
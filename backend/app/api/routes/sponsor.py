@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.api.exceptions import not_found, forbidden, bad_request, conflict, unauthorized, server_error
-from app.dependencies import get_db, require_permission, PermissionChecker
+from app.dependencies import get_db, require_permission, permissions
 from app.api.utils.request import extract_client_metadata
 from app.api.utils.pagination import calculate_pagination
 from app.api.utils.dependencies import get_participant_service
@@ -21,12 +21,16 @@ from app.schemas.participant import (
     InviteeCreateRequest,
     InviteeUpdateRequest
 )
-from app.api.utils.response_builders import build_participant_response
+from app.api.utils.response_builders import build_participant_response, build_participant_responses
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/sponsors", tags=["sponsors"])
 
+# Permission checks bound once at import instead of per request
+_can_edit_participant = permissions.can_edit_participant
+_can_delete_participant = permissions.can_delete_participant
+
 
 @router.get("/my-invitees", response_model=SponsorInviteeListResponse)
 async def list_my_invitees(
@@ -66,7 +70,7 @@ async def list_my_invitees(
     )
 
     # Build responses
-    items = [await build_participant_response(p, db) for p in participants]
+    items = await build_participant_responses(participants, db)
 
     _, total_pages = calculate_pagination(total, page, page_size)
 
@@ -292,8 +296,6 @@ async def update_my_invitee(
     """
     logger.info(f"Sponsor {current_user.id} updating invitee {invitee_id}")
 
-    permissions = PermissionChecker()
-
     # Get and verify ownership
     invitee = await service.get_participant(invitee_id)
     if not invitee or invitee.sponsor_id != current_user.id:
@@ -304,7 +306,7 @@ async def update_my_invitee(
         raise not_found("Invitee not found")
 
     # Permission check
-    permissions.can_edit_participant(current_user, invitee)
+    _can_edit_participant(current_user, invitee)
 
     # Validate role_id if provided
     update_data = data.model_dump(exclude_unset=True)
@@ -364,8 +366,6 @@ async def delete_my_invitee(
     """
     logger.info(f"Sponsor {current_user.id} deleting invitee {invitee_id}")
 
-    permissions = PermissionChecker()
-
     # Get and verify ownership
     invitee = await service.get_participant(invitee_id)
     if not invitee or invitee.sponsor_id != current_user.id:
@@ -376,7 +376,7 @@ async def delete_my_invitee(
         raise not_found("Invitee not found")
 
     # Permission check (includes self-delete guard and ownership check)
-    permissions.can_delete_participant(current_user, invitee)
+    _can_delete_participant(current_user, invitee)
 
     # Sponsors cannot delete invitees who have confirmed for the current event
     participation = await invitee.get_current_event_participation(db)
@@ -437,8 +437,6 @@ async def reset_invitee_password(
 
     logger.info(f"Sponsor {current_user.id} sending reset link for invitee {invitee_id}")
 
-    permissions = PermissionChecker()
-
     # Get and verify ownership
     invitee = await service.get_participant(invitee_id)
     if not invitee or invitee.sponsor_id != current_user.id:
@@ -449,7 +447,7 @@ async def reset_invitee_password(
         raise not_found("Invitee not found")
 
     # Permission check
-    permissions.can_edit_participant(current_user, invitee)
+    _can_edit_participant(current_user, invitee)
 
     # Generate reset token (same flow as self-service)
     reset_token = secrets.token_urlsafe(32)
@@ -517,8 +515,6 @@ async def resend_invitee_invitation(
     """
     logger.info(f"Sponsor {current_user.id} resending invitation for invitee {invitee_id}")
 
-    permissions = PermissionChecker()
-
     # Get and verify ownership
     invitee = await service.get_participant(invitee_id)
     if not invitee or invitee.sponsor_id != current_user.id:
@@ -529,7 +525,7 @@ async def resend_invitee_invitation(
         raise not_found("Invitee not found")
 
     # Permission check
-    permissions.can_edit_participant(current_user, invitee)
+    _can_edit_participant(current_user, invitee)
 
     # Validate participant is eligible for invitation resend
     if invitee.role not in ['invitee', 'sponsor']:
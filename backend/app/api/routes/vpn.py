@@ -62,6 +62,10 @@ from app.config import get_settings
 settings = get_settings()
 router = APIRouter(prefix="/api/vpn", tags=["VPN Management"])
 
+# Permission checks bound once at import instead of per request
+_can_view_participant = permissions.can_view_participant
+_can_assign_vpn_to_participant = permissions.can_assign_vpn_to_participant
+
 # Rate limiting storage (in production, use Redis)
 _rate_limit_cache: dict = {}
 
@@ -267,7 +271,7 @@ async def assign_vpn(
         raise not_found("Participant not found")
 
     # Check permission to assign VPN to this participant
-    permissions.can_assign_vpn_to_participant(current_user, participant)
+    _can_assign_vpn_to_participant(current_user, participant)
 
     # Assign requested number of VPNs
     count, message, vpns = await vpn_service.request_vpns(
@@ -517,7 +521,7 @@ async def get_participant_vpn_credentials(
         raise not_found("Participant not found")
 
     # Check permission
-    permissions.can_view_participant(current_user, participant)
+    _can_view_participant(current_user, participant)
 
     credentials = await vpn_service.get_user_credentials(participant_id)
 
@@ -549,7 +553,7 @@ async def download_participant_vpn_configs(
         raise not_found("Participant not found")
 
     # Check permission
-    permissions.can_view_participant(current_user, participant)
+    _can_view_participant(current_user, participant)
 
     credentials = await vpn_service.get_user_credentials(participant_id)
     if not credentials:
@@ -0,0 +1,27 @@
+"""Request-scoped event helpers."""
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.event import Event
+from app.services.event_service import EventService
+
+
+async def get_active_event_cached(request: Request, db: AsyncSession) -> Optional[Event]:
+    """
+    Get the active event, querying at most once per request.
+
+    The result (including "no active event") is stored on request.state so
+    other code paths in the same request reuse it.
+
+    Args:
+        request: FastAPI Request object
+        db: Database session
+
+    Returns:
+        Active Event or None
+    """
+    if not hasattr(request.state, "active_event"):
+        request.state.active_event = await EventService(db).get_active_event()
+    return request.state.active_event
@@ -1,5 +1,29 @@
 """Pagination utilities."""
-from typing import Tuple
+import base64
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import orjson
+from sqlalchemy import Select, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.api.exceptions import bad_request
+from app.api.utils import stats_cache
+
+# Seconds a filtered list total is reused for later pages of the same filters
+TOTAL_CACHE_TTL = 30
+# Planner row estimates at or above this are reported instead of an exact COUNT
+ESTIMATE_THRESHOLD = 10_000
+
+
+class Page(NamedTuple):
+    """One page of a listing."""
+
+    items: List[Any]
+    total: int
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False  # total is the planner's estimate, not a COUNT
 
 
 def calculate_pagination(
@@ -25,3 +49,370 @@ def calculate_pagination(
     offset = (page - 1) * page_size
     total_pages = (total + page_size - 1) // page_size
     return offset, total_pages
+
+
+def _selects_entity(query: Select) -> bool:
+    """True if query selects one ORM entity; otherwise it selects columns."""
+    descriptions = query.column_descriptions
+    return len(descriptions) == 1 and descriptions[0]["expr"] is descriptions[0]["entity"]
+
+
+def _page_items(result: Any, entity: bool) -> List[Any]:
+    """Entities for an entity query, or one plain dict per row for a column query."""
+    if entity:
+        return list(result.scalars().all())
+    return [row._asdict() for row in result]
+
+
+def _windowed_item(row: Any, entity: bool) -> Any:
+    """Drop the windowed total from a row of a page query."""
+    if entity:
+        return row[0]
+    item = row._asdict()
+    del item["total"]
+    return item
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: Select,
+    page: int,
+    page_size: int,
+    count_key: Optional[str] = None,
+    estimate: bool = False,
+    params: Optional[Dict[str, Any]] = None
+) -> Page:
+    """
+    Fetch one page of a single-entity query together with its total row count.
+
+    The total comes from count(*) OVER (), which is evaluated before
+    OFFSET/LIMIT, so the page and the total cost one query. Only a page past
+    the end (no rows to carry the total) falls back to a separate COUNT.
+    With estimate, when the planner expects ESTIMATE_THRESHOLD rows or more,
+    its estimate replaces the count and only the LIMIT'd rows (plus one, to
+    tell whether more follow) are read. The estimate is corrected by what the
+    page finds, so an underestimate never hides later pages.
+
+    With count_key, the total is cached for TOTAL_CACHE_TTL seconds and pages
+    after the first reuse it, fetching only their LIMIT'd rows. Page 1 always
+    recounts an exact total, so reloading a list refreshes it; EXPLAIN runs
+    only when no total is cached.
+
+    Args:
+        db: Database session
+        query: Filtered and ordered select of one entity, or of columns,
+            without offset/limit
+        page: Current page number (1-indexed)
+        page_size: Items per page
+        count_key: Cache key identifying the query's filters, or None to not cache
+        estimate: Report large totals from the planner's estimate (for big tables)
+        params: Values for bind parameters in query
+
+    Returns:
+        Page with the entities (or row dicts for a column query) and total
+        (next_cursor is not set)
+    """
+    entity = _selects_entity(query)
+    offset = (page - 1) * page_size
+    page_query = query.offset(offset).limit(page_size)
+
+    cached = stats_cache.get(count_key) if count_key else None
+    if cached is not None and page > 1 and not cached[1]:
+        result = await db.execute(page_query, params)
+        return Page(_page_items(result, entity), *cached)
+
+    # A cached total, exact or estimated, already says whether to estimate
+    if cached is not None:
+        rows_estimate = cached[0] if cached[1] else None
+    else:
+        rows_estimate = await large_estimate(db, query, params) if estimate else None
+
+    if rows_estimate is not None:
+        # One extra row tells whether another page follows, whatever the estimate says
+        result = await db.execute(query.offset(offset).limit(page_size + 1), params)
+        items = _page_items(result, entity)
+        has_more = len(items) > page_size
+        items = items[:page_size]
+        total, is_estimate = _bound_estimate(rows_estimate, offset, len(items), has_more)
+    else:
+        result = await db.execute(
+            page_query.add_columns(func.count().over().label("total")), params
+        )
+        rows = result.all()
+        is_estimate = False
+        if rows:
+            items, total = [_windowed_item(row, entity) for row in rows], rows[0].total
+        elif offset:
+            items, total = [], await _count_rows(db, query, params)
+        else:
+            items, total = [], 0
+
+    if count_key:
+        stats_cache.put(count_key, TOTAL_CACHE_TTL, (total, is_estimate))
+    return Page(items, total, total_is_estimate=is_estimate)
+
+
+def _bound_estimate(
+    estimate: int,
+    offset: int,
+    found: int,
+    has_more: bool
+) -> Tuple[int, bool]:
+    """
+    Reconcile a planner estimate with the rows a page actually found.
+
+    An underestimate is raised past the page when more rows follow, so later
+    pages stay reachable; a page that reaches the end gives the exact total.
+
+    Returns:
+        Tuple of (total, whether total is still an estimate)
+    """
+    if has_more:
+        return max(estimate, offset + found + 1), True
+    if found or not offset:
+        return offset + found, False
+    # Past the end: the rows stop at or before offset
+    return min(estimate, offset), True
+
+
+def encode_cursor(row: Any, columns: Sequence[Any]) -> str:
+    """
+    Encode a keyset cursor from the sort-column values of the last row on a page.
+
+    Args:
+        row: Last entity (or row dict) on the page
+        columns: Sort columns of the listing, in ORDER BY order
+
+    Returns:
+        Opaque URL-safe cursor string
+    """
+    if isinstance(row, dict):
+        values = [row[column.key] for column in columns]
+    else:
+        values = [getattr(row, column.key) for column in columns]
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode()
+
+
+def keyset_filter(
+    cursor: str,
+    columns: Sequence[Any],
+    descending: bool = False
+) -> ColumnElement:
+    """
+    Build the WHERE clause selecting rows after a cursor.
+
+    Compares the sort columns as a row value, so the database can seek the
+    matching index instead of reading and discarding OFFSET rows.
+
+    Args:
+        cursor: Cursor from encode_cursor
+        columns: Sort columns of the listing, in ORDER BY order, all sorted
+            the same direction
+        descending: True if the listing sorts descending
+
+    Returns:
+        Filter expression for rows after the cursor
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        bound = []
+        for column, value in zip(columns, values, strict=True):
+            python_type = column.type.python_type
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            # A wrong-typed value would only fail at the driver, as a 500
+            if not isinstance(value, python_type):
+                raise ValueError
+            bound.append(literal(value, type_=column.type))
+    except (ValueError, TypeError, orjson.JSONDecodeError):
+        raise bad_request("Invalid cursor") from None
+
+    if descending:
+        return tuple_(*columns) < tuple_(*bound)
+    return tuple_(*columns) > tuple_(*bound)
+
+
+async def fetch_keyset_page(
+    db: AsyncSession,
+    query: Select,
+    columns: Sequence[Any],
+    cursor: Optional[str],
+    page_size: int,
+    descending: bool = False,
+    params: Optional[Dict[str, Any]] = None
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Fetch the page of a query that follows a cursor.
+
+    Args:
+        db: Database session
+        query: Filtered select of one entity (or of columns) ordered by columns,
+            without offset/limit
+        columns: Sort columns, in ORDER BY order (must end with a unique column)
+        cursor: Cursor from a previous page, or None for the first page
+        page_size: Items per page
+        descending: True if the listing sorts descending
+        params: Values for bind parameters in query
+
+    Returns:
+        Tuple of (entities on the page, cursor for the next page or None)
+    """
+    if cursor:
+        query = query.where(keyset_filter(cursor, columns, descending))
+
+    # One extra row tells whether another page follows
+    result = await db.execute(query.limit(page_size + 1), params)
+    items = _page_items(result, _selects_entity(query))
+    if len(items) <= page_size:
+        return items, None
+    items = items[:page_size]
+    return items, encode_cursor(items[-1], columns)
+
+
+async def _count_rows(
+    db: AsyncSession,
+    query: Select,
+    params: Optional[Dict[str, Any]] = None
+) -> int:
+    """Count the rows a select returns."""
+    result = await db.execute(
+        select(func.count()).select_from(query.order_by(None).subquery()), params
+    )
+    return result.scalar() or 0
+
+
+async def estimate_rows(
+    db: AsyncSession,
+    query: Select,
+    params: Optional[Dict[str, Any]] = None
+) -> Optional[int]:
+    """
+    Return the PostgreSQL planner's row estimate for a select.
+
+    Runs EXPLAIN only, so the estimate costs a planning round trip instead of
+    a scan of every matching row.
+
+    Args:
+        db: Database session
+        query: Select to estimate
+        params: Values for bind parameters in query
+
+    Returns:
+        Estimated row count, or None on databases other than PostgreSQL
+    """
+    connection = await db.connection()
+    dialect = connection.dialect
+    if dialect.name != "postgresql":
+        return None
+
+    compiled = query.order_by(None).compile(dialect=dialect)
+    values = {**compiled.params, **(params or {})}
+    if compiled.positiontup is not None:
+        values = tuple(values[name] for name in compiled.positiontup)
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", values)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = orjson.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def large_estimate(
+    db: AsyncSession,
+    query: Select,
+    params: Optional[Dict[str, Any]] = None
+) -> Optional[int]:
+    """Return the planner's row estimate if it reaches ESTIMATE_THRESHOLD, else None."""
+    estimate = await estimate_rows(db, query, params)
+    if estimate is not None and estimate >= ESTIMATE_THRESHOLD:
+        return estimate
+    return None
+
+
+async def count_total(
+    db: AsyncSession,
+    query: Select,
+    count_key: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    estimate: bool = False
+) -> Tuple[int, bool]:
+    """
+    Return the cached total for count_key, counting query's rows when missing.
+
+    With estimate, large results (ESTIMATE_THRESHOLD rows or more by the
+    planner's estimate) report the estimate instead of running the COUNT.
+
+    Args:
+        db: Database session
+        query: Filtered select whose rows are counted
+        count_key: Cache key identifying the query's filters, or None to not cache
+        params: Values for bind parameters in query
+        estimate: Report large totals from the planner's estimate (for big tables)
+
+    Returns:
+        Tuple of (total matching rows, whether total is an estimate)
+    """
+    cached = stats_cache.get(count_key) if count_key else None
+    if cached is not None:
+        return cached
+
+    rows_estimate = await large_estimate(db, query, params) if estimate else None
+    if rows_estimate is not None:
+        total = (rows_estimate, True)
+    else:
+        total = (await _count_rows(db, query, params), False)
+    if count_key:
+        stats_cache.put(count_key, TOTAL_CACHE_TTL, total)
+    return total
+
+
+async def fetch_sorted_page(
+    db: AsyncSession,
+    query: Select,
+    columns: Sequence[Any],
+    page: int,
+    page_size: int,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+    count_key: Optional[str] = None,
+    estimate: bool = False,
+    params: Optional[Dict[str, Any]] = None
+) -> Page:
+    """
+    Fetch a page by cursor when given, otherwise by page number.
+
+    Either way the result carries a cursor for the next page, so a client
+    can switch to keyset paging from any page.
+
+    Args:
+        db: Database session
+        query: Filtered select of one entity (or of columns) ordered by columns,
+            without offset/limit
+        columns: Sort columns, in ORDER BY order (must end with a unique column)
+        page: Current page number (1-indexed), ignored when cursor is given
+        page_size: Items per page
+        cursor: Cursor from a previous page, or None to page by number
+        descending: True if the listing sorts descending
+        count_key: Cache key identifying the query's filters, or None to not cache
+        estimate: Report large totals from the planner's estimate (for big tables)
+        params: Values for bind parameters in query
+
+    Returns:
+        Page with the entities, total and next cursor
+    """
+    if cursor:
+        items, next_cursor = await fetch_keyset_page(
+            db, query, columns, cursor, page_size, descending, params
+        )
+        total, is_estimate = await count_total(db, query, count_key, params, estimate)
+        return Page(items, total, next_cursor, is_estimate)
+
+    listing = await fetch_page(db, query, page, page_size, count_key, estimate, params)
+    has_more = (page - 1) * page_size + len(listing.items) < listing.total
+    if listing.items and has_more:
+        return listing._replace(next_cursor=encode_cursor(listing.items[-1], columns))
+    return listing
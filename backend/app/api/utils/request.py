@@ -7,12 +7,17 @@ def extract_client_metadata(request: Request) -> Tuple[Optional[str], Optional[s
     """
     Extract IP address and user agent from request.
 
+    The result is cached on request.state, so handlers and services that
+    each need it for audit logging only read the headers once per request.
+
     Args:
         request: FastAPI Request object
 
     Returns:
         Tuple of (ip_address, user_agent)
     """
-    ip_address = request.client.host if request.client else None
-    user_agent = request.headers.get("user-agent")
-    return ip_address, user_agent
+    if not hasattr(request.state, "client_metadata"):
+        ip_address = request.client.host if request.client else None
+        user_agent = request.headers.get("user-agent")
+        request.state.client_metadata = (ip_address, user_agent)
+    return request.state.client_metadata
@@ -1,6 +1,10 @@
 """Response builder utilities for consistent API responses."""
+from typing import List, Optional, Sequence, Union
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, inspect
 from sqlalchemy.orm import selectinload
 
 from app.models.user import User
@@ -10,6 +14,7 @@ from app.models.vpn import VPNCredential
 from app.schemas.auth import UserResponse
 from app.schemas.event import EventParticipationResponse
 from app.schemas.participant import ParticipantResponse, SponsorInfo
+from app.services.event_service import EventService
 
 
 async def build_auth_user_response(
@@ -81,6 +86,67 @@ async def build_auth_user_response(
     )
 
 
+def _is_loaded(instance, attribute: str) -> bool:
+    """Return True if a relationship is already loaded (reading it won't query)."""
+    return attribute not in inspect(instance).unloaded
+
+
+def _assemble_participant_response(
+    user: User,
+    vpn_count: int,
+    sponsor: Optional[User],
+    role_name: Optional[str],
+    participation: Optional[EventParticipation]
+) -> ParticipantResponse:
+    """Build ParticipantResponse from a user and its already-loaded related data."""
+    sponsor_info = None
+    if sponsor:
+        sponsor_info = SponsorInfo(
+            id=sponsor.id,
+            email=sponsor.email,
+            first_name=sponsor.first_name,
+            last_name=sponsor.last_name,
+            full_name=f"{sponsor.first_name} {sponsor.last_name}"
+        )
+
+    return ParticipantResponse(
+        id=user.id,
+        email=user.email,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        country=user.country,
+        confirmed=user.confirmed,  # DEPRECATED - backward compatible
+        email_status=user.email_status,
+        event_participation_status=participation.status if participation else None,
+        event_participation_id=participation.id if participation else None,
+        role=user.role,
+        role_id=user.role_id,
+        role_name=role_name,
+        is_admin=user.is_admin,
+        is_active=user.is_active,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+        pandas_username=user.pandas_username,
+        discord_username=user.discord_username,
+        snowflake_id=user.snowflake_id,
+        sponsor_email=user.sponsor_email,
+        sponsor_id=user.sponsor_id,
+        sponsor=sponsor_info,
+        invite_sent=user.invite_sent,
+        password_email_sent=user.password_email_sent,
+        has_vpn=vpn_count > 0,
+        vpn_count=vpn_count,
+        keycloak_synced=user.keycloak_synced,
+        # Participation tracking
+        years_invited=user.years_invited,
+        years_participated=user.years_participated,
+        participation_rate=user.participation_rate,
+        is_chronic_non_participant=user.is_chronic_non_participant,
+        should_recommend_removal=user.should_recommend_removal,
+        confirmed_at=user.confirmed_at
+    )
+
+
 async def build_participant_response(
     user: User,
     db: AsyncSession,
@@ -93,6 +159,9 @@ async def build_participant_response(
     This uses the comprehensive participant.ParticipantResponse schema with
     all tracking fields, VPN count, and SponsorInfo object.
 
+    For lists of users use build_participant_responses(), which loads the
+    related data for the whole list in a fixed number of queries.
+
     Args:
         user: User model instance
         db: Database session
@@ -111,11 +180,11 @@ async def build_participant_response(
         )
         vpn_count = vpn_count_result.scalar() or 0
 
-    # Build sponsor info if available
-    sponsor_info = None
+    # Load sponsor if available
+    sponsor = None
     if include_sponsor and user.sponsor_id:
         # Load sponsor relationship if not already loaded
-        if not hasattr(user, 'sponsor') or user.sponsor is None:
+        if not _is_loaded(user, "sponsor") or user.sponsor is None:
             sponsor_result = await db.execute(
                 select(User).where(User.id == user.sponsor_id)
             )
@@ -123,67 +192,117 @@ async def build_participant_response(
         else:
             sponsor = user.sponsor
 
-        if sponsor:
-            sponsor_info = SponsorInfo(
-                id=sponsor.id,
-                email=sponsor.email,
-                first_name=sponsor.first_name,
-                last_name=sponsor.last_name,
-                full_name=f"{sponsor.first_name} {sponsor.last_name}"
-            )
-
     # Load role name (explicit query to avoid lazy load in async context)
     role_name = None
-    if user.role_id:
+    if user.role_id and _is_loaded(user, "role_obj") and user.role_obj is not None:
+        role_name = user.role_obj.name
+    elif user.role_id:
         role_result = await db.execute(
             select(Role.name).where(Role.id == user.role_id)
         )
         role_name = role_result.scalar_one_or_none()
 
     # Get current event participation status
-    event_participation_status = None
-    event_participation_id = None
     participation = await user.get_current_event_participation(db)
-    if participation:
-        event_participation_status = participation.status
-        event_participation_id = participation.id
 
-    return ParticipantResponse(
-        id=user.id,
-        email=user.email,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        country=user.country,
-        confirmed=user.confirmed,  # DEPRECATED - backward compatible
-        email_status=user.email_status,
-        event_participation_status=event_participation_status,
-        event_participation_id=event_participation_id,
-        role=user.role,
-        role_id=user.role_id,
-        role_name=role_name,
-        is_admin=user.is_admin,
-        is_active=user.is_active,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-        pandas_username=user.pandas_username,
-        discord_username=user.discord_username,
-        snowflake_id=user.snowflake_id,
-        sponsor_email=user.sponsor_email,
-        sponsor_id=user.sponsor_id,
-        sponsor=sponsor_info,
-        invite_sent=user.invite_sent,
-        password_email_sent=user.password_email_sent,
-        has_vpn=vpn_count > 0,
-        vpn_count=vpn_count,
-        keycloak_synced=user.keycloak_synced,
-        # Participation tracking
-        years_invited=user.years_invited,
-        years_participated=user.years_participated,
-        participation_rate=user.participation_rate,
-        is_chronic_non_participant=user.is_chronic_non_participant,
-        should_recommend_removal=user.should_recommend_removal,
-        confirmed_at=user.confirmed_at
-    )
+    return _assemble_participant_response(user, vpn_count, sponsor, role_name, participation)
+
+
+async def build_participant_responses(
+    users: Sequence[User],
+    db: AsyncSession,
+    include_sponsor: bool = True,
+    include_vpn: bool = True
+) -> List[ParticipantResponse]:
+    """
+    Build ParticipantResponses for a list of users.
+
+    Same output as calling build_participant_response() per user, but VPN
+    counts, sponsors, role names and current event participations are each
+    loaded with one query for the whole list instead of one query per user.
+
+    Args:
+        users: User model instances
+        db: Database session
+        include_sponsor: Whether to include sponsor information
+        include_vpn: Whether to check VPN counts
+
+    Returns:
+        List of ParticipantResponse in the same order as users
+    """
+    if not users:
+        return []
+
+    user_ids = [u.id for u in users]
+
+    # VPN credential counts per user
+    vpn_counts = {}
+    if include_vpn:
+        vpn_result = await db.execute(
+            select(VPNCredential.assigned_to_user_id, func.count(VPNCredential.id))
+            .where(VPNCredential.assigned_to_user_id.in_(user_ids))
+            .group_by(VPNCredential.assigned_to_user_id)
+        )
+        vpn_counts = dict(vpn_result.all())
+
+    # Sponsors: use the loaded relationship where available, batch-load the rest
+    sponsors_by_id = {}
+    if include_sponsor:
+        missing_sponsor_ids = set()
+        for u in users:
+            if not u.sponsor_id:
+                continue
+            if _is_loaded(u, "sponsor") and u.sponsor is not None:
+                sponsors_by_id[u.sponsor_id] = u.sponsor
+            else:
+                missing_sponsor_ids.add(u.sponsor_id)
+        missing_sponsor_ids -= sponsors_by_id.keys()
+        if missing_sponsor_ids:
+            sponsor_result = await db.execute(
+                select(User).where(User.id.in_(missing_sponsor_ids))
+            )
+            for sponsor in sponsor_result.scalars().all():
+                sponsors_by_id[sponsor.id] = sponsor
+
+    # Role names: use the loaded relationship where available, batch-load the rest
+    role_names = {}
+    role_ids = set()
+    for u in users:
+        if not u.role_id:
+            continue
+        if _is_loaded(u, "role_obj") and u.role_obj is not None:
+            role_names[u.role_id] = u.role_obj.name
+        else:
+            role_ids.add(u.role_id)
+    role_ids -= role_names.keys()
+    if role_ids:
+        role_result = await db.execute(
+            select(Role.id, Role.name).where(Role.id.in_(role_ids))
+        )
+        role_names.update(role_result.all())
+
+    # Current event participations
+    participations = {}
+    current_event = await EventService(db).get_current_event()
+    if current_event:
+        participation_result = await db.execute(
+            select(EventParticipation).where(
+                EventParticipation.user_id.in_(user_ids),
+                EventParticipation.event_id == current_event.id
+            )
+        )
+        participations = {p.user_id: p for p in participation_result.scalars().all()}
+
+    return [
+        _assemble_participant_response(
+            u,
+            vpn_counts.get(u.id, 0),
+            sponsors_by_id.get(u.sponsor_id) if include_sponsor and u.sponsor_id else None,
+            role_names.get(u.role_id) if u.role_id else None,
+            participations.get(u.id)
+        )
+        for u in users
+    ]
 
 
 async def build_event_participation_response(
@@ -231,3 +350,25 @@ async def build_event_participation_response(
         event_name=p.event.name if p.event else None,
         event_year=p.event.year if p.event else None
     )
+
+
+def json_response(data: Union[BaseModel, Sequence[BaseModel]]) -> ORJSONResponse:
+    """
+    Serialize already-built response models straight to an ORJSONResponse.
+
+    Returning a Response makes FastAPI skip its response_model validation and
+    serialization pass, so list endpoints whose items were just constructed
+    from the database are not validated a second time. Keep response_model on
+    the route for the OpenAPI schema.
+
+    Args:
+        data: Response model, or a list of them
+
+    Returns:
+        ORJSONResponse with the JSON-mode dump of data
+    """
+    if isinstance(data, BaseModel):
+        content = data.model_dump(mode="json")
+    else:
+        content = [item.model_dump(mode="json") for item in data]
+    return ORJSONResponse(content=content)
@@ -0,0 +1,77 @@
+"""Short-lived in-process cache for dashboard statistics and list totals."""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+# key -> (expires_at, value), using time.monotonic()
+_entries: Dict[str, Tuple[float, Any]] = {}
+# Bound on entries; list totals are keyed by filter values, so keys are open-ended
+_MAX_ENTRIES = 1024
+_locks: Dict[str, asyncio.Lock] = {}
+
+
+async def cached(key: str, ttl: float, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Return the cached value for key, calling loader() when missing or expired.
+
+    Concurrent misses for the same key wait on a per-key lock so only one
+    caller runs the loader; the rest reuse its result.
+
+    Args:
+        key: Cache key (stats are global, so a fixed name per statistic)
+        ttl: Seconds the loaded value stays valid
+        loader: Coroutine function producing the value
+
+    Returns:
+        Cached or freshly loaded value
+    """
+    entry = _entries.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    lock = _locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another caller may have refreshed it while we waited
+        entry = _entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        value = await loader()
+        put(key, ttl, value)
+        return value
+
+
+def get(key: str) -> Optional[Any]:
+    """Return the cached value for key, or None if missing or expired."""
+    entry = _entries.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def put(key: str, ttl: float, value: Any) -> None:
+    """
+    Store a value for ttl seconds.
+
+    When the cache is full, expired entries are dropped first, then the
+    oldest stored entries.
+    """
+    _entries.pop(key, None)
+    if len(_entries) >= _MAX_ENTRIES:
+        now = time.monotonic()
+        for stale in [k for k, (expires_at, _) in _entries.items() if expires_at <= now]:
+            del _entries[stale]
+        while len(_entries) >= _MAX_ENTRIES:
+            del _entries[next(iter(_entries))]
+    _entries[key] = (time.monotonic() + ttl, value)
+
+
+def invalidate(*keys: str) -> None:
+    """Drop cached values so the next read reloads them."""
+    for key in keys:
+        _entries.pop(key, None)
+
+
+def clear() -> None:
+    """Drop all cached values."""
+    _entries.clear()
@@ -81,6 +81,7 @@ class Settings(BaseSettings):
 
     # Email Job
     BULK_EMAIL_INTERVAL_MINUTES: int = 45
+    ACTION_NOTIFY_PARALLELISM: int = 16  # Concurrent workflow triggers per bulk action (<= DB pool_size)
 
     # OpenStack Integration (optional - only needed for instance provisioning)
     OS_AUTH_URL: str = ""
@@ -13,13 +13,16 @@ def _on_connect(dbapi_connection, connection_record):
     pass  # The setting is applied via connect_args below
 
 
-# Create async engine with pgbouncer-compatible settings
+# Create async engine with pgbouncer-compatible settings. create_async_engine
+# pools with AsyncAdaptedQueuePool; in-process fan-outs that each open a
+# session (e.g. ACTION_NOTIFY_PARALLELISM) must stay within pool_size.
 engine = create_async_engine(
     settings.async_database_url,
     echo=False,  # Disable SQL query logging (too verbose)
     pool_size=20,
     max_overflow=50,
     pool_pre_ping=True,
+    pool_recycle=1800,  # Replace connections before idle timeouts upstream drop them
     # Disable prepared statement caching for pgbouncer compatibility
     connect_args={
         "server_settings": {
@@ -5,11 +5,12 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import HTTPException as FastAPIHTTPException
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.config import get_settings
 from app.middleware.csrf import CSRFMiddleware
+from app.api.exceptions import encode_error_body
 from app.api.routes import auth, admin, vpn, email, webhooks, views, event, public, sponsor, user
 from app.api.routes import instances as instances_routes, cloud_init as cloud_init_routes, license as license_routes, cloud_init_vpn
 from app.api.routes import instance_templates, participant_instances
@@ -22,6 +23,7 @@ from app.api.routes import redirectors as redirectors_routes
 from app.api.routes import redirectors_pages
 from app.api.routes import admin_pages
 from app.tasks import start_scheduler, stop_scheduler
+from app.services import audit_queue
 from app.utils.encryption import init_encryptor, generate_encryption_key
 from cryptography.fernet import Fernet
 import base64
@@ -181,10 +183,21 @@ async def lifespan(app: FastAPI):
         logger.error("  Instance sync scheduler: Failed to start - %s", e)
         # Don't fail startup if scheduler fails
 
+    # Start the audit log writer
+    # Drains audit entries queued by route handlers and inserts them in batches
+    audit_queue.start()
+    logger.info("  Audit log writer: Started")
+
     yield  # Application runs
 
     # Shutdown
     logger.info("CyberX Event Management API shutting down...")
+    try:
+        await audit_queue.stop()
+        logger.info("  Audit log writer: Stopped")
+    except Exception as e:
+        logger.error("  Audit log writer: Error during shutdown - %s", e)
+
     try:
         await stop_scheduler()
         logger.info("  Background scheduler: Stopped")
@@ -208,6 +221,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/docs" if settings.DEBUG else None,  # Disable docs in production
     redoc_url="/api/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -328,9 +342,14 @@ async def http_exception_handler(request, exc):
         is_browser = "text/html" in accept and not request.url.path.startswith("/api/")
         if is_browser:
             return RedirectResponse(url="/login", status_code=302)
-    return JSONResponse(
+    # Details are plain JSON types (see app.api.exceptions), so encode the
+    # body directly instead of going through the response class's render step.
+    # Default messages reuse a body encoded once at import.
+    return Response(
+        content=encode_error_body(exc.status_code, exc.detail),
         status_code=exc.status_code,
-        content={"detail": exc.detail},
+        media_type="application/json",
+        headers=exc.headers,
     )
 
 
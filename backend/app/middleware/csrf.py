@@ -2,12 +2,14 @@
 from typing import List
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from starlette.responses import Response
 from starlette.datastructures import MutableHeaders
 import hmac
 from itsdangerous import URLSafeTimedSerializer, BadSignature
 import secrets
 
+from app.api.exceptions import forbidden_response
+
 
 class CSRFMiddleware(BaseHTTPMiddleware):
     """
@@ -131,27 +133,18 @@ class CSRFMiddleware(BaseHTTPMiddleware):
 
             # Validate token
             if not token_from_header:
-                resp = JSONResponse(
-                    status_code=403,
-                    content={"detail": "CSRF token missing"}
-                )
+                resp = forbidden_response("CSRF token missing")
                 self._set_csrf_cookie(resp, csrf_token, new_token_needed)
                 return resp
 
             if not self._validate_token(token_from_header):
-                resp = JSONResponse(
-                    status_code=403,
-                    content={"detail": "CSRF token invalid or expired"}
-                )
+                resp = forbidden_response("CSRF token invalid or expired")
                 self._set_csrf_cookie(resp, csrf_token, new_token_needed)
                 return resp
 
             # Verify token matches cookie
             if not hmac.compare_digest(token_from_header, csrf_token):
-                resp = JSONResponse(
-                    status_code=403,
-                    content={"detail": "CSRF token mismatch"}
-                )
+                resp = forbidden_response("CSRF token mismatch")
                 self._set_csrf_cookie(resp, csrf_token, new_token_needed)
                 return resp
 
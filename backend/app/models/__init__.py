@@ -5,7 +5,7 @@ from app.models.vpn import VPNCredential
 from app.models.vpn_import_job import VPNImportJob, VPNImportJobStatus
 from app.models.vpn_delete_job import VPNDeleteJob, VPNDeleteJobMode, VPNDeleteJobStatus
 from app.models.session import Session
-from app.models.audit_log import AuditLog, EmailEvent, VPNRequest
+from app.models.audit_log import AuditLog, AuditLogStatsSummary, EmailEvent, VPNRequest
 from app.models.event import Event, EventParticipation, ParticipationStatus
 from app.models.email_template import EmailTemplate
 from app.models.email_queue import EmailQueue, EmailBatchLog, EmailQueueStatus
@@ -37,6 +37,7 @@ __all__ = [
     "VPNDeleteJobStatus",
     "Session",
     "AuditLog",
+    "AuditLogStatsSummary",
     "EmailEvent",
     "VPNRequest",
     "Event",
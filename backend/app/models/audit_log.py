@@ -1,7 +1,7 @@
 """Audit logging model."""
 from sqlalchemy import Column, Integer, String, Boolean, TIMESTAMP, ForeignKey, Text, Index, JSON
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -36,19 +36,59 @@ class AuditLog(Base):
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     # Relationships
-    user = relationship("User", backref="audit_logs")
+    # lazy="raise": listings look users up in one batch, never a query per row
+    user = relationship("User", backref="audit_logs", lazy="raise")
 
     # Indexes
     __table_args__ = (
         Index('idx_audit_logs_user_id', 'user_id'),
         Index('idx_audit_logs_action', 'action'),
         Index('idx_audit_logs_created_at', 'created_at'),
+        # Admin listing: ordered by (created_at, id) DESC, optionally by action
+        Index('ix_audit_logs_created_at_id', created_at.desc(), id.desc()),
+        Index('ix_audit_logs_action_created_at_id', 'action', created_at.desc(), id.desc()),
+        # VPN request events (rate limiting, audit stats) are a small slice of the table
+        Index(
+            'ix_audit_logs_vpn_requests',
+            'user_id',
+            created_at.desc(),
+            postgresql_where=text("action LIKE 'VPN_REQUEST%'"),
+        ),
     )
 
     def __repr__(self):
         return f"<AuditLog(id={self.id}, action={self.action}, user_id={self.user_id})>"
 
 
+class AuditLogStatsSummary(Base):
+    """Precomputed audit log statistics, refreshed by a scheduled job."""
+
+    __tablename__ = "audit_log_stats_summary"
+
+    # Single row (id=1)
+    id = Column(Integer, primary_key=True)
+
+    # Counts (mirror AuditLogStats)
+    total_events = Column(Integer, nullable=False, default=0)
+    login_count = Column(Integer, nullable=False, default=0)
+    logout_count = Column(Integer, nullable=False, default=0)
+    user_create_count = Column(Integer, nullable=False, default=0)
+    user_update_count = Column(Integer, nullable=False, default=0)
+    user_delete_count = Column(Integer, nullable=False, default=0)
+    role_change_count = Column(Integer, nullable=False, default=0)
+    password_reset_count = Column(Integer, nullable=False, default=0)
+    vpn_request_success_count = Column(Integer, nullable=False, default=0)
+    vpn_request_failed_count = Column(Integer, nullable=False, default=0)
+    vpn_request_rate_limited_count = Column(Integer, nullable=False, default=0)
+    recent_24h = Column(Integer, nullable=False, default=0)
+
+    # When the counts were computed
+    updated_at = Column(TIMESTAMP(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<AuditLogStatsSummary(total_events={self.total_events}, updated_at={self.updated_at})>"
+
+
 class EmailEvent(Base):
     """Email event tracking model for SendGrid webhooks."""
 
@@ -58,6 +58,10 @@ class EmailWorkflow(Base):
         Index('idx_workflow_trigger_enabled', 'trigger_event', 'is_enabled'),
     )
 
+    # Fetch server-generated timestamps with the INSERT/UPDATE (RETURNING)
+    # rather than a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<EmailWorkflow(name={self.name}, trigger={self.trigger_event}, enabled={self.is_enabled})>"
 
@@ -5,7 +5,7 @@ from sqlalchemy import (
     Column, Integer, String, Boolean, TIMESTAMP, Date,
     ForeignKey, Index, Text, UniqueConstraint
 )
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -110,6 +110,11 @@ class Event(Base):
         cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Active event lookups: WHERE is_active ORDER BY year DESC
+        Index('ix_events_active_year', year.desc(), postgresql_where=text('is_active')),
+    )
+
     def __repr__(self):
         return (
             f"<Event(id={self.id}, slug={self.slug}, year={self.year}, "
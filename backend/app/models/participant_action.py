@@ -1,5 +1,5 @@
 """Participant action model for flexible task assignment."""
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, TIMESTAMP, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -81,5 +81,15 @@ class ParticipantAction(Base):
     created_by = relationship("User", foreign_keys=[created_by_id])
     email_template = relationship("EmailTemplate", foreign_keys=[email_template_id])
 
+    # Indexes
+    __table_args__ = (
+        # Action statistics: filtered by event/type, grouped by batch, counted by
+        # status; covers created_at and title so PostgreSQL reads only the index
+        Index(
+            'ix_participant_actions_stats', 'event_id', 'action_type', 'batch_id', 'status',
+            postgresql_include=['created_at', 'title'],
+        ),
+    )
+
     def __repr__(self):
         return f"<ParticipantAction(id={self.id}, user_id={self.user_id}, type={self.action_type}, status={self.status})>"
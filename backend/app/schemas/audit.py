@@ -34,6 +34,8 @@ class AuditLogListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None  # Pass as cursor to fetch the next page; page/total_pages do not apply then
+    total_is_estimate: bool = False  # total is the planner's row estimate for large results
 
 
 class AuditLogStats(BaseModel):
@@ -59,6 +59,7 @@ class WorkflowListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None
 
 
 class TriggerEventInfo(BaseModel):
@@ -0,0 +1,167 @@
+"""In-process queue for writing audit log rows off the request path.
+
+Route handlers enqueue audit entries instead of awaiting an INSERT + commit
+before responding. A single worker task drains the queue and writes entries
+in batches with one multi-row INSERT per batch.
+
+Usage:
+    Call start() during application startup and stop() during shutdown.
+    AuditService(session, deferred=True) routes its log calls through
+    enqueue(); when the worker is not running or the queue is full, enqueue()
+    returns False and the service writes the row synchronously instead.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert, select
+
+from app.database import AsyncSessionLocal
+from app.models.audit_log import AuditLog
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Entries held in memory before callers fall back to synchronous writes
+_MAX_QUEUE_SIZE = 10000
+# Most entries written in one INSERT
+_BATCH_SIZE = 100
+# How long the worker waits for more entries before flushing a partial batch
+_BATCH_WAIT_SECONDS = 0.05
+# Longest stop() waits for queued entries to be written during shutdown
+_STOP_TIMEOUT_SECONDS = 10.0
+
+_queue: Optional[asyncio.Queue] = None
+_worker: Optional[asyncio.Task] = None
+
+
+def enqueue(entry: Dict[str, Any]) -> bool:
+    """
+    Queue an audit entry for the background writer.
+
+    Args:
+        entry: AuditLog column values (action, user_id, resource_type,
+            resource_id, details, ip_address, user_agent, created_at)
+
+    Returns:
+        True if queued; False if the worker is not running or the queue is full
+    """
+    if _queue is None or _worker is None or _worker.done():
+        return False
+    try:
+        _queue.put_nowait(entry)
+    except asyncio.QueueFull:
+        logger.warning("Audit queue full, writing entry synchronously")
+        return False
+    return True
+
+
+async def write_batch(session, entries: List[Dict[str, Any]]) -> None:
+    """
+    Insert audit entries with one user lookup and one INSERT.
+
+    Fills the user_email/user_name snapshot for each entry from the users
+    table, the same as AuditService.log does for a single row.
+
+    Args:
+        session: Database session
+        entries: AuditLog column values, one dict per row
+    """
+    user_ids = {e["user_id"] for e in entries if e.get("user_id")}
+    snapshots: Dict[int, tuple] = {}
+    if user_ids:
+        result = await session.execute(
+            select(User.id, User.email, User.first_name, User.last_name)
+            .where(User.id.in_(user_ids))
+        )
+        for user_id, email, first_name, last_name in result.all():
+            name = f"{first_name or ''} {last_name or ''}".strip() or None
+            snapshots[user_id] = (email, name)
+
+    rows = []
+    for entry in entries:
+        email, name = snapshots.get(entry.get("user_id"), (None, None))
+        rows.append({**entry, "user_email": email, "user_name": name})
+
+    await session.execute(insert(AuditLog), rows)
+    await session.commit()
+
+
+async def _flush(entries: List[Dict[str, Any]]) -> None:
+    """
+    Write a batch in its own session, logging (not raising) failures.
+
+    If the multi-row INSERT fails, each entry is retried on its own so one
+    bad row does not take the rest of the batch with it. Entries that still
+    fail are logged in full before being dropped.
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            await write_batch(session, entries)
+        return
+    except Exception as e:
+        if len(entries) == 1:
+            logger.error("Dropped audit log entry %r: %s", entries[0], e)
+            return
+        logger.warning(
+            "Batch write of %d audit log entries failed, retrying individually: %s",
+            len(entries), e
+        )
+
+    for entry in entries:
+        try:
+            async with AsyncSessionLocal() as session:
+                await write_batch(session, [entry])
+        except Exception as e:
+            logger.error("Dropped audit log entry %r: %s", entry, e)
+
+
+async def _drain(queue: asyncio.Queue) -> None:
+    """Worker loop: collect up to _BATCH_SIZE entries or wait _BATCH_WAIT_SECONDS, then flush."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + _BATCH_WAIT_SECONDS
+        while len(batch) < _BATCH_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        await _flush(batch)
+        for _ in batch:
+            queue.task_done()
+
+
+def start() -> None:
+    """Create the queue and start the worker task on the running event loop."""
+    global _queue, _worker
+    if _worker is not None and not _worker.done():
+        return
+    _queue = asyncio.Queue(maxsize=_MAX_QUEUE_SIZE)
+    _worker = asyncio.create_task(_drain(_queue))
+
+
+async def stop() -> None:
+    """Write any queued entries and stop the worker."""
+    global _queue, _worker
+    if _worker is None:
+        return
+    queue, worker = _queue, _worker
+    _queue, _worker = None, None
+
+    if not worker.done():
+        try:
+            await asyncio.wait_for(queue.join(), _STOP_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.error(
+                "Timed out writing queued audit log entries; dropping %d",
+                queue.qsize()
+            )
+        worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
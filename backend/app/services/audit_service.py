@@ -1,17 +1,49 @@
 """Audit logging service for tracking user and admin actions."""
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
-from sqlalchemy import select
+from sqlalchemy import select, func
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models.audit_log import AuditLog
+from app.models.audit_log import AuditLog, AuditLogStatsSummary
 from app.models.user import User
+from app.services import audit_queue
+
+
+# Audit stats field -> action counted
+STATS_ACTIONS = {
+    "login_count": "LOGIN_SUCCESS",
+    "logout_count": "LOGOUT",
+    "user_create_count": "USER_CREATE",
+    "user_update_count": "USER_UPDATE",
+    "user_delete_count": "USER_DELETE",
+    "role_change_count": "ROLE_CHANGE",
+    "password_reset_count": "PASSWORD_RESET",
+    "vpn_request_success_count": "VPN_REQUEST_SUCCESS",
+    "vpn_request_failed_count": "VPN_REQUEST_FAILED",
+    "vpn_request_rate_limited_count": "VPN_REQUEST_RATE_LIMITED",
+}
+
+# Summary rows older than this are recomputed live
+STATS_MAX_AGE = timedelta(minutes=5)
+
+STATS_SUMMARY_ID = 1
 
 
 class AuditService:
     """Service for logging audit events."""
 
-    def __init__(self, session: AsyncSession):
-        """Initialize audit service."""
+    def __init__(self, session: AsyncSession, deferred: bool = False):
+        """
+        Initialize audit service.
+
+        Args:
+            session: Database session
+            deferred: Hand entries to the background audit queue instead of
+                committing them before returning. Falls back to a synchronous
+                write when the queue is unavailable or full.
+        """
         self.session = session
+        self.deferred = deferred
 
     async def log(
         self,
@@ -22,7 +54,7 @@ class AuditService:
         details: Optional[Dict[str, Any]] = None,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None
-    ) -> AuditLog:
+    ) -> Optional[AuditLog]:
         """
         Log an audit event.
 
@@ -36,12 +68,26 @@ class AuditService:
             user_agent: User agent string
 
         Returns:
-            Created AuditLog entry
+            Created AuditLog entry, or None if it was queued for the background writer
         """
         # Snapshot user identity so it survives user deletion
         # user_id=0 is the standalone _FakeAdminUser — not in the users table
         if user_id == 0:
             user_id = None
+
+        # Stamp the time now; the background writer may insert it later
+        if self.deferred and audit_queue.enqueue({
+            "created_at": datetime.now(timezone.utc),
+            "user_id": user_id,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "details": details,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+        }):
+            return None
+
         user_email = None
         user_name = None
         if user_id:
@@ -71,6 +117,78 @@ class AuditService:
 
         return audit_log
 
+    async def compute_stats(self) -> Dict[str, int]:
+        """
+        Compute audit log statistics from the audit_logs table.
+
+        Returns:
+            Dict with total_events, recent_24h and one count per STATS_ACTIONS field
+        """
+        twenty_four_hours_ago = datetime.now(timezone.utc) - timedelta(hours=24)
+
+        # One scan: each count is a filtered aggregate over the same rows
+        result = await self.session.execute(
+            select(
+                func.count().label("total_events"),
+                func.count().filter(AuditLog.created_at >= twenty_four_hours_ago).label("recent_24h"),
+                *(
+                    func.count().filter(AuditLog.action == action).label(field)
+                    for field, action in STATS_ACTIONS.items()
+                ),
+            )
+        )
+        return result.one()._asdict()
+
+    async def refresh_stats_summary(self) -> Dict[str, int]:
+        """
+        Recompute audit log statistics and store them in the summary row.
+
+        The row is written with one INSERT ... ON CONFLICT DO UPDATE, so
+        concurrent first refreshes from several schedulers do not collide.
+
+        Returns:
+            The stored statistics
+        """
+        stats = await self.compute_stats()
+        values = {"updated_at": datetime.now(timezone.utc), **stats}
+
+        connection = await self.session.connection()
+        insert = sqlite.insert if connection.dialect.name == "sqlite" else postgresql.insert
+        stmt = insert(AuditLogStatsSummary).values(id=STATS_SUMMARY_ID, **values)
+        await self.session.execute(stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={column: stmt.excluded[column] for column in values}
+        ))
+        await self.session.commit()
+        return stats
+
+    async def get_stats(self) -> Dict[str, int]:
+        """
+        Get audit log statistics.
+
+        Reads the summary row maintained by the audit stats refresh job and
+        falls back to a live computation when it is missing or older than
+        STATS_MAX_AGE (e.g. the scheduler is not running).
+
+        Returns:
+            Dict with total_events, recent_24h and one count per STATS_ACTIONS field
+        """
+        result = await self.session.execute(
+            select(AuditLogStatsSummary).where(AuditLogStatsSummary.id == STATS_SUMMARY_ID)
+        )
+        summary = result.scalar_one_or_none()
+        if summary is not None:
+            updated_at = summary.updated_at
+            if updated_at.tzinfo is None:
+                updated_at = updated_at.replace(tzinfo=timezone.utc)
+            if datetime.now(timezone.utc) - updated_at <= STATS_MAX_AGE:
+                return {
+                    field: getattr(summary, field)
+                    for field in ("total_events", "recent_24h", *STATS_ACTIONS)
+                }
+
+        return await self.compute_stats()
+
     async def log_login(
         self,
         user_id: int,
@@ -5,8 +5,9 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.config import get_settings
 from app.models.audit_log import AuditLog
@@ -281,25 +282,35 @@ class CPECertificateService:
         self, certificate_id: int, revoked_by_user_id: int, reason: str
     ) -> CPECertificate:
         """Revoke an issued certificate."""
-        cert = await self.session.get(CPECertificate, certificate_id)
-        if not cert:
-            raise ValueError(f"Certificate {certificate_id} not found")
-        if cert.status == CertificateStatus.REVOKED.value:
-            raise ValueError(f"Certificate {cert.certificate_number} is already revoked")
-
         # Snapshot revoker identity
         revoked_by = await self.session.get(User, revoked_by_user_id) if revoked_by_user_id else None
         revoked_by_name = (
             f"{revoked_by.first_name or ''} {revoked_by.last_name or ''}".strip() or None
         ) if revoked_by else None
 
-        cert.status = CertificateStatus.REVOKED.value
-        cert.revoked_at = datetime.now(timezone.utc)
-        cert.revoked_by_user_id = revoked_by_user_id
-        cert.revoked_by_name = revoked_by_name
-        cert.revocation_reason = reason
+        # Revoke only if not already revoked, in one atomic UPDATE
+        result = await self.session.execute(
+            update(CPECertificate)
+            .where(
+                CPECertificate.id == certificate_id,
+                CPECertificate.status != CertificateStatus.REVOKED.value,
+            )
+            .values(
+                status=CertificateStatus.REVOKED.value,
+                revoked_at=datetime.now(timezone.utc),
+                revoked_by_user_id=revoked_by_user_id,
+                revoked_by_name=revoked_by_name,
+                revocation_reason=reason,
+            )
+            .returning(CPECertificate)
+        )
+        cert = result.scalar_one_or_none()
+        if cert is None:
+            cert = await self.session.get(CPECertificate, certificate_id)
+            if not cert:
+                raise ValueError(f"Certificate {certificate_id} not found")
+            raise ValueError(f"Certificate {cert.certificate_number} is already revoked")
 
-        await self.session.flush()
         return cert
 
     async def regenerate_pdf(self, certificate_id: int) -> CPECertificate:
@@ -391,9 +402,10 @@ class CPECertificateService:
     async def get_certificates_for_event(
         self, event_id: int, status: Optional[str] = None
     ) -> list[CPECertificate]:
-        """Get all certificates for an event, optionally filtered by status."""
+        """Get all certificates for an event with their users, optionally filtered by status."""
         query = (
             select(CPECertificate)
+            .options(selectinload(CPECertificate.user))
             .where(CPECertificate.event_id == event_id)
             .order_by(CPECertificate.certificate_number)
         )
@@ -3,7 +3,7 @@ import uuid
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Dict, Any
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -29,7 +29,8 @@ class EmailQueueService:
         priority: int = 5,
         custom_vars: Optional[Dict[str, Any]] = None,
         scheduled_for: Optional[datetime] = None,
-        force: bool = False
+        force: bool = False,
+        user: Optional[User] = None
     ) -> EmailQueue:
         """
         Add an email to the queue for batched sending.
@@ -41,15 +42,17 @@ class EmailQueueService:
             custom_vars: Custom template variables
             scheduled_for: When to send the email (None = send ASAP)
             force: If True, bypass 24-hour duplicate check (but still check PENDING queue)
+            user: The already-loaded user for user_id, to skip looking it up
 
         Returns:
             Created EmailQueue entry
         """
         # Get user info (eager-load role_obj for email template rendering)
-        result = await self.session.execute(
-            select(User).options(selectinload(User.role_obj)).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
+        if user is None:
+            result = await self.session.execute(
+                select(User).options(selectinload(User.role_obj)).where(User.id == user_id)
+            )
+            user = result.scalar_one_or_none()
 
         if not user:
             raise ValueError(f"User {user_id} not found")
@@ -128,6 +131,67 @@ class EmailQueueService:
 
         return email_queue
 
+    async def enqueue_emails_bulk(
+        self,
+        users: List[User],
+        template_name: str,
+        priority: int = 5,
+        custom_vars: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Add the same email for many users to the queue in one INSERT.
+
+        Behaves like enqueue_email with force=True for each user: users who
+        already have this template PENDING are skipped, the 24-hour duplicate
+        check is bypassed. Unlike enqueue_email it does not commit, so the
+        caller can commit the emails together with its own writes.
+
+        Args:
+            users: Already-loaded recipients
+            template_name: Name of the email template
+            priority: Priority (lower number = higher priority, default=5)
+            custom_vars: Custom template variables, shared by every email
+
+        Returns:
+            Number of new queue entries created
+        """
+        if not users:
+            return 0
+
+        pending = await self.session.execute(
+            select(EmailQueue.user_id).where(
+                and_(
+                    EmailQueue.user_id.in_([user.id for user in users]),
+                    EmailQueue.template_name == template_name,
+                    EmailQueue.status == EmailQueueStatus.PENDING
+                )
+            )
+        )
+        pending_user_ids = set(pending.scalars().all())
+
+        rows = [
+            {
+                "user_id": user.id,
+                "template_name": template_name,
+                "recipient_email": user.email,
+                "recipient_name": f"{user.first_name} {user.last_name}",
+                "custom_vars": custom_vars,
+                "priority": priority,
+                "status": EmailQueueStatus.PENDING,
+            }
+            for user in users
+            if user.id not in pending_user_ids
+        ]
+        if rows:
+            await self.session.execute(insert(EmailQueue), rows)
+
+        logger.info(
+            f"Enqueued {len(rows)} NEW emails with template '{template_name}' "
+            f"[{len(pending_user_ids)} already pending, priority: {priority}]"
+        )
+
+        return len(rows)
+
     async def get_pending_emails(
         self,
         batch_size: int = 50,
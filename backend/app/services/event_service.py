@@ -1,14 +1,33 @@
 """Event service for managing events and participation tracking."""
 from datetime import datetime, timezone
-from typing import Optional, List, Tuple
-from sqlalchemy import select, func, and_
+from typing import NamedTuple, Optional, List, Tuple
+from sqlalchemy import select, func, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.api.utils import stats_cache
 from app.models.user import User
 from app.models.event import Event, EventParticipation, ParticipationStatus
 
 
+# Cross-request cache of the active event's id and name; event writes made
+# through this service (and the admin activation routes) drop it
+ACTIVE_EVENT_CACHE_KEY = "active_event_ref"
+ACTIVE_EVENT_CACHE_TTL = 30
+
+
+class ActiveEventRef(NamedTuple):
+    """Id and name of the active event."""
+
+    id: int
+    name: str
+
+
+def invalidate_active_event_cache() -> None:
+    """Drop the cached active event after events change."""
+    stats_cache.invalidate(ACTIVE_EVENT_CACHE_KEY)
+
+
 class EventService:
     """Service for managing events and participation."""
 
@@ -57,6 +76,46 @@ class EventService:
         )
         return result.scalar_one_or_none()
 
+    async def get_active_event_ref(self, verify: bool = False) -> Optional[ActiveEventRef]:
+        """
+        Get the id and name of the active event, cached across requests.
+
+        Cached for ACTIVE_EVENT_CACHE_TTL seconds. Event changes made in this
+        process drop the cache immediately, others within the TTL. Callers
+        that write rows against the event pass verify, which re-checks the
+        cached id is still active and reloads it when not.
+
+        Args:
+            verify: Confirm the cached event is still active (one indexed lookup)
+
+        Returns:
+            ActiveEventRef, or None if no event is active
+        """
+        async def load() -> Optional[ActiveEventRef]:
+            result = await self.session.execute(
+                select(Event.id, Event.name)
+                .where(Event.is_active == True)
+                .order_by(Event.year.desc())
+                .limit(1)
+            )
+            row = result.first()
+            return ActiveEventRef(*row) if row else None
+
+        ref = await stats_cache.cached(ACTIVE_EVENT_CACHE_KEY, ACTIVE_EVENT_CACHE_TTL, load)
+        if not verify:
+            return ref
+
+        # Another worker may have switched the active event since it was cached
+        if ref is not None:
+            result = await self.session.execute(
+                select(Event.id).where(Event.id == ref.id, Event.is_active == True)
+            )
+            if result.first() is not None:
+                return ref
+
+        invalidate_active_event_cache()
+        return await stats_cache.cached(ACTIVE_EVENT_CACHE_KEY, ACTIVE_EVENT_CACHE_TTL, load)
+
     async def get_event(self, event_id: int) -> Optional[Event]:
         """Get an event by ID."""
         result = await self.session.execute(
@@ -80,13 +139,31 @@ class EventService:
         if not event:
             return None
 
+        await self.apply_updates(event, **kwargs)
+        await self.session.refresh(event)
+        return event
+
+    async def apply_updates(self, event: Event, **kwargs) -> Event:
+        """
+        Apply field updates to an already loaded event and commit.
+
+        Unlike update_event, this neither re-selects nor refreshes the event,
+        so callers that already hold it pay only for the UPDATE.
+
+        Args:
+            event: Event to update
+            **kwargs: Fields to update
+
+        Returns:
+            The updated event
+        """
         # Update allowed fields
         for key, value in kwargs.items():
             if hasattr(event, key):
                 setattr(event, key, value)
 
         await self.session.commit()
-        await self.session.refresh(event)
+        invalidate_active_event_cache()
         return event
 
     async def list_events(self, include_archived: bool = False) -> List[Event]:
@@ -143,6 +220,7 @@ class EventService:
         event = Event(**kwargs)
         self.session.add(event)
         await self.session.commit()
+        invalidate_active_event_cache()
         await self.session.refresh(event)
         return event
 
@@ -162,6 +240,7 @@ class EventService:
 
         await self.session.delete(event)
         await self.session.commit()
+        invalidate_active_event_cache()
         return True
 
     async def deactivate_other_events(self, except_event_id: int) -> None:
@@ -177,6 +256,21 @@ class EventService:
             .values(is_active=False)
         )
 
+    async def activate_event(self, event_id: int) -> None:
+        """
+        Make an event the only active event.
+
+        One UPDATE sets is_active = (id = event_id) on every event, so the
+        event is activated and all others deactivated in a single statement.
+        Loaded Event objects are updated in place. Does not commit.
+
+        Args:
+            event_id: ID of the event to activate
+        """
+        await self.session.execute(
+            update(Event).values(is_active=(Event.id == event_id))
+        )
+
     async def get_event_statistics(self, event_id: int) -> dict:
         """
         Get participation statistics for an event.
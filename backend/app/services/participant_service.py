@@ -3,8 +3,8 @@ import secrets
 import string
 import logging
 from datetime import datetime, timezone
-from typing import Optional, List, Tuple
-from sqlalchemy import select, func, or_, delete, update
+from typing import Callable, Optional, List, Tuple
+from sqlalchemy import select, func, or_, delete, update, exists, inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -17,6 +17,7 @@ from app.services.email_queue_service import EmailQueueService
 from fastapi import HTTPException
 from app.api.utils.validation import normalize_email
 from app.config import get_settings
+from app.api.exceptions import not_found
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,15 @@ class ParticipantService:
     # Email statuses that should NOT receive emails
     BLOCKED_EMAIL_STATUSES = {'BOUNCED', 'SPAM_REPORTED', 'UNSUBSCRIBED'}
 
+    # Relationships read when building participant responses. Loading them
+    # up front avoids per-row lazy loads (which fail outright under asyncio).
+    PARTICIPANT_LOAD_OPTIONS = (
+        selectinload(User.sponsor),
+        selectinload(User.event_participations),
+        selectinload(User.role_obj),
+    )
+    PARTICIPANT_RELATIONSHIPS = ("sponsor", "event_participations", "role_obj")
+
     def __init__(self, session: AsyncSession):
         """Initialize participant service."""
         self.session = session
@@ -41,16 +51,76 @@ class ParticipantService:
         return email_status not in self.BLOCKED_EMAIL_STATUSES
 
     async def get_participant(self, participant_id: int) -> Optional[User]:
-        """Get a participant by ID with sponsor and participation relationships loaded."""
-        result = await self.session.execute(
-            select(User)
-            .options(
-                selectinload(User.sponsor),
-                selectinload(User.event_participations)
-            )
-            .where(User.id == participant_id)
+        """
+        Get a participant by ID with sponsor and participation relationships loaded.
+
+        Uses session.get() so a participant already in the session's identity
+        map is returned without a SELECT. An instance loaded earlier without
+        the eager options gets its missing relationships loaded.
+        """
+        participant = await self.session.get(
+            User, participant_id, options=self.PARTICIPANT_LOAD_OPTIONS
         )
-        return result.scalar_one_or_none()
+        if participant is not None:
+            await self.load_relationships(participant)
+        return participant
+
+    async def load_relationships(self, participant: User) -> None:
+        """
+        Load any PARTICIPANT_RELATIONSHIPS not yet loaded on a participant.
+
+        Missing relationships are lazy-loaded inside run_sync, where implicit
+        IO is allowed. Re-selecting with the eager options does not fill
+        relationships expired by an earlier refresh(), and refresh() itself
+        leaves many-to-one relationships such as sponsor unloaded.
+
+        Expired column attributes are reloaded as well: an UPDATE flush expires
+        server-generated columns such as updated_at, and session.get() returns
+        an identity-map hit without reloading them.
+        """
+        state = inspect(participant)
+        unloaded = state.unloaded
+        missing = [name for name in self.PARTICIPANT_RELATIONSHIPS if name in unloaded]
+        expired_columns = state.expired_attributes.intersection(state.mapper.column_attrs.keys())
+
+        def load(_):
+            # Touching one expired column loads every expired column in one SELECT
+            if expired_columns:
+                getattr(participant, next(iter(expired_columns)))
+            for name in missing:
+                getattr(participant, name)
+
+        if missing or expired_columns:
+            await self.session.run_sync(load)
+
+    async def get_participant_for(
+        self,
+        current_user: User,
+        participant_id: int,
+        check: Callable[[User, User], None],
+    ) -> User:
+        """
+        Get a participant and check the current user may act on them.
+
+        Args:
+            current_user: User making the request
+            participant_id: Participant ID
+            check: Permission check called as check(current_user, participant),
+                e.g. permissions.can_edit_participant
+
+        Returns:
+            Participant with response relationships loaded
+
+        Raises:
+            HTTPException: 404 if the participant doesn't exist, 403 if the
+                permission check fails
+        """
+        participant = await self.get_participant(participant_id)
+        if participant is None:
+            raise not_found("Participant")
+
+        check(current_user, participant)
+        return participant
 
     async def get_sponsor(self, sponsor_id: int) -> Optional[User]:
         """Get a sponsor by ID (must be admin or sponsor role)."""
@@ -70,6 +140,25 @@ class ParticipantService:
         )
         return result.scalar_one_or_none()
 
+    async def email_exists(self, email: str, exclude_id: Optional[int] = None) -> bool:
+        """
+        Check whether any user has this email (case-insensitive, Gmail alias aware).
+
+        Runs an EXISTS probe instead of loading the row, for uniqueness checks
+        that only need a yes/no answer.
+
+        Args:
+            email: Email address to check
+            exclude_id: User ID to ignore (the user being updated)
+
+        Returns:
+            True if another user already has the email
+        """
+        condition = User.email_normalized == normalize_email(email)
+        if exclude_id is not None:
+            condition = condition & (User.id != exclude_id)
+        return bool(await self.session.scalar(select(exists().where(condition))))
+
     _GROUPABLE_PARTICIPANT_COLUMNS = {"sponsor_id", "confirmed", "role_id", "country"}
 
     async def list_participants(
@@ -103,10 +192,7 @@ class ParticipantService:
             Tuple of (list of users, total count)
         """
         # Build base query with sponsor and participation relationships loaded
-        query = select(User).options(
-            selectinload(User.sponsor),
-            selectinload(User.event_participations)
-        )
+        query = select(User).options(*self.PARTICIPANT_LOAD_OPTIONS)
         count_query = select(func.count(User.id))
 
         # Filter by sponsor if provided (for sponsor role users)
@@ -205,17 +291,15 @@ class ParticipantService:
         result = await self.session.execute(query)
         participants = result.scalars().all()
 
-        # Filter by VPN status if needed (requires join)
-        if has_vpn is not None:
-            filtered = []
-            for p in participants:
-                vpn_result = await self.session.execute(
-                    select(VPNCredential).where(VPNCredential.assigned_to_user_id == p.id)
-                )
-                vpn = vpn_result.scalar_one_or_none()
-                if (has_vpn and vpn) or (not has_vpn and not vpn):
-                    filtered.append(p)
-            participants = filtered
+        # Filter by VPN status if needed (one lookup for the whole page)
+        if has_vpn is not None and participants:
+            vpn_result = await self.session.execute(
+                select(VPNCredential.assigned_to_user_id)
+                .where(VPNCredential.assigned_to_user_id.in_([p.id for p in participants]))
+                .distinct()
+            )
+            users_with_vpn = set(vpn_result.scalars().all())
+            participants = [p for p in participants if (p.id in users_with_vpn) == has_vpn]
 
         return list(participants), total
 
@@ -693,35 +777,35 @@ class ParticipantService:
 
     async def bulk_activate(self, participant_ids: List[int]) -> Tuple[int, List[int]]:
         """Activate multiple participants."""
-        success_count = 0
-        failed_ids = []
-
-        for pid in participant_ids:
-            participant = await self.get_participant(pid)
-            if participant:
-                participant.is_active = True
-                success_count += 1
-            else:
-                failed_ids.append(pid)
-
-        await self.session.commit()
-        return success_count, failed_ids
+        return await self._bulk_set_active(participant_ids, True)
 
     async def bulk_deactivate(self, participant_ids: List[int]) -> Tuple[int, List[int]]:
         """Deactivate multiple participants."""
-        success_count = 0
-        failed_ids = []
-
-        for pid in participant_ids:
-            participant = await self.get_participant(pid)
-            if participant:
-                participant.is_active = False
-                success_count += 1
-            else:
-                failed_ids.append(pid)
+        return await self._bulk_set_active(participant_ids, False)
 
+    async def _bulk_set_active(
+        self, participant_ids: List[int], is_active: bool
+    ) -> Tuple[int, List[int]]:
+        """
+        Set is_active for many participants with one UPDATE ... RETURNING.
+
+        Returns:
+            Tuple of (number of participants updated, IDs that don't exist)
+        """
+        if not participant_ids:
+            return 0, []
+
+        result = await self.session.execute(
+            update(User)
+            .where(User.id.in_(participant_ids))
+            .values(is_active=is_active)
+            .returning(User.id)
+        )
+        updated = set(result.scalars().all())
         await self.session.commit()
-        return success_count, failed_ids
+
+        failed_ids = [pid for pid in participant_ids if pid not in updated]
+        return len(updated), failed_ids
 
     async def get_statistics(self, sponsor_id: Optional[int] = None) -> dict:
         """
@@ -1152,10 +1236,7 @@ class ParticipantService:
         """Get all users who can be sponsors (admins and sponsors)."""
         result = await self.session.execute(
             select(User)
-            .options(
-                selectinload(User.sponsor),
-                selectinload(User.event_participations)
-            )
+            .options(*self.PARTICIPANT_LOAD_OPTIONS)
             .where(User.role.in_([UserRole.ADMIN.value, UserRole.SPONSOR.value]))
             .order_by(User.last_name, User.first_name)
         )
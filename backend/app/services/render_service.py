@@ -17,6 +17,9 @@ logger = logging.getLogger(__name__)
 
 RENDER_API_BASE = "https://api.render.com/v1"
 
+# Seconds Gotenberg stays up after its last user releases it
+GOTENBERG_IDLE_STOP_SECONDS = 30
+
 
 class RenderServiceManager:
     """Manages sidecar services on Render via their API."""
@@ -484,3 +487,77 @@ class RenderServiceManager:
             else:
                 logger.error(f"Failed to update env vars for {service_id}: {resp.status_code} {resp.text}")
                 return False
+
+
+class GotenbergLease:
+    """Process-wide reference count on the Gotenberg service.
+
+    The first concurrent holder starts Gotenberg, later holders reuse it,
+    and when the last one releases it a stop is scheduled after
+    GOTENBERG_IDLE_STOP_SECONDS, so bursts of PDF work share one start.
+
+    Usage:
+        async with GotenbergLease(render) as ready:
+            ...
+    """
+
+    _count = 0
+    _running = False
+    _lock: Optional[asyncio.Lock] = None
+    _stop_task: Optional[asyncio.Task] = None
+
+    def __init__(self, render: RenderServiceManager):
+        self.render = render
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    async def __aenter__(self) -> bool:
+        """Take a reference, starting Gotenberg if needed. Returns True if ready."""
+        if not self.render.enabled:
+            return True
+
+        cls = type(self)
+        async with cls._get_lock():
+            if cls._stop_task is not None:
+                cls._stop_task.cancel()
+                cls._stop_task = None
+            cls._count += 1
+            if not cls._running:
+                try:
+                    cls._running = await self.render.start_gotenberg()
+                except BaseException:
+                    # __aexit__ is not called when __aenter__ raises, so give
+                    # the reference back here or Gotenberg is never stopped.
+                    self._release()
+                    raise
+            return cls._running
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Drop a reference; the last one schedules the idle stop.
+
+        Never awaits, so a response is not held up by a start in progress
+        elsewhere or by the Render API; the stop runs in a background task.
+        """
+        if not self.render.enabled:
+            return
+
+        self._release()
+
+    def _release(self) -> None:
+        cls = type(self)
+        cls._count -= 1
+        if cls._count == 0:
+            cls._stop_task = asyncio.create_task(self._stop_when_idle())
+
+    async def _stop_when_idle(self) -> None:
+        await asyncio.sleep(GOTENBERG_IDLE_STOP_SECONDS)
+        cls = type(self)
+        async with cls._get_lock():
+            if cls._count == 0:
+                cls._stop_task = None
+                cls._running = False
+                await self.render.stop_gotenberg()
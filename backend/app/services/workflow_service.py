@@ -26,7 +26,8 @@ class WorkflowService:
         trigger_event: str,
         user_id: int,
         custom_vars: Optional[Dict[str, Any]] = None,
-        force: bool = False
+        force: bool = False,
+        user: Optional[User] = None
     ) -> int:
         """
         Trigger all enabled workflows for a specific event.
@@ -36,6 +37,7 @@ class WorkflowService:
             user_id: ID of the user to send email to
             custom_vars: Additional custom variables to pass to email template
             force: If True, bypass 24-hour duplicate check in email queue
+            user: The already-loaded user for user_id, to skip looking it up
 
         Returns:
             Number of emails queued
@@ -62,10 +64,11 @@ class WorkflowService:
         active_event = event_result.scalar_one_or_none()
 
         # Get user to check if they're a sponsor
-        user_result = await self.session.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = user_result.scalar_one_or_none()
+        if user is None:
+            user_result = await self.session.execute(
+                select(User).where(User.id == user_id)
+            )
+            user = user_result.scalar_one_or_none()
 
         # TEST MODE RESTRICTION: Skip workflow if test mode is enabled and user is not a sponsor
         if active_event and active_event.test_mode:
@@ -134,7 +137,8 @@ class WorkflowService:
                         priority=workflow.priority,
                         custom_vars=merged_vars,
                         scheduled_for=scheduled_for,
-                        force=force
+                        force=force,
+                        user=user
                     )
 
                 # Audit log the workflow trigger
@@ -10,6 +10,7 @@ from app.tasks.instance_status_sync import instance_status_sync_job
 from app.tasks.license_slot_reaper import license_slot_reaper_job
 from app.tasks.keycloak_sync import keycloak_sync_job
 from app.tasks.agent_task_timeout import agent_task_timeout_job
+from app.tasks.audit_stats import audit_stats_refresh_job
 
 __all__ = [
     "get_scheduler",
@@ -21,4 +22,5 @@ __all__ = [
     "license_slot_reaper_job",
     "keycloak_sync_job",
     "agent_task_timeout_job",
+    "audit_stats_refresh_job",
 ]
@@ -0,0 +1,42 @@
+"""Audit stats refresh background job - precomputes audit log statistics."""
+import logging
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.database import AsyncSessionLocal
+from app.services.audit_service import AuditService
+
+
+logger = logging.getLogger(__name__)
+
+
+async def audit_stats_refresh_job():
+    """
+    Recompute audit log statistics into the audit_log_stats_summary row.
+
+    The admin stats endpoint reads that row instead of scanning audit_logs
+    on every dashboard poll.
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            stats = await AuditService(session).refresh_stats_summary()
+            logger.debug("Audit stats refreshed: %d total events", stats["total_events"])
+
+    except Exception as e:
+        logger.error("Audit stats refresh job failed: %s", e)
+
+
+def schedule_audit_stats_refresh_job(scheduler: AsyncIOScheduler):
+    """Register the audit stats refresh job with the scheduler."""
+    scheduler.add_job(
+        audit_stats_refresh_job,
+        'interval',
+        seconds=60,
+        id='audit_stats_refresh',
+        name='Audit Stats Refresh',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+
+    logger.info("Scheduled audit stats refresh job to run every 60 seconds")
@@ -59,6 +59,7 @@ async def start_scheduler():
     from app.tasks.vpn_import_cleanup import schedule_vpn_import_cleanup_job
     from app.tasks.vpn_delete import schedule_vpn_delete_job
     from app.tasks.vpn_delete_cleanup import schedule_vpn_delete_cleanup_job
+    from app.tasks.audit_stats import schedule_audit_stats_refresh_job
 
     sched = get_scheduler()
 
@@ -79,6 +80,7 @@ async def start_scheduler():
     schedule_vpn_import_cleanup_job(sched)
     schedule_vpn_delete_job(sched)
     schedule_vpn_delete_cleanup_job(sched)
+    schedule_audit_stats_refresh_job(sched)
 
     # Register status heartbeat job (updates database every 60 seconds)
     sched.add_job(
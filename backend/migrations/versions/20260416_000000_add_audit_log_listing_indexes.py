@@ -0,0 +1,63 @@
+"""Add composite indexes for the admin audit log listing.
+
+The listing orders by (created_at DESC, id DESC), optionally filtered by
+action, and pages either by OFFSET or by a (created_at, id) keyset cursor.
+Matching composite indexes let PostgreSQL read a page straight off the
+index in order instead of sorting every matching row. A partial index
+covers the VPN_REQUEST* events, a small slice of the table. The indexes
+are built CONCURRENTLY so writes to audit_logs are not blocked.
+
+Revision ID: 20260416_000000
+Revises: 20260415_010000
+Create Date: 2026-04-16 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260416_000000"
+down_revision = "20260415_010000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_logs_created_at_id",
+            "audit_logs",
+            [sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_audit_logs_action_created_at_id",
+            "audit_logs",
+            ["action", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_audit_logs_vpn_requests",
+            "audit_logs",
+            ["user_id", sa.text("created_at DESC")],
+            postgresql_where=sa.text("action LIKE 'VPN_REQUEST%'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_audit_logs_vpn_requests",
+            table_name="audit_logs",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_audit_logs_action_created_at_id",
+            table_name="audit_logs",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_audit_logs_created_at_id",
+            table_name="audit_logs",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,49 @@
+"""Add audit_log_stats_summary table.
+
+Holds one precomputed row of admin audit log statistics, refreshed by the
+audit_stats_refresh scheduler job, so the stats endpoint reads a single row
+instead of aggregating audit_logs on every poll.
+
+Revision ID: 20260416_010000
+Revises: 20260416_000000
+Create Date: 2026-04-16 01:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260416_010000"
+down_revision = "20260416_000000"
+branch_labels = None
+depends_on = None
+
+_COUNT_COLUMNS = (
+    "total_events",
+    "login_count",
+    "logout_count",
+    "user_create_count",
+    "user_update_count",
+    "user_delete_count",
+    "role_change_count",
+    "password_reset_count",
+    "vpn_request_success_count",
+    "vpn_request_failed_count",
+    "vpn_request_rate_limited_count",
+    "recent_24h",
+)
+
+
+def upgrade():
+    op.create_table(
+        "audit_log_stats_summary",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        *(
+            sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+            for name in _COUNT_COLUMNS
+        ),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("audit_log_stats_summary")
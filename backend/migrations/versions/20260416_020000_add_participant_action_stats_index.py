@@ -0,0 +1,39 @@
+"""Add covering index for participant action statistics.
+
+get_action_statistics groups participant_actions by (batch_id,
+action_type, title), takes min(created_at) and counts rows per status,
+optionally filtered by event_id and action_type. Keying on those columns
+with INCLUDE (created_at, title) lets PostgreSQL answer it from the
+index alone. The index is built CONCURRENTLY so writes are not blocked.
+
+Revision ID: 20260416_020000
+Revises: 20260416_010000
+Create Date: 2026-04-16 02:00:00
+"""
+from alembic import op
+
+
+revision = "20260416_020000"
+down_revision = "20260416_010000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_participant_actions_stats",
+            "participant_actions",
+            ["event_id", "action_type", "batch_id", "status"],
+            postgresql_include=["created_at", "title"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_participant_actions_stats",
+            table_name="participant_actions",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,40 @@
+"""Add partial index for active event lookups.
+
+Active event lookups filter events by is_active and order by year DESC.
+A partial index holding only the active rows serves them directly,
+whatever the size of the event history. It is not unique: activate_event
+flips is_active on two rows in one UPDATE, and PostgreSQL checks unique
+indexes row by row.
+
+Revision ID: 20260416_040000
+Revises: 20260416_020000
+Create Date: 2026-04-16 04:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260416_040000"
+down_revision = "20260416_020000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_events_active_year",
+            "events",
+            [sa.text("year DESC")],
+            postgresql_where=sa.text("is_active"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_events_active_year",
+            table_name="events",
+            postgresql_concurrently=True,
+        )
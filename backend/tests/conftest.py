@@ -29,6 +29,7 @@ from app.config import Settings, get_settings
 from app.utils.security import hash_password
 from app.utils.encryption import init_encryptor, generate_encryption_key
 from app.api.utils.validation import normalize_email
+from app.api.utils import stats_cache
 
 
 # ============================================================================
@@ -124,6 +125,19 @@ async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
+@pytest.fixture(autouse=True)
+def clear_stats_cache():
+    """
+    Start and end every test with an empty stats cache.
+
+    The cache is process-global, so cached totals, stats and the active
+    event ref would otherwise leak between tests.
+    """
+    stats_cache.clear()
+    yield
+    stats_cache.clear()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def client(async_engine, db_session: AsyncSession, test_settings: Settings) -> AsyncGenerator[AsyncClient, None]:
     """
@@ -139,7 +153,7 @@ async def client(async_engine, db_session: AsyncSession, test_settings: Settings
 
     # Clear rate limit cache for tests
     from app.api.routes import auth
-    auth._login_rate_limit_cache.clear()
+    auth._rate_limit_cache.clear()
 
     # Override database session dependency to return THE SAME session
     # This is critical - we can't create new sessions or the data won't be visible
@@ -180,7 +194,7 @@ async def client(async_engine, db_session: AsyncSession, test_settings: Settings
     app.dependency_overrides.clear()
 
     # Clear rate limit cache after test
-    auth._login_rate_limit_cache.clear()
+    auth._rate_limit_cache.clear()
 
 
 # ============================================================================
@@ -0,0 +1,379 @@
+"""Unit tests for admin participant action routes.
+
+Tests bulk action creation and listing against the in-memory test database.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.routes.admin_actions import (
+    ActionResponse,
+    BulkActionAssign,
+    BulkActionCreate,
+    BulkActionRevoke,
+    assign_action_to_participants,
+    create_bulk_action,
+    get_action_statistics,
+    list_actions,
+    revoke_actions,
+)
+from app.models.email_queue import EmailQueue
+from app.models.email_template import EmailTemplate
+from app.models.email_workflow import WorkflowTriggerEvent
+from app.models.participant_action import ActionStatus, ActionType, ParticipantAction
+
+
+@pytest.fixture(autouse=True)
+def session_factory(async_engine, mocker):
+    """Point per-task notification sessions at the test database."""
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    mocker.patch("app.api.routes.admin_actions.AsyncSessionLocal", factory)
+    return factory
+
+
+def _bulk_action(user_ids, **overrides):
+    """Build a bulk action request for the given users."""
+    data = dict(
+        action_type=ActionType.SURVEY_COMPLETION.value,
+        title="Complete the survey",
+        user_ids=user_ids,
+    )
+    data.update(overrides)
+    return BulkActionCreate(**data)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCreateBulkAction:
+    """Test bulk action creation."""
+
+    async def test_creates_actions_and_notifies(
+        self, db_session, admin_user, invitee_user, sponsor_user, active_event, mocker
+    ):
+        """Test one action per user, notified with the already-loaded user."""
+        trigger = mocker.patch(
+            "app.api.routes.admin_actions.WorkflowService.trigger_workflow", return_value=1
+        )
+
+        response = await create_bulk_action(
+            data=_bulk_action([invitee_user.id, sponsor_user.id]),
+            db=db_session,
+            current_user=admin_user,
+        )
+
+        assert response["actions_created"] == 2
+        result = await db_session.execute(select(ParticipantAction))
+        actions = result.scalars().all()
+        assert {a.user_id for a in actions} == {invitee_user.id, sponsor_user.id}
+        assert all(a.notification_sent for a in actions)
+        notified = {call.kwargs["user_id"]: call.kwargs["user"] for call in trigger.call_args_list}
+        assert notified == {invitee_user.id: invitee_user, sponsor_user.id: sponsor_user}
+        assert {call.kwargs["trigger_event"] for call in trigger.call_args_list} == {
+            WorkflowTriggerEvent.ACTION_ASSIGNED_SURVEY_COMPLETION
+        }
+
+    async def test_failed_trigger_leaves_action_unflagged(
+        self, db_session, admin_user, invitee_user, sponsor_user, active_event, mocker
+    ):
+        """Test concurrent triggers flag only the actions that were notified."""
+        async def trigger(**kwargs):
+            if kwargs["user_id"] == sponsor_user.id:
+                raise RuntimeError("smtp down")
+            return 1
+
+        mocker.patch(
+            "app.api.routes.admin_actions.WorkflowService.trigger_workflow", side_effect=trigger
+        )
+
+        response = await create_bulk_action(
+            data=_bulk_action([invitee_user.id, sponsor_user.id]),
+            db=db_session,
+            current_user=admin_user,
+        )
+
+        assert response["actions_created"] == 2
+        result = await db_session.execute(
+            select(ParticipantAction.user_id, ParticipantAction.notification_sent)
+        )
+        assert sorted(result.all()) == sorted(
+            [(invitee_user.id, True), (sponsor_user.id, False)]
+        )
+
+    async def test_template_notifications_queue_in_bulk(
+        self, db_session, admin_user, invitee_user, sponsor_user, active_event
+    ):
+        """Test a custom template queues one email per recipient."""
+        template = EmailTemplate(
+            name="action_custom",
+            display_name="Action",
+            subject="Action Required",
+            html_content="<p>Action</p>",
+        )
+        db_session.add(template)
+        await db_session.commit()
+
+        await create_bulk_action(
+            data=_bulk_action(
+                [invitee_user.id, sponsor_user.id], email_template_id=template.id
+            ),
+            db=db_session,
+            current_user=admin_user,
+        )
+
+        result = await db_session.execute(
+            select(EmailQueue.user_id, EmailQueue.custom_vars)
+            .where(EmailQueue.template_name == "action_custom")
+        )
+        rows = result.all()
+        assert {user_id for user_id, _ in rows} == {invitee_user.id, sponsor_user.id}
+        assert all(v["event_name"] == active_event.name for _, v in rows)
+        result = await db_session.execute(select(ParticipantAction.notification_sent))
+        assert all(result.scalars().all())
+
+    async def test_large_batch_uses_copy_on_postgresql(
+        self, db_session, admin_user, invitee_user, active_event, mocker
+    ):
+        """Test large batches go through COPY and read their ids back by batch."""
+        mocker.patch("app.api.routes.admin_actions._COPY_THRESHOLD", 1)
+        real_connection = await db_session.connection()
+
+        async def copy_records_to_table(table, records, columns):
+            await real_connection.execute(
+                insert(ParticipantAction), [dict(zip(columns, record, strict=True)) for record in records]
+            )
+
+        driver = MagicMock(copy_records_to_table=AsyncMock(side_effect=copy_records_to_table))
+        connection = MagicMock()
+        connection.dialect.name = "postgresql"
+        connection.get_raw_connection = AsyncMock(return_value=MagicMock(driver_connection=driver))
+        mocker.patch.object(db_session, "connection", AsyncMock(return_value=connection))
+
+        response = await create_bulk_action(
+            data=_bulk_action([invitee_user.id], send_notification=False),
+            db=db_session,
+            current_user=admin_user,
+        )
+
+        assert response["actions_created"] == 1
+        assert driver.copy_records_to_table.await_args.args == ("participant_actions",)
+        result = await db_session.execute(select(ParticipantAction))
+        action = result.scalar_one()
+        assert (action.user_id, action.notification_sent) == (invitee_user.id, False)
+
+    async def test_duplicate_user_ids_create_one_action_each(
+        self, db_session, admin_user, invitee_user, active_event
+    ):
+        """Test a user listed twice gets a single action."""
+        response = await create_bulk_action(
+            data=_bulk_action([invitee_user.id, invitee_user.id], send_notification=False),
+            db=db_session,
+            current_user=admin_user,
+        )
+
+        assert response["actions_created"] == 1
+
+    async def test_empty_user_ids_targets_confirmed_participants(
+        self, db_session, admin_user, invitee_user, sponsor_user, active_event
+    ):
+        """Test an empty selection targets the event's confirmed participants only."""
+        from app.models.event import EventParticipation, ParticipationStatus
+
+        db_session.add_all([
+            EventParticipation(
+                user_id=invitee_user.id, event_id=active_event.id,
+                status=ParticipationStatus.CONFIRMED.value,
+            ),
+            EventParticipation(
+                user_id=sponsor_user.id, event_id=active_event.id,
+                status=ParticipationStatus.DECLINED.value,
+            ),
+        ])
+        await db_session.commit()
+
+        response = await create_bulk_action(
+            data=_bulk_action([], send_notification=False),
+            db=db_session,
+            current_user=admin_user,
+        )
+
+        assert response["actions_created"] == 1
+        result = await db_session.execute(select(ParticipantAction.user_id))
+        assert result.scalars().all() == [invitee_user.id]
+
+    async def test_assign_adds_only_new_users(
+        self, db_session, admin_user, invitee_user, sponsor_user, active_event, mocker
+    ):
+        """Test assigning a batch skips users who already have it."""
+        mocker.patch(
+            "app.api.routes.admin_actions.WorkflowService.trigger_workflow", return_value=1
+        )
+        await create_bulk_action(
+            data=_bulk_action([invitee_user.id], send_notification=False),
+            db=db_session,
+            current_user=admin_user,
+        )
+        result = await db_session.execute(select(ParticipantAction.batch_id))
+        batch_id = result.scalar_one()
+
+        response = await assign_action_to_participants(
+            data=BulkActionAssign(batch_id=batch_id, user_ids=[invitee_user.id, sponsor_user.id]),
+            db=db_session,
+            current_user=admin_user,
+        )
+
+        assert response["actions_created"] == 1
+        result = await db_session.execute(
+            select(ParticipantAction.user_id, ParticipantAction.notification_sent)
+            .where(ParticipantAction.batch_id == batch_id)
+        )
+        assert sorted(result.all()) == sorted(
+            [(invitee_user.id, False), (sponsor_user.id, True)]
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRevokeActions:
+    """Test revoking a batch of actions."""
+
+    async def test_revokes_only_pending_actions(
+        self, db_session, admin_user, invitee_user, sponsor_user, active_event
+    ):
+        """Test pending actions in the batch are cancelled and others left alone."""
+        db_session.add_all([
+            ParticipantAction(
+                user_id=invitee_user.id, event_id=active_event.id, batch_id="action_batch1",
+                action_type=ActionType.SURVEY_COMPLETION.value, title="Survey",
+            ),
+            ParticipantAction(
+                user_id=sponsor_user.id, event_id=active_event.id, batch_id="action_batch1",
+                action_type=ActionType.SURVEY_COMPLETION.value, title="Survey",
+                status=ActionStatus.CONFIRMED.value,
+            ),
+        ])
+        await db_session.commit()
+
+        response = await revoke_actions(
+            data=BulkActionRevoke(batch_id="action_batch1"), db=db_session, current_user=admin_user
+        )
+
+        assert response["actions_revoked"] == 1
+        result = await db_session.execute(
+            select(ParticipantAction.user_id, ParticipantAction.status, ParticipantAction.response_note)
+        )
+        assert sorted(result.all()) == sorted([
+            (invitee_user.id, ActionStatus.CANCELLED.value, f"Revoked by admin {admin_user.email}"),
+            (sponsor_user.id, ActionStatus.CONFIRMED.value, None),
+        ])
+
+    async def test_nothing_pending(self, db_session, admin_user):
+        """Test a batch with no pending actions revokes nothing."""
+        response = await revoke_actions(
+            data=BulkActionRevoke(batch_id="missing"), db=db_session, current_user=admin_user
+        )
+
+        assert response["actions_revoked"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestActionStatistics:
+    """Test per-batch action statistics."""
+
+    async def test_counts_per_status(self, db_session, admin_user, invitee_user, active_event):
+        """Test each batch reports its total and per-status counts."""
+        statuses = [
+            ActionStatus.CONFIRMED, ActionStatus.CONFIRMED, ActionStatus.DECLINED,
+            ActionStatus.PENDING, ActionStatus.CANCELLED,
+        ]
+        for status in statuses:
+            db_session.add(ParticipantAction(
+                user_id=invitee_user.id,
+                event_id=active_event.id,
+                batch_id="action_batch1",
+                action_type=ActionType.SURVEY_COMPLETION.value,
+                title="Survey",
+                status=status.value,
+            ))
+        await db_session.commit()
+
+        response = await get_action_statistics(
+            event_id=active_event.id, action_type=None, db=db_session, current_user=admin_user
+        )
+
+        [row] = orjson.loads(response.body)
+
+        assert set(row) == {
+            "batch_id", "action_type", "title", "created_at",
+            "total", "confirmed", "declined", "pending", "cancelled",
+        }
+        assert row["batch_id"] == "action_batch1"
+        assert (row["total"], row["confirmed"], row["declined"], row["pending"], row["cancelled"]) == (
+            5, 2, 1, 1, 1
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestListActions:
+    """Test participant action listing."""
+
+    async def test_lists_actions_with_user_info(
+        self, db_session, admin_user, invitee_user, active_event
+    ):
+        """Test actions list the live user's details, or the snapshot once deleted."""
+        db_session.add_all([
+            ParticipantAction(
+                user_id=invitee_user.id, event_id=active_event.id,
+                action_type=ActionType.SURVEY_COMPLETION.value, title="Survey",
+            ),
+            ParticipantAction(
+                user_id=None, user_email="gone@example.com", user_name="Gone User",
+                event_id=active_event.id,
+                action_type=ActionType.SURVEY_COMPLETION.value, title="Survey",
+            ),
+        ])
+        await db_session.commit()
+
+        response = await list_actions(
+            event_id=active_event.id, action_type=None, status=None,
+            after_id=None, limit=None, db=db_session, current_user=admin_user,
+        )
+
+        items = orjson.loads(response.body)
+        assert all(set(item) == set(ActionResponse.model_fields) for item in items)
+        by_email = {item["user_email"]: item for item in items}
+        assert by_email[invitee_user.email]["user_name"] == (
+            f"{invitee_user.first_name} {invitee_user.last_name}"
+        )
+        assert by_email["gone@example.com"]["user_name"] == "Gone User"
+        assert all(item["status"] == ActionStatus.PENDING.value for item in items)
+
+    async def test_pages_by_id(self, db_session, admin_user, invitee_user, active_event):
+        """Test limit and after_id walk the actions in id order."""
+        db_session.add_all([
+            ParticipantAction(
+                user_id=invitee_user.id, event_id=active_event.id,
+                action_type=ActionType.SURVEY_COMPLETION.value, title=f"Survey {i}",
+            )
+            for i in range(3)
+        ])
+        await db_session.commit()
+
+        async def page(after_id):
+            response = await list_actions(
+                event_id=None, action_type=None, status=None,
+                after_id=after_id, limit=2, db=db_session, current_user=admin_user,
+            )
+            return [item["title"] for item in orjson.loads(response.body)]
+
+        first = await page(None)
+        assert first == ["Survey 0", "Survey 1"]
+        result = await db_session.execute(
+            select(ParticipantAction.id).where(ParticipantAction.title == "Survey 1")
+        )
+        assert await page(result.scalar_one()) == ["Survey 2"]
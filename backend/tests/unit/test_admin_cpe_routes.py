@@ -0,0 +1,114 @@
+"""Unit tests for admin CPE certificate routes.
+
+Tests certificate listing, revocation and reinstatement against the
+in-memory test database.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.routes.admin_cpe import (
+    RevokeCertificateRequest,
+    list_certificates,
+    reinstate_certificate,
+    revoke_certificate,
+)
+from app.models.cpe_certificate import CPECertificate, CertificateStatus
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestListCertificates:
+    """Test certificate listing."""
+
+    async def test_lists_live_user_or_snapshot(
+        self, db_session, admin_user, invitee_user, active_event
+    ):
+        """Test certificates use the loaded live user, or the snapshot once deleted."""
+        db_session.add_all([
+            CPECertificate(
+                user_id=invitee_user.id, event_id=active_event.id,
+                certificate_number="CX-2026-0001",
+            ),
+            CPECertificate(
+                user_id=None, user_email="gone@example.com", user_name="Gone User",
+                event_id=active_event.id, certificate_number="CX-2026-0002",
+            ),
+        ])
+        await db_session.commit()
+        db_session.expunge_all()
+
+        response = await list_certificates(
+            event_id=active_event.id, status_filter=None, db=db_session, current_user=admin_user
+        )
+
+        live, deleted = response["certificates"]
+        assert (live["email"], live["first_name"], live["last_name"]) == (
+            invitee_user.email, invitee_user.first_name, invitee_user.last_name
+        )
+        assert (deleted["email"], deleted["first_name"], deleted["last_name"]) == (
+            "gone@example.com", "Gone", "User"
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRevokeAndReinstate:
+    """Test revoking and reinstating a certificate."""
+
+    @pytest.fixture
+    async def certificate(self, db_session, invitee_user, active_event):
+        cert = CPECertificate(
+            user_id=invitee_user.id, event_id=active_event.id,
+            certificate_number="CX-2026-0001",
+        )
+        db_session.add(cert)
+        await db_session.commit()
+        return cert
+
+    async def test_revoke_then_reinstate(self, db_session, admin_user, certificate):
+        """Test a certificate round-trips through revoked back to issued."""
+        request = MagicMock(client=None)
+
+        response = await revoke_certificate(
+            certificate_id=certificate.id,
+            request_body=RevokeCertificateRequest(reason="Duplicate"),
+            request=request, db=db_session, current_user=admin_user,
+        )
+        assert response["certificate_number"] == "CX-2026-0001"
+        assert response["revoked_at"] is not None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await revoke_certificate(
+                certificate_id=certificate.id,
+                request_body=RevokeCertificateRequest(reason="Again"),
+                request=request, db=db_session, current_user=admin_user,
+            )
+        assert exc_info.value.status_code == 400
+
+        response = await reinstate_certificate(
+            certificate_id=certificate.id, request=request, db=db_session, current_user=admin_user
+        )
+        assert response["certificate_number"] == "CX-2026-0001"
+
+        await db_session.refresh(certificate)
+        assert certificate.status == CertificateStatus.ISSUED.value
+        assert (certificate.revoked_at, certificate.revocation_reason) == (None, None)
+
+    async def test_reinstate_errors(self, db_session, admin_user, certificate):
+        """Test reinstating a missing or non-revoked certificate is rejected."""
+        request = MagicMock(client=None)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await reinstate_certificate(
+                certificate_id=99999, request=request, db=db_session, current_user=admin_user
+            )
+        assert exc_info.value.status_code == 404
+
+        with pytest.raises(HTTPException) as exc_info:
+            await reinstate_certificate(
+                certificate_id=certificate.id, request=request, db=db_session, current_user=admin_user
+            )
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,55 @@
+"""Unit tests for admin Keycloak routes.
+
+Tests sync queue retries and the health check against the in-memory
+test database.
+"""
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.routes.admin_keycloak import check_keycloak_health, retry_sync_entry
+from app.models.password_sync_queue import PasswordSyncQueue
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRetrySyncEntry:
+    """Test resetting a failed sync entry."""
+
+    async def test_resets_retry_state(self, db_session, admin_user):
+        """Test the entry's retry count and last error are cleared."""
+        entry = PasswordSyncQueue(username="invitee", retry_count=5, last_error="timeout")
+        db_session.add(entry)
+        await db_session.commit()
+
+        response = await retry_sync_entry(queue_id=entry.id, db=db_session, current_user=admin_user)
+
+        assert response["status"] == "ok"
+        await db_session.refresh(entry)
+        assert (entry.retry_count, entry.last_error) == (0, None)
+
+    async def test_missing_entry(self, db_session, admin_user):
+        """Test an unknown queue id returns 404."""
+        with pytest.raises(HTTPException) as exc_info:
+            await retry_sync_entry(queue_id=99999, db=db_session, current_user=admin_user)
+
+        assert exc_info.value.status_code == 404
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestKeycloakHealth:
+    """Test the cached Keycloak health check."""
+
+    async def test_health_is_cached(self, db_session, admin_user, mocker):
+        """Test repeated checks within the TTL reach Keycloak once."""
+        check = mocker.patch(
+            "app.api.routes.admin_keycloak.KeycloakSyncService.check_keycloak_health",
+            return_value=True,
+        )
+
+        for _ in range(3):
+            response = await check_keycloak_health(db=db_session, current_user=admin_user)
+            assert response["status"] == "healthy"
+
+        check.assert_awaited_once()
@@ -0,0 +1,735 @@
+"""Unit tests for admin API routes.
+
+Tests route-level query logic for admin listing endpoints against the
+in-memory test database.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import orjson
+import pytest
+
+from fastapi import BackgroundTasks
+from starlette.requests import Request
+
+from app.api.routes.admin import (
+    create_participant,
+    get_audit_log_stats,
+    get_dashboard,
+    get_participant_stats,
+    get_scheduler_status,
+    get_trigger_events,
+    list_audit_logs,
+    list_email_batch_logs,
+    list_email_queue,
+    list_workflows,
+    activate_event,
+    update_event,
+)
+from app.models.audit_log import AuditLog
+from app.models.email_queue import EmailBatchLog, EmailQueue
+from app.schemas.dashboard import DashboardResponse
+from app.schemas.participant import ParticipantCreate, ParticipantStats
+from app.schemas.workflow import WorkflowCreate, WorkflowUpdate
+from app.services.event_service import EventService
+from app.services.participant_service import ParticipantService
+from app.services.vpn_service import VPNService
+from app.tasks.invitation_emails import schedule_invitation_emails
+
+
+async def _list_audit_logs(db_session, user, **filters):
+    """Call list_audit_logs and decode its JSON body."""
+    params = dict(
+        page=1, page_size=10, action=None, user_id=None,
+        resource_type=None, start_date=None, end_date=None, cursor=None,
+    )
+    params.update(filters)
+    response = await list_audit_logs(**params, current_user=user, db=db_session)
+    return orjson.loads(response.body)
+
+
+async def _add_audit_logs(db_session, user, count, action="LOGIN_SUCCESS"):
+    """Insert audit log rows for a user."""
+    for i in range(count):
+        db_session.add(AuditLog(
+            user_id=user.id,
+            action=action,
+            resource_type="USER",
+            resource_id=i,
+        ))
+    await db_session.commit()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestListAuditLogs:
+    """Test audit log listing route."""
+
+    async def test_page_and_total(self, db_session, admin_user):
+        """Test a page returns page_size rows and the full filtered total."""
+        await _add_audit_logs(db_session, admin_user, 5)
+        await _add_audit_logs(db_session, admin_user, 2, action="LOGOUT")
+
+        body = await _list_audit_logs(
+            db_session, admin_user, page_size=3, action="LOGIN_SUCCESS"
+        )
+
+        assert body["total"] == 5
+        assert len(body["items"]) == 3
+        assert body["total_pages"] == 2
+        assert all(item["action"] == "LOGIN_SUCCESS" for item in body["items"])
+
+    async def test_page_past_end_keeps_total(self, db_session, admin_user):
+        """Test a page past the end still reports the total."""
+        await _add_audit_logs(db_session, admin_user, 3)
+
+        body = await _list_audit_logs(db_session, admin_user, page=5, page_size=2)
+
+        assert body["items"] == []
+        assert body["total"] == 3
+
+    async def test_empty(self, db_session, admin_user):
+        """Test an empty table returns zero total."""
+        body = await _list_audit_logs(db_session, admin_user)
+
+        assert body["items"] == []
+        assert body["total"] == 0
+
+    async def test_date_and_resource_filters(self, db_session, admin_user):
+        """Test date range and resource type filters bind their values."""
+        from datetime import datetime, timedelta, timezone
+
+        await _add_audit_logs(db_session, admin_user, 2)
+        now = datetime.now(timezone.utc)
+
+        body = await _list_audit_logs(
+            db_session, admin_user, resource_type="USER",
+            start_date=now - timedelta(days=1), end_date=now + timedelta(days=1)
+        )
+        assert body["total"] == 2
+
+        body = await _list_audit_logs(db_session, admin_user, resource_type="VPN")
+        assert body["total"] == 0
+
+    async def test_statements_cached_per_filter_set(self):
+        """Test the same filter combination reuses the built statement."""
+        from app.api.routes.admin import _audit_log_statement
+
+        first = _audit_log_statement(True, False, False, False, False)
+
+        assert _audit_log_statement(True, False, False, False, False) is first
+        assert _audit_log_statement(False, False, False, False, False) is not first
+
+    async def test_later_pages_reuse_cached_total(self, db_session, admin_user):
+        """Test page 2 reuses the total counted for page 1 of the same filters."""
+        await _add_audit_logs(db_session, admin_user, 5)
+        body = await _list_audit_logs(db_session, admin_user, page_size=2)
+        assert body["total"] == 5
+
+        await _add_audit_logs(db_session, admin_user, 1)
+
+        body = await _list_audit_logs(db_session, admin_user, page=2, page_size=2)
+        assert body["total"] == 5
+        assert len(body["items"]) == 2
+
+        body = await _list_audit_logs(db_session, admin_user, page_size=2)
+        assert body["total"] == 6
+
+    async def test_cursor_pages(self, db_session, admin_user):
+        """Test following next_cursor walks every row once, newest first."""
+        from datetime import datetime
+
+        # Explicit timestamps, all equal so the id tie-breaker decides the order
+        created_at = datetime(2026, 1, 1, 12, 0, 0)
+        for _ in range(5):
+            db_session.add(AuditLog(
+                user_id=admin_user.id, action="LOGIN_SUCCESS", created_at=created_at
+            ))
+        await db_session.commit()
+
+        body = await _list_audit_logs(db_session, admin_user, page_size=2)
+        seen = [item["id"] for item in body["items"]]
+        while body["next_cursor"]:
+            body = await _list_audit_logs(
+                db_session, admin_user, page_size=2, cursor=body["next_cursor"]
+            )
+            assert body["total"] == 5
+            seen.extend(item["id"] for item in body["items"])
+
+        assert len(seen) == 5
+        assert seen == sorted(seen, reverse=True)
+
+    async def test_invalid_cursor(self, db_session, admin_user):
+        """Test a malformed cursor is rejected with 400."""
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException) as exc_info:
+            await _list_audit_logs(db_session, admin_user, cursor="not-a-cursor")
+        assert exc_info.value.status_code == 400
+
+    async def test_falls_back_to_user_lookup(self, db_session, admin_user):
+        """Test rows without a user snapshot get email/name from the user."""
+        await _add_audit_logs(db_session, admin_user, 1)
+
+        body = await _list_audit_logs(db_session, admin_user, user_id=admin_user.id)
+
+        assert body["items"][0]["user_email"] == admin_user.email
+        assert body["items"][0]["user_name"] == "Admin User"
+
+    async def test_user_lookup_batched(
+        self, db_session, async_engine, admin_user, sponsor_user
+    ):
+        """Test users for a page of logs are fetched in one query."""
+        from sqlalchemy import event
+
+        await _add_audit_logs(db_session, admin_user, 3)
+        await _add_audit_logs(db_session, sponsor_user, 3)
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(async_engine.sync_engine, "before_cursor_execute", listener)
+        try:
+            body = await _list_audit_logs(db_session, admin_user)
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", listener)
+
+        emails = {item["user_email"] for item in body["items"]}
+        assert emails == {admin_user.email, sponsor_user.email}
+        assert sum("FROM users" in sql for sql in statements) == 1
+
+    async def test_snapshot_rows_skip_user_lookup(self, db_session, async_engine, admin_user):
+        """Test rows that carry a user snapshot do not query the users table."""
+        from sqlalchemy import event
+
+        db_session.add(AuditLog(
+            user_id=admin_user.id,
+            user_email="snapshot@test.com",
+            user_name="Snapshot Name",
+            action="LOGIN_SUCCESS",
+        ))
+        await db_session.commit()
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(async_engine.sync_engine, "before_cursor_execute", listener)
+        try:
+            body = await _list_audit_logs(db_session, admin_user)
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", listener)
+
+        assert body["items"][0]["user_email"] == "snapshot@test.com"
+        assert body["items"][0]["user_name"] == "Snapshot Name"
+        assert not any("FROM users" in sql for sql in statements)
+
+    async def test_stats(self, db_session, admin_user):
+        """Test audit stats count each action and the total in one query."""
+        await _add_audit_logs(db_session, admin_user, 3)
+        await _add_audit_logs(db_session, admin_user, 2, action="LOGOUT")
+        await _add_audit_logs(db_session, admin_user, 1, action="VPN_REQUEST_FAILED")
+
+        stats = await get_audit_log_stats(current_user=admin_user, db=db_session)
+
+        assert stats.total_events == 6
+        assert stats.recent_24h == 6
+        assert stats.login_count == 3
+        assert stats.logout_count == 2
+        assert stats.vpn_request_failed_count == 1
+        assert stats.user_delete_count == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestEmailQueueRoutes:
+    """Test email queue and batch log listing routes."""
+
+    async def test_queue_items_are_column_dicts(self, db_session, admin_user):
+        """Test queue items are listed in send order with only the listed columns."""
+        for priority in (5, 1, 3):
+            db_session.add(EmailQueue(
+                template_name="invite", recipient_email=f"p{priority}@test.com", priority=priority
+            ))
+        await db_session.commit()
+
+        body = orjson.loads((await list_email_queue(
+            page=1, page_size=2, status=None, exclude_status=None, since=None,
+            template_name=None, cursor=None, current_user=admin_user, db=db_session,
+        )).body)
+
+        assert body["total"] == 3
+        assert [item["priority"] for item in body["items"]] == [1, 3]
+        assert body["items"][0]["recipient_email"] == "p1@test.com"
+        assert "custom_vars" not in body["items"][0]
+
+        body = orjson.loads((await list_email_queue(
+            page=1, page_size=2, status=None, exclude_status=None, since=None,
+            template_name=None, cursor=body["next_cursor"], current_user=admin_user, db=db_session,
+        )).body)
+        assert [item["priority"] for item in body["items"]] == [5]
+        assert body["next_cursor"] is None
+
+    async def test_batch_logs(self, db_session, admin_user):
+        """Test batch logs are listed newest first."""
+        from datetime import datetime, timedelta
+
+        base = datetime(2026, 1, 1, 12, 0, 0)
+        for i in range(3):
+            db_session.add(EmailBatchLog(
+                batch_id=f"batch-{i}", batch_size=10, started_at=base + timedelta(minutes=i)
+            ))
+        await db_session.commit()
+
+        body = orjson.loads((await list_email_batch_logs(
+            page=1, page_size=20, cursor=None, current_user=admin_user, db=db_session
+        )).body)
+
+        assert body["total"] == 3
+        assert [item["batch_id"] for item in body["items"]] == ["batch-2", "batch-1", "batch-0"]
+        assert body["items"][0]["batch_size"] == 10
+        assert body["items"][0]["started_at"].startswith("2026-01-01T12:02:00")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSchedulerStatus:
+    """Test scheduler status route."""
+
+    async def test_not_reported(self, db_session, admin_user):
+        """Test a missing status row reports not running."""
+        body = await get_scheduler_status(current_user=admin_user, db=db_session)
+
+        assert body["running"] is False
+        assert body["healthy"] is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestActiveEventCache:
+    """Test request-scoped active event lookup."""
+
+    async def test_queries_once_per_request(self, db_session, active_event, mocker):
+        """Test the active event is fetched once and then reused."""
+        from starlette.requests import Request
+        from app.api.utils.event import get_active_event_cached
+        from app.services.event_service import EventService
+
+        request = Request({"type": "http", "headers": []})
+        spy = mocker.spy(EventService, "get_active_event")
+
+        first = await get_active_event_cached(request, db_session)
+        second = await get_active_event_cached(request, db_session)
+
+        assert first.id == active_event.id
+        assert second is first
+        assert spy.call_count == 1
+
+    async def test_caches_missing_event(self, db_session, mocker):
+        """Test a missing active event is also cached."""
+        from starlette.requests import Request
+        from app.api.utils.event import get_active_event_cached
+        from app.services.event_service import EventService
+
+        request = Request({"type": "http", "headers": []})
+        spy = mocker.spy(EventService, "get_active_event")
+
+        assert await get_active_event_cached(request, db_session) is None
+        assert await get_active_event_cached(request, db_session) is None
+        assert spy.call_count == 1
+
+
+def _request():
+    """Build a bare request with a client address for audit metadata."""
+    return Request({"type": "http", "headers": [], "client": ("127.0.0.1", 12345)})
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCreateParticipant:
+    """Test participant creation route."""
+
+    async def test_response_includes_relationships_without_reload(
+        self, db_session, admin_user, sponsor_user, mocker
+    ):
+        """Test the created participant's sponsor is returned without re-fetching the user."""
+        service = ParticipantService(db_session)
+        reload = mocker.spy(service, "get_participant")
+
+        response = await create_participant(
+            data=ParticipantCreate(
+                email="new.invitee@test.com",
+                first_name="New",
+                last_name="Invitee",
+                country="USA",
+                sponsor_id=sponsor_user.id,
+            ),
+            request=_request(),
+            current_user=admin_user,
+            service=service,
+            db=db_session,
+        )
+
+        assert response.email == "new.invitee@test.com"
+        assert response.sponsor.id == sponsor_user.id
+        reload.assert_not_called()
+
+    async def test_closed_registration_skips_participation_lookup(
+        self, db_session, admin_user, sponsor_user, active_event, mocker
+    ):
+        """Test no participation query runs when the event settings block invitations."""
+        from app.models.user import User
+
+        active_event.registration_open = False
+        await db_session.commit()
+        lookup = mocker.spy(User, "get_participation_for_event")
+        queue = mocker.patch("app.api.routes.admin.queue_invitation_email_for_user")
+
+        await create_participant(
+            data=ParticipantCreate(
+                email="closed.invitee@test.com",
+                first_name="Closed",
+                last_name="Invitee",
+                country="USA",
+                sponsor_id=sponsor_user.id,
+            ),
+            request=_request(),
+            current_user=admin_user,
+            service=ParticipantService(db_session),
+            db=db_session,
+        )
+
+        # Only the response builder's current-event lookup; none for the invitation decision
+        assert lookup.call_count == 1
+        queue.assert_not_called()
+
+    async def test_open_registration_queues_invitation(
+        self, db_session, admin_user, sponsor_user, active_event, mocker
+    ):
+        """Test an invitation is queued when registration is open and not yet confirmed."""
+        queue = mocker.patch("app.api.routes.admin.queue_invitation_email_for_user")
+
+        await create_participant(
+            data=ParticipantCreate(
+                email="open.invitee@test.com",
+                first_name="Open",
+                last_name="Invitee",
+                country="USA",
+                sponsor_id=sponsor_user.id,
+            ),
+            request=_request(),
+            current_user=admin_user,
+            service=ParticipantService(db_session),
+            db=db_session,
+        )
+
+        queue.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStatsRoutes:
+    """Test dashboard statistics routes."""
+
+    async def test_participant_stats_body(self, db_session, admin_user, invitee_user):
+        """Test participant stats serialize to a valid ParticipantStats body."""
+        response = await get_participant_stats(
+            current_user=admin_user, service=ParticipantService(db_session)
+        )
+
+        stats = ParticipantStats.model_validate(orjson.loads(response.body))
+        assert stats.total_invitees >= 1
+        assert stats.admin_count == 1
+
+    async def test_dashboard_body(self, db_session, admin_user):
+        """Test the dashboard serializes to a valid DashboardResponse body."""
+        response = await get_dashboard(
+            current_user=admin_user,
+            participant_service=ParticipantService(db_session),
+            vpn_service=VPNService(db_session),
+        )
+
+        dashboard = DashboardResponse.model_validate(orjson.loads(response.body))
+        assert dashboard.stats.vpn.total_credentials == 0
+        assert dashboard.recent_participants == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestUpdateEvent:
+    """Test admin event update route."""
+
+    async def test_tracks_changed_fields(self, db_session, admin_user, active_event, mocker):
+        """Test only changed fields are applied and audited, with dates parsed."""
+        from datetime import date
+
+        log = mocker.patch("app.api.routes.admin.AuditService.log_event_update")
+        reload = mocker.spy(EventService, "get_event")
+
+        await update_event(
+            event_id=active_event.id,
+            data={"name": "Renamed", "start_date": "2026-09-01T00:00:00Z", "max_participants": 100},
+            request=_request(),
+            background_tasks=BackgroundTasks(),
+            db=db_session,
+            current_user=admin_user,
+        )
+
+        await db_session.refresh(active_event)
+        assert active_event.name == "Renamed"
+        assert active_event.start_date == date(2026, 9, 1)
+        changes = log.call_args.kwargs["changes"]
+        assert set(changes) == {"name", "start_date"}
+        assert changes["start_date"]["new_value"] == "2026-09-01"
+        assert reload.call_count == 1
+
+    async def test_unchanged_values_skip_write(self, db_session, admin_user, active_event, mocker):
+        """Test resubmitting the stored values writes and audits nothing."""
+        log = mocker.patch("app.api.routes.admin.AuditService.log_event_update")
+        apply = mocker.spy(EventService, "apply_updates")
+
+        response = await update_event(
+            event_id=active_event.id,
+            data={"name": active_event.name, "is_active": True},
+            request=_request(),
+            background_tasks=BackgroundTasks(),
+            db=db_session,
+            current_user=admin_user,
+        )
+
+        assert response == {"success": True, "message": "No changes"}
+        apply.assert_not_called()
+        log.assert_not_called()
+
+    async def test_activating_deactivates_others(self, db_session, admin_user, active_event, mocker):
+        """Test setting is_active leaves only this event active."""
+        from app.models.event import Event, generate_slug
+
+        mocker.patch("app.api.routes.admin.AuditService.log_event_update")
+        other = Event(
+            name="Next", slug=generate_slug("Next"), year=2027, is_active=False,
+        )
+        db_session.add(other)
+        await db_session.commit()
+        background_tasks = BackgroundTasks()
+
+        await update_event(
+            event_id=other.id,
+            data={"is_active": True},
+            request=_request(),
+            background_tasks=background_tasks,
+            db=db_session,
+            current_user=admin_user,
+        )
+
+        await db_session.refresh(active_event)
+        await db_session.refresh(other)
+        assert other.is_active is True
+        assert active_event.is_active is False
+        # Invitation scheduling is deferred until after the response
+        [task] = background_tasks.tasks
+        assert task.func is schedule_invitation_emails
+        assert task.args == (other.id, "Next")
+
+    async def test_activate_event_route(self, db_session, admin_user, active_event, mocker):
+        """Test the activate route switches the active event."""
+        from app.models.event import Event, generate_slug
+
+        mocker.patch("app.api.routes.admin.AuditService.log_event_activate")
+        other = Event(name="Next", slug=generate_slug("Next"), year=2027, is_active=False)
+        db_session.add(other)
+        await db_session.commit()
+
+        response = await activate_event(
+            event_id=other.id, request=_request(), db=db_session, current_user=admin_user
+        )
+
+        assert response["success"] is True
+        await db_session.refresh(active_event)
+        assert active_event.is_active is False
+        assert other.is_active is True
+
+
+@pytest.mark.unit
+class TestComputeEventTriggers:
+    """Test update_event trigger flags."""
+
+    def test_flags(self):
+        """Test each flag is set only by its own transition."""
+        from app.api.routes.admin import _compute_event_triggers
+
+        def change(old, new):
+            return {"old_value": old, "new_value": new}
+
+        assert _compute_event_triggers({}) == (False, False, False, False)
+        assert _compute_event_triggers({"is_active": change(False, True)}) == (True, False, False, False)
+        assert _compute_event_triggers({"test_mode": change(False, True)}) == (False, True, False, False)
+        assert _compute_event_triggers({"test_mode": change(True, False)}) == (False, False, True, False)
+        assert _compute_event_triggers(
+            {"registration_open": change(False, True), "is_active": change(True, False)}
+        ) == (False, False, False, True)
+        # Values that are not real booleans never trigger
+        assert _compute_event_triggers({"is_active": change(None, True)}) == (False, False, False, False)
+
+
+async def _list_workflows(db_session, user, **params):
+    """Call list_workflows and decode its JSON body."""
+    params = {"page": 1, "page_size": 50, "cursor": None, **params}
+    response = await list_workflows(
+        enabled_only=False, trigger_event=None, current_user=user, db=db_session, **params
+    )
+    return orjson.loads(response.body)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWorkflowRoutes:
+    """Test admin email workflow routes."""
+
+    async def test_list_workflows(self, db_session, admin_user):
+        """Test listed workflows carry every response field from their rows."""
+        from app.models.email_workflow import EmailWorkflow, WorkflowTriggerEvent
+        from app.schemas.workflow import WorkflowResponse
+
+        workflow = EmailWorkflow(
+            name="welcome",
+            display_name="Welcome",
+            trigger_event=WorkflowTriggerEvent.USER_CREATED,
+            template_name="welcome",
+            custom_vars={"a": 1},
+        )
+        db_session.add(workflow)
+        await db_session.commit()
+
+        body = await _list_workflows(db_session, admin_user)
+
+        [item] = body["items"]
+        assert item == WorkflowResponse.model_validate(workflow).model_dump(mode="json")
+        assert body["total"] == 1
+
+    async def test_list_workflows_cursor(self, db_session, admin_user):
+        """Test cursor pages walk the workflows newest first without overlap."""
+        from datetime import datetime, timedelta, timezone
+        from app.models.email_workflow import EmailWorkflow, WorkflowTriggerEvent
+
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for i in range(3):
+            db_session.add(EmailWorkflow(
+                name=f"wf{i}", display_name=f"Workflow {i}",
+                trigger_event=WorkflowTriggerEvent.USER_CREATED, template_name="welcome",
+                created_at=base + timedelta(minutes=i),
+            ))
+        await db_session.commit()
+
+        first = await _list_workflows(db_session, admin_user, page_size=2)
+        second = await _list_workflows(
+            db_session, admin_user, page_size=2, cursor=first["next_cursor"]
+        )
+
+        assert [w["name"] for w in first["items"]] == ["wf2", "wf1"]
+        assert [w["name"] for w in second["items"]] == ["wf0"]
+        assert second["next_cursor"] is None
+        assert second["total"] == 3
+
+    async def test_list_workflows_cached_until_changed(self, db_session, admin_user):
+        """Test listings are served from cache until a workflow is created."""
+        from app.api.routes.admin import create_workflow
+        from app.models.email_workflow import WorkflowTriggerEvent
+
+        assert (await _list_workflows(db_session, admin_user))["total"] == 0
+
+        execute = AsyncMock(wraps=db_session.execute)
+        with patch.object(db_session, "execute", execute):
+            assert (await _list_workflows(db_session, admin_user))["total"] == 0
+        execute.assert_not_called()
+
+        await create_workflow(
+            workflow_create=WorkflowCreate(
+                name="welcome",
+                display_name="Welcome",
+                trigger_event=WorkflowTriggerEvent.USER_CREATED,
+                template_name="welcome",
+            ),
+            current_user=admin_user,
+            db=db_session,
+        )
+
+        assert (await _list_workflows(db_session, admin_user))["total"] == 1
+
+    async def test_get_trigger_events(self, admin_user):
+        """Test the trigger event catalog is served as JSON."""
+        from app.models.email_workflow import WorkflowTriggerEvent
+
+        response = await get_trigger_events(current_user=admin_user)
+
+        assert response.media_type == "application/json"
+        events = orjson.loads(response.body)["events"]
+        assert events[0]["event"] == WorkflowTriggerEvent.USER_CREATED
+        assert all(set(e) == {"event", "display_name", "description", "available_variables"} for e in events)
+
+    async def test_update_workflow_records_only_changed_fields(self, db_session, admin_user, mocker):
+        """Test unchanged values are not audited and empty sender fields clear."""
+        from app.api.routes.admin import update_workflow
+        from app.models.email_workflow import EmailWorkflow, WorkflowTriggerEvent
+
+        log = mocker.patch("app.api.routes.admin.AuditService.log_workflow_update")
+        workflow = EmailWorkflow(
+            name="welcome", display_name="Welcome",
+            trigger_event=WorkflowTriggerEvent.USER_CREATED, template_name="welcome",
+            priority=5, from_email="events@example.com",
+        )
+        db_session.add(workflow)
+        await db_session.commit()
+
+        response = await update_workflow(
+            workflow_id=workflow.id,
+            workflow_update=WorkflowUpdate(display_name="Welcome", priority=2, from_email=""),
+            current_user=admin_user,
+            db=db_session,
+        )
+
+        assert response.priority == 2
+        assert response.from_email is None
+        assert log.call_args.kwargs["changes"] == {
+            "priority": {"old": 5, "new": 2},
+            "from_email": {"old": "events@example.com", "new": None},
+        }
+
+    async def test_create_workflow_returns_server_defaults(self, db_session, admin_user, mocker):
+        """Test the created workflow carries its generated id and timestamp."""
+        from app.api.routes.admin import create_workflow
+        from app.models.email_workflow import WorkflowTriggerEvent
+
+        mocker.patch("app.api.routes.admin.AuditService.log_workflow_create")
+
+        response = await create_workflow(
+            workflow_create=WorkflowCreate(
+                name="welcome",
+                display_name="Welcome",
+                trigger_event=WorkflowTriggerEvent.USER_CREATED,
+                template_name="welcome",
+            ),
+            current_user=admin_user,
+            db=db_session,
+        )
+
+        assert response.id is not None
+        assert response.created_at is not None
+        assert response.created_by_id == admin_user.id
+
+    async def test_create_workflow_rejects_duplicate_name(self, db_session, admin_user, mocker):
+        """Test a second workflow with the same name is rejected."""
+        from fastapi import HTTPException
+        from app.api.routes.admin import create_workflow
+        from app.models.email_workflow import WorkflowTriggerEvent
+
+        mocker.patch("app.api.routes.admin.AuditService.log_workflow_create")
+        workflow_create = WorkflowCreate(
+            name="welcome",
+            display_name="Welcome",
+            trigger_event=WorkflowTriggerEvent.USER_CREATED,
+            template_name="welcome",
+        )
+        await create_workflow(workflow_create=workflow_create, current_user=admin_user, db=db_session)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await create_workflow(workflow_create=workflow_create, current_user=admin_user, db=db_session)
+
+        assert exc_info.value.status_code == 400
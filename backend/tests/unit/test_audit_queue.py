@@ -0,0 +1,152 @@
+"""
+Unit tests for the background audit log queue.
+
+Tests batched writes, the worker lifecycle, and AuditService's
+synchronous fallback when the queue is not running.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.audit_log import AuditLog
+from app.services import audit_queue
+from app.services.audit_service import AuditService
+
+
+@pytest.fixture
+def session_factory(async_engine, mocker):
+    """Point the queue's session factory at the test database."""
+    factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    mocker.patch("app.services.audit_queue.AsyncSessionLocal", factory)
+    return factory
+
+
+async def _audit_logs(db_session):
+    result = await db_session.execute(select(AuditLog).order_by(AuditLog.id))
+    return list(result.scalars().all())
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAuditQueue:
+    """Test audit_queue enqueue/start/stop."""
+
+    async def test_enqueue_without_worker_returns_false(self):
+        """Test enqueue refuses entries when the worker is not running."""
+        assert audit_queue.enqueue({"action": "LOGIN_SUCCESS"}) is False
+
+    async def test_write_batch_snapshots_users(self, db_session, admin_user):
+        """Test a batch is inserted with user email/name snapshots."""
+        await audit_queue.write_batch(db_session, [
+            {"user_id": admin_user.id, "action": "USER_CREATE", "resource_type": "USER",
+             "resource_id": 1, "details": {"role": "invitee"}},
+            {"user_id": None, "action": "LOGIN_FAILED"},
+        ])
+
+        logs = await _audit_logs(db_session)
+        assert [log.action for log in logs] == ["USER_CREATE", "LOGIN_FAILED"]
+        assert logs[0].user_email == admin_user.email
+        assert logs[0].user_name == "Admin User"
+        assert logs[0].details == {"role": "invitee"}
+        assert logs[1].user_email is None
+
+    async def test_stop_flushes_queued_entries(self, db_session, admin_user, session_factory):
+        """Test entries queued before stop() are written."""
+        audit_queue.start()
+        try:
+            for i in range(3):
+                assert audit_queue.enqueue({
+                    "user_id": admin_user.id, "action": "USER_UPDATE", "resource_id": i
+                }) is True
+        finally:
+            await audit_queue.stop()
+
+        logs = await _audit_logs(db_session)
+        assert [log.resource_id for log in logs] == [0, 1, 2]
+        assert audit_queue.enqueue({"action": "LOGOUT"}) is False
+
+    async def test_failed_batch_retries_rows_individually(self, db_session, session_factory, mocker):
+        """Test a failing batch falls back to per-row writes so good rows survive."""
+        real_write_batch = audit_queue.write_batch
+
+        async def write_batch(session, entries):
+            if any(e["action"] == "BAD" for e in entries):
+                raise RuntimeError("insert failed")
+            await real_write_batch(session, entries)
+
+        mocker.patch("app.services.audit_queue.write_batch", side_effect=write_batch)
+        error = mocker.patch("app.services.audit_queue.logger.error")
+
+        await audit_queue._flush([
+            {"action": "LOGIN_SUCCESS"}, {"action": "BAD"}, {"action": "LOGOUT"},
+        ])
+
+        logs = await _audit_logs(db_session)
+        assert [log.action for log in logs] == ["LOGIN_SUCCESS", "LOGOUT"]
+        error.assert_called_once()
+        assert "BAD" in repr(error.call_args)
+
+    async def test_stop_times_out_on_stuck_writer(self, mocker):
+        """Test stop() gives up after the timeout instead of hanging shutdown."""
+        mocker.patch.object(audit_queue, "_STOP_TIMEOUT_SECONDS", 0.05)
+
+        async def _flush(entries):
+            await asyncio.sleep(10)
+
+        mocker.patch("app.services.audit_queue._flush", side_effect=_flush)
+        audit_queue.start()
+        assert audit_queue.enqueue({"action": "LOGOUT"}) is True
+
+        await asyncio.wait_for(audit_queue.stop(), 1)
+        assert audit_queue.enqueue({"action": "LOGOUT"}) is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestDeferredAuditService:
+    """Test AuditService(deferred=True)."""
+
+    async def test_falls_back_to_sync_write(self, db_session, admin_user):
+        """Test deferred logging writes immediately when the queue is not running."""
+        log = await AuditService(db_session, deferred=True).log(
+            action="USER_DELETE", user_id=admin_user.id
+        )
+
+        assert log is not None
+        assert log.user_email == admin_user.email
+
+    async def test_queues_when_worker_running(self, db_session, admin_user, session_factory):
+        """Test deferred logging hands the entry to the queue."""
+        audit_queue.start()
+        try:
+            log = await AuditService(db_session, deferred=True).log(
+                action="USER_DELETE", user_id=admin_user.id
+            )
+            assert log is None
+        finally:
+            await audit_queue.stop()
+
+        logs = await _audit_logs(db_session)
+        assert len(logs) == 1
+        assert logs[0].action == "USER_DELETE"
+
+    async def test_queued_entry_keeps_enqueue_time(self, db_session, admin_user, session_factory, mocker):
+        """Test created_at reflects when log() was called, not when the batch was written."""
+        enqueue = mocker.spy(audit_queue, "enqueue")
+        before = datetime.now(timezone.utc)
+        audit_queue.start()
+        try:
+            await AuditService(db_session, deferred=True).log(
+                action="USER_DELETE", user_id=admin_user.id
+            )
+        finally:
+            await audit_queue.stop()
+
+        created_at = enqueue.call_args.args[0]["created_at"]
+        assert before <= created_at <= datetime.now(timezone.utc)
+        logs = await _audit_logs(db_session)
+        assert abs(logs[0].created_at.replace(tzinfo=timezone.utc) - created_at) < timedelta(seconds=1)
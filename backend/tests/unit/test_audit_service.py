@@ -4,11 +4,14 @@ Unit tests for AuditService.
 Tests audit logging for various user actions and system events.
 """
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.audit_service import AuditService
-from app.models.audit_log import AuditLog
+from app.services.audit_service import AuditService, STATS_MAX_AGE, STATS_SUMMARY_ID
+from app.models.audit_log import AuditLog, AuditLogStatsSummary
 
 
 @pytest.mark.unit
@@ -449,3 +452,64 @@ class TestAuditServiceInvitation:
         assert log.details["stage"] == 1
         assert log.details["days_until_event"] == 30
         assert log.details["template"] == "reminder_1"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAuditServiceStats:
+    """Test precomputed audit log statistics."""
+
+    async def test_refresh_stats_summary(self, db_session: AsyncSession):
+        """Test refreshing stores the computed counts in the summary row."""
+        service = AuditService(db_session)
+        await service.log(action="LOGIN_SUCCESS")
+        await service.log(action="LOGOUT")
+
+        stats = await service.refresh_stats_summary()
+        summary = await db_session.get(AuditLogStatsSummary, STATS_SUMMARY_ID)
+
+        assert stats["total_events"] == 2
+        assert summary.total_events == 2
+        assert summary.login_count == 1
+        assert summary.logout_count == 1
+
+    async def test_refresh_stats_summary_updates_existing_row(self, db_session: AsyncSession):
+        """Test a later refresh overwrites the summary row in place."""
+        service = AuditService(db_session)
+        await service.refresh_stats_summary()
+        await service.log(action="LOGIN_SUCCESS")
+
+        await service.refresh_stats_summary()
+        result = await db_session.execute(
+            select(AuditLogStatsSummary).execution_options(populate_existing=True)
+        )
+        summaries = result.scalars().all()
+
+        assert [summary.id for summary in summaries] == [STATS_SUMMARY_ID]
+        assert summaries[0].total_events == 1
+        assert summaries[0].login_count == 1
+
+    async def test_get_stats_reads_fresh_summary(self, db_session: AsyncSession):
+        """Test a fresh summary row is served without recounting."""
+        service = AuditService(db_session)
+        await service.refresh_stats_summary()
+        await service.log(action="LOGIN_SUCCESS")
+
+        stats = await service.get_stats()
+
+        assert stats["total_events"] == 0
+        assert stats["login_count"] == 0
+
+    async def test_get_stats_recomputes_stale_summary(self, db_session: AsyncSession):
+        """Test a stale summary row falls back to a live computation."""
+        service = AuditService(db_session)
+        await service.refresh_stats_summary()
+        summary = await db_session.get(AuditLogStatsSummary, STATS_SUMMARY_ID)
+        summary.updated_at = datetime.now(timezone.utc) - STATS_MAX_AGE - timedelta(minutes=1)
+        await db_session.commit()
+        await service.log(action="LOGIN_SUCCESS")
+
+        stats = await service.get_stats()
+
+        assert stats["total_events"] == 1
+        assert stats["login_count"] == 1
@@ -5,6 +5,7 @@ All service dependencies are mocked to isolate route behavior.
 """
 
 import pytest
+from collections import deque
 from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, AsyncMock, patch
 from fastapi import Request, Response
@@ -76,7 +77,7 @@ class TestRateLimiting:
 
         # Add old timestamps (16 minutes ago)
         old_time = datetime.now(timezone.utc) - timedelta(minutes=16)
-        _rate_limit_cache[cache_key] = [old_time] * 5
+        _rate_limit_cache[cache_key] = deque([old_time] * 5)
 
         # New attempt should be allowed (old entries cleaned)
         result = check_login_rate_limit(ip)
@@ -89,7 +90,7 @@ class TestRateLimiting:
         cache_key = f"login_{ip}"
 
         # Add some entries
-        _rate_limit_cache[cache_key] = [datetime.now(timezone.utc)]
+        _rate_limit_cache[cache_key] = deque([datetime.now(timezone.utc)])
 
         # Clear rate limit
         clear_login_rate_limit(ip)
@@ -101,6 +102,18 @@ class TestRateLimiting:
         clear_login_rate_limit("192.168.1.6")
         # Should not raise error
 
+    def test_check_rate_limit_evicts_least_recent_key(self, monkeypatch):
+        """Test the cache stays bounded by evicting the least recently seen IP."""
+        from app.api.routes import auth
+        monkeypatch.setattr(auth, "_RATE_LIMIT_MAX_KEYS", 2)
+
+        check_login_rate_limit("10.0.0.1")
+        check_login_rate_limit("10.0.0.2")
+        check_login_rate_limit("10.0.0.1")  # refresh 10.0.0.1
+        check_login_rate_limit("10.0.0.3")
+
+        assert list(_rate_limit_cache) == ["login_10.0.0.1", "login_10.0.0.3"]
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
@@ -6,6 +6,7 @@ Tests email queue management, batching, and duplicate protection.
 
 import pytest
 from datetime import datetime, timezone, timedelta
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.email_queue_service import EmailQueueService
@@ -210,6 +211,40 @@ class TestEmailQueueServiceEnqueue:
                 template_name="confirmation"
             )
 
+    async def test_enqueue_emails_bulk_skips_pending(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test bulk enqueue inserts one entry per user not already pending."""
+        other = User(
+            email="other@test.com",
+            first_name="Other",
+            last_name="User",
+            country="USA",
+            role=UserRole.INVITEE.value
+        )
+        db_session.add(other)
+        await db_session.commit()
+
+        service = EmailQueueService(db_session)
+        await service.enqueue_email(user_id=test_user.id, template_name="action")
+
+        created = await service.enqueue_emails_bulk(
+            users=[test_user, other],
+            template_name="action",
+            priority=3,
+            custom_vars={"action_title": "Survey"}
+        )
+
+        assert created == 1
+        result = await db_session.execute(
+            select(EmailQueue).where(EmailQueue.user_id == other.id)
+        )
+        email = result.scalar_one()
+        assert email.recipient_name == "Other User"
+        assert email.priority == 3
+        assert email.custom_vars == {"action_title": "Survey"}
+        assert email.status == EmailQueueStatus.PENDING
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
@@ -454,6 +454,75 @@ class TestEventServiceMutation:
         assert event_2026.is_active is True
         assert event_2027.is_active is False
 
+    async def test_get_active_event_ref_is_cached(
+        self, db_session: AsyncSession, active_event
+    ):
+        """Test the active event ref is served from cache until invalidated."""
+        service = EventService(db_session)
+
+        ref = await service.get_active_event_ref()
+        assert ref == (active_event.id, active_event.name)
+
+        # A write outside the service is not seen until the cache drops
+        active_event.name = "Renamed elsewhere"
+        await db_session.commit()
+        assert (await service.get_active_event_ref()).name == ref.name
+
+        await service.apply_updates(active_event, name="Renamed")
+        assert (await service.get_active_event_ref()).name == "Renamed"
+
+    async def test_get_active_event_ref_verify_reloads_stale_ref(
+        self, db_session: AsyncSession, active_event
+    ):
+        """Test verify drops a cached event that was deactivated elsewhere."""
+        service = EventService(db_session)
+        assert await service.get_active_event_ref() is not None
+
+        # Deactivated by another worker, whose invalidation never reaches this cache
+        active_event.is_active = False
+        await db_session.commit()
+
+        assert await service.get_active_event_ref() is not None
+        assert await service.get_active_event_ref(verify=True) is None
+
+    async def test_apply_updates(self, db_session: AsyncSession, active_event):
+        """Test updates are applied to a loaded event and committed."""
+        service = EventService(db_session)
+
+        event = await service.apply_updates(active_event, name="Renamed", not_a_field=1)
+
+        assert event is active_event
+        db_session.expunge_all()
+        reloaded = await service.get_event(active_event.id)
+        assert reloaded.name == "Renamed"
+
+    async def test_activate_event(self, db_session: AsyncSession):
+        """Test activating one event deactivates the rest in one statement."""
+        service = EventService(db_session)
+
+        events = [
+            Event(
+                year=year,
+                name=f"CyberX {year}",
+                slug=generate_slug(f"CyberX {year}"),
+                start_date=date(year, 6, 1),
+                end_date=date(year, 6, 7),
+                is_active=(year == 2025)
+            )
+            for year in (2025, 2026, 2027)
+        ]
+        db_session.add_all(events)
+        await db_session.commit()
+
+        await service.activate_event(events[1].id)
+        await db_session.commit()
+
+        # Loaded objects are synchronized without a refresh
+        assert [e.is_active for e in events] == [False, True, False]
+        for event in events:
+            await db_session.refresh(event)
+        assert [e.is_active for e in events] == [False, True, False]
+
     async def test_deactivate_other_events_when_none_active(
         self, db_session: AsyncSession
     ):
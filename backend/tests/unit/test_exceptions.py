@@ -0,0 +1,181 @@
+"""
+Unit tests for standard HTTP exception helpers.
+
+Tests status codes, detail messages, and that raised instances are not shared.
+"""
+
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.exceptions import (
+    not_found,
+    forbidden,
+    bad_request,
+    conflict,
+    unauthorized,
+    server_error,
+    rate_limited,
+    not_found_response,
+    forbidden_response,
+    encode_error_body,
+)
+
+
+@pytest.mark.unit
+class TestNotFound:
+    """Test not_found helper."""
+
+    def test_not_found_without_id(self):
+        """Test detail without a resource ID."""
+        exc = not_found("Event")
+
+        assert exc.status_code == 404
+        assert exc.detail == "Event not found"
+
+    def test_not_found_with_id(self):
+        """Test detail includes the resource ID."""
+        exc = not_found("Event", 123)
+
+        assert exc.status_code == 404
+        assert exc.detail == "Event with ID 123 not found"
+
+    def test_not_found_with_zero_id(self):
+        """Test that an ID of 0 is still included in the detail."""
+        exc = not_found("Event", 0)
+
+        assert exc.detail == "Event with ID 0 not found"
+
+    def test_not_found_is_http_exception(self):
+        """Test helpers still produce HTTPException instances."""
+        exc = not_found("Event", 5)
+
+        assert isinstance(exc, HTTPException)
+        assert str(exc) == "404: Event with ID 5 not found"
+        assert exc.headers is None
+
+    def test_not_found_default_resource(self):
+        """Test default resource name."""
+        assert not_found().detail == "Resource not found"
+
+
+@pytest.mark.unit
+class TestMessageHelpers:
+    """Test helpers that take an error message."""
+
+    @pytest.mark.parametrize("helper,status_code,default", [
+        (forbidden, 403, "Not authorized to perform this action"),
+        (unauthorized, 401, "Incorrect username or password"),
+        (server_error, 500, "Internal server error"),
+        (rate_limited, 429, "Too many requests. Please try again later."),
+    ])
+    def test_default_message(self, helper, status_code, default):
+        """Test default message and status code."""
+        exc = helper()
+
+        assert isinstance(exc, HTTPException)
+        assert exc.status_code == status_code
+        assert exc.detail == default
+
+    @pytest.mark.parametrize("helper,status_code", [
+        (forbidden, 403),
+        (unauthorized, 401),
+        (server_error, 500),
+        (rate_limited, 429),
+        (bad_request, 400),
+        (conflict, 409),
+    ])
+    def test_custom_message(self, helper, status_code):
+        """Test custom message is used as the detail."""
+        exc = helper("Custom message")
+
+        assert exc.status_code == status_code
+        assert exc.detail == "Custom message"
+
+    def test_default_message_returns_new_instance(self):
+        """Test default-message helpers build a new exception per call."""
+        exc = forbidden()
+        exc.headers = {"WWW-Authenticate": "Bearer"}
+
+        assert forbidden() is not exc
+        assert forbidden().headers is None
+
+    def test_repeated_default_does_not_accumulate_traceback(self):
+        """Test raising a default-message exception repeatedly keeps a fresh traceback."""
+        def raise_forbidden():
+            raise forbidden()
+
+        depths = []
+        for _ in range(3):
+            try:
+                raise_forbidden()
+            except HTTPException as exc:
+                depth = 0
+                tb = exc.__traceback__
+                while tb is not None:
+                    depth += 1
+                    tb = tb.tb_next
+                depths.append(depth)
+
+        assert depths[0] == depths[1] == depths[2]
+
+    def test_custom_message_returns_new_instance(self):
+        """Test custom-message helpers build a new exception per call."""
+        assert bad_request("Invalid email format") is not bad_request("Invalid email format")
+        assert not_found("Event") is not not_found("Event")
+        assert not_found("Event", 1) is not not_found("Event", 1)
+
+
+@pytest.mark.unit
+class TestResponseHelpers:
+    """Test helpers that return a ready JSON Response."""
+
+    def test_not_found_response(self):
+        """Test not_found_response body matches not_found detail."""
+        resp = not_found_response("Event")
+
+        assert resp.status_code == 404
+        assert resp.media_type == "application/json"
+        assert json.loads(resp.body) == {"detail": "Event not found"}
+
+    def test_not_found_response_with_id(self):
+        """Test not_found_response includes the resource ID."""
+        resp = not_found_response("Event", 7)
+
+        assert json.loads(resp.body) == {"detail": "Event with ID 7 not found"}
+
+    def test_forbidden_response_default_and_custom(self):
+        """Test forbidden_response uses default or custom message."""
+        assert json.loads(forbidden_response().body) == {
+            "detail": "Not authorized to perform this action"
+        }
+        resp = forbidden_response("CSRF token missing")
+
+        assert resp.status_code == 403
+        assert json.loads(resp.body) == {"detail": "CSRF token missing"}
+
+    def test_responses_are_not_shared(self):
+        """Test each call returns a new Response so headers can be set safely."""
+        assert forbidden_response("x") is not forbidden_response("x")
+
+
+@pytest.mark.unit
+class TestEncodeErrorBody:
+    """Test encode_error_body."""
+
+    def test_default_message_uses_preserialized_body(self):
+        """Test default details return the same pre-encoded bytes object."""
+        exc = forbidden()
+
+        body = encode_error_body(exc.status_code, exc.detail)
+
+        assert body is encode_error_body(exc.status_code, exc.detail)
+        assert json.loads(body) == {"detail": "Not authorized to perform this action"}
+
+    def test_custom_detail_is_encoded(self):
+        """Test non-default details, including structured ones, are encoded."""
+        assert json.loads(encode_error_body(400, "Invalid email")) == {"detail": "Invalid email"}
+        assert json.loads(encode_error_body(422, {"field": "email"})) == {
+            "detail": {"field": "email"}
+        }
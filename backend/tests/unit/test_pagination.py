@@ -0,0 +1,214 @@
+"""
+Unit tests for pagination utilities.
+
+Tests page/total calculation and single-query page fetching.
+"""
+
+import pytest
+from sqlalchemy import select
+
+from app.api.utils import pagination
+from app.api.utils.pagination import calculate_pagination, fetch_page, fetch_sorted_page
+from app.models.audit_log import AuditLog
+
+
+@pytest.mark.unit
+class TestCalculatePagination:
+    """Test calculate_pagination."""
+
+    def test_offset_and_pages(self):
+        """Test offset and total pages for a middle page."""
+        assert calculate_pagination(total=100, page=2, page_size=20) == (20, 5)
+
+    def test_partial_last_page(self):
+        """Test a partial last page is counted."""
+        assert calculate_pagination(total=41, page=1, page_size=20) == (0, 3)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestFetchPage:
+    """Test fetch_page."""
+
+    @pytest.fixture
+    async def audit_logs(self, db_session, admin_user):
+        for i in range(5):
+            db_session.add(AuditLog(user_id=admin_user.id, action="LOGIN_SUCCESS", resource_id=i))
+        db_session.add(AuditLog(user_id=admin_user.id, action="LOGOUT"))
+        await db_session.commit()
+
+    async def test_page_and_total(self, db_session, audit_logs):
+        """Test a page returns page_size entities and the filtered total."""
+        query = (
+            select(AuditLog)
+            .where(AuditLog.action == "LOGIN_SUCCESS")
+            .order_by(AuditLog.resource_id)
+        )
+
+        items, total, _, _ = await fetch_page(db_session, query, page=2, page_size=2)
+
+        assert total == 5
+        assert [log.resource_id for log in items] == [2, 3]
+
+    async def test_page_past_end(self, db_session, audit_logs):
+        """Test a page past the end still reports the total."""
+        items, total, _, _ = await fetch_page(
+            db_session, select(AuditLog).order_by(AuditLog.id), page=10, page_size=5
+        )
+
+        assert items == []
+        assert total == 6
+
+    async def test_empty(self, db_session):
+        """Test an empty table returns no items and zero total."""
+        assert await fetch_page(db_session, select(AuditLog), page=1, page_size=5) == ([], 0, None, False)
+
+    async def test_cached_total_for_later_pages(self, db_session, admin_user, audit_logs):
+        """Test later pages reuse a cached total and page 1 recounts."""
+        query = select(AuditLog).order_by(AuditLog.id)
+
+        _, total, _, _ = await fetch_page(db_session, query, 1, 2, count_key="logs")
+        assert total == 6
+
+        db_session.add(AuditLog(user_id=admin_user.id, action="LOGOUT"))
+        await db_session.commit()
+
+        items, total, _, _ = await fetch_page(db_session, query, 2, 2, count_key="logs")
+        assert total == 6
+        assert len(items) == 2
+
+        _, total, _, _ = await fetch_page(db_session, query, 1, 2, count_key="logs")
+        assert total == 7
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestFetchSortedPage:
+    """Test fetch_sorted_page cursor paging."""
+
+    async def test_cursor_walk_matches_offset_pages(self, db_session, admin_user):
+        """Test cursor pages return the same rows as numbered pages, including ties."""
+        for i in range(7):
+            # Equal resource_id pairs exercise the id tie-breaker
+            db_session.add(AuditLog(user_id=admin_user.id, action="LOGIN_SUCCESS", resource_id=i // 2))
+        await db_session.commit()
+
+        sort = (AuditLog.resource_id, AuditLog.id)
+        query = select(AuditLog).order_by(*(c.desc() for c in sort))
+
+        by_page = []
+        for page in range(1, 5):
+            items, total, _, _ = await fetch_sorted_page(db_session, query, sort, page, 2, descending=True)
+            by_page.extend(log.id for log in items)
+
+        by_cursor = []
+        items, total, cursor, _ = await fetch_sorted_page(db_session, query, sort, 1, 2, descending=True)
+        by_cursor.extend(log.id for log in items)
+        while cursor:
+            items, total, cursor, _ = await fetch_sorted_page(
+                db_session, query, sort, 1, 2, cursor, descending=True
+            )
+            by_cursor.extend(log.id for log in items)
+
+        assert total == 7
+        assert by_cursor == by_page
+        assert len(by_cursor) == 7
+
+    async def test_datetime_cursor(self, db_session, admin_user):
+        """Test a cursor over a timestamp column round-trips."""
+        from datetime import datetime, timedelta
+
+        base = datetime(2026, 1, 1, 12, 0, 0)
+        for i in range(3):
+            db_session.add(AuditLog(
+                user_id=admin_user.id, action="LOGOUT", created_at=base + timedelta(minutes=i)
+            ))
+        await db_session.commit()
+
+        sort = (AuditLog.created_at, AuditLog.id)
+        query = select(AuditLog).order_by(*sort)
+
+        first, _, cursor, _ = await fetch_sorted_page(db_session, query, sort, 1, 2)
+        rest, _, next_cursor, _ = await fetch_sorted_page(db_session, query, sort, 1, 2, cursor)
+
+        assert [log.created_at.minute for log in first + rest] == [0, 1, 2]
+        assert next_cursor is None
+
+    async def test_wrong_typed_cursor_value(self):
+        """Test a cursor value of the wrong type for its column is rejected with 400."""
+        import base64
+
+        from fastapi import HTTPException
+
+        cursor = base64.urlsafe_b64encode(b'["2026-01-01T00:00:00", "abc"]').decode()
+
+        with pytest.raises(HTTPException) as exc_info:
+            pagination.keyset_filter(cursor, (AuditLog.created_at, AuditLog.id))
+        assert exc_info.value.status_code == 400
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRowEstimate:
+    """Test planner estimates replacing large counts."""
+
+    async def test_no_estimate_on_sqlite(self, db_session):
+        """Test estimate_rows only runs EXPLAIN on PostgreSQL."""
+        assert await pagination.estimate_rows(db_session, select(AuditLog)) is None
+
+    async def test_large_estimate_replaces_count(self, db_session, admin_user, mocker):
+        """Test an estimate above the threshold is reported instead of a count."""
+        db_session.add_all([AuditLog(user_id=admin_user.id, action="LOGOUT") for _ in range(3)])
+        await db_session.commit()
+        mocker.patch.object(pagination, "estimate_rows", return_value=50_000)
+
+        listing = await fetch_page(
+            db_session, select(AuditLog).order_by(AuditLog.id), 1, 2, estimate=True
+        )
+
+        assert listing.total == 50_000
+        assert listing.total_is_estimate is True
+        assert len(listing.items) == 2
+
+    async def test_underestimate_keeps_later_pages_reachable(self, db_session, admin_user, mocker):
+        """Test an estimate below the rows found is raised past the page, then settles at the end."""
+        db_session.add_all([AuditLog(user_id=admin_user.id, action="LOGOUT") for _ in range(5)])
+        await db_session.commit()
+        mocker.patch.object(pagination, "estimate_rows", return_value=2)
+        mocker.patch.object(pagination, "ESTIMATE_THRESHOLD", 1)
+        query = select(AuditLog).order_by(AuditLog.id)
+
+        listing = await fetch_sorted_page(
+            db_session, query, (AuditLog.id,), 2, 2, count_key="logs", estimate=True
+        )
+        assert (listing.total, listing.total_is_estimate) == (5, True)
+        assert listing.next_cursor is not None
+
+        listing = await fetch_page(db_session, query, 3, 2, count_key="logs", estimate=True)
+        assert len(listing.items) == 1
+        assert (listing.total, listing.total_is_estimate) == (5, False)
+
+    async def test_cached_total_skips_explain(self, db_session, admin_user, mocker):
+        """Test page 1 with a cached exact total recounts without running EXPLAIN."""
+        db_session.add(AuditLog(user_id=admin_user.id, action="LOGOUT"))
+        await db_session.commit()
+        estimate_rows = mocker.patch.object(pagination, "estimate_rows", return_value=5)
+        query = select(AuditLog).order_by(AuditLog.id)
+
+        await fetch_page(db_session, query, 1, 10, count_key="logs", estimate=True)
+        listing = await fetch_page(db_session, query, 1, 10, count_key="logs", estimate=True)
+
+        assert (listing.total, listing.total_is_estimate) == (1, False)
+        estimate_rows.assert_awaited_once()
+
+    async def test_small_estimate_counts(self, db_session, admin_user, mocker):
+        """Test an estimate below the threshold falls through to an exact count."""
+        db_session.add(AuditLog(user_id=admin_user.id, action="LOGOUT"))
+        await db_session.commit()
+        mocker.patch.object(pagination, "estimate_rows", return_value=5)
+
+        total, is_estimate = await pagination.count_total(
+            db_session, select(AuditLog), estimate=True
+        )
+
+        assert (total, is_estimate) == (1, False)
@@ -7,8 +7,10 @@ list, and business logic.
 
 import pytest
 from datetime import datetime, timezone
+from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.dependencies import permissions
 from app.services.participant_service import ParticipantService
 from app.models.user import User, UserRole
 from app.models.event import Event, generate_slug
@@ -196,6 +198,19 @@ class TestParticipantServiceRetrieve:
 
         assert user is None
 
+    async def test_email_exists(
+        self, db_session: AsyncSession, invitee_user: User
+    ):
+        """Test email_exists matches case-insensitively and honours exclude_id."""
+        service = ParticipantService(db_session)
+
+        assert await service.email_exists(invitee_user.email) is True
+        assert await service.email_exists(invitee_user.email.upper()) is True
+        assert await service.email_exists("nonexistent@test.com") is False
+        assert await service.email_exists(
+            invitee_user.email, exclude_id=invitee_user.id
+        ) is False
+
     async def test_list_participants(
         self,
         db_session: AsyncSession,
@@ -1943,3 +1958,106 @@ class TestParticipantServiceEventIntegration:
         # (invitees without credentials are handled by background task)
         assert participant.confirmation_code is not None
         assert mock_trigger.call_count == 0  # Not called because has_credentials is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGetParticipantFor:
+    """Test ParticipantService.get_participant_for."""
+
+    async def test_returns_participant(
+        self, db_session: AsyncSession, sponsor_user: User, invitee_user: User
+    ):
+        """Test a sponsor can load their own sponsored participant."""
+        service = ParticipantService(db_session)
+
+        participant = await service.get_participant_for(
+            sponsor_user, invitee_user.id, permissions.can_edit_participant
+        )
+
+        assert participant.id == invitee_user.id
+
+    async def test_missing_raises_not_found(self, db_session: AsyncSession, admin_user: User):
+        """Test a missing participant raises 404."""
+        service = ParticipantService(db_session)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_participant_for(admin_user, 99999, permissions.can_view_participant)
+
+        assert exc_info.value.status_code == 404
+
+    async def test_permission_denied(
+        self, db_session: AsyncSession, admin_user: User, sponsor_user: User
+    ):
+        """Test the action's permission check is applied."""
+        service = ParticipantService(db_session)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_participant_for(
+                sponsor_user, admin_user.id, permissions.can_delete_participant
+            )
+
+        assert exc_info.value.status_code == 403
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGetParticipantIdentityMap:
+    """Test get_participant reuses instances already in the session."""
+
+    async def test_second_lookup_issues_no_sql(
+        self, db_session: AsyncSession, async_engine, invitee_user: User
+    ):
+        """Test a repeated primary-key lookup is served from the identity map."""
+        from sqlalchemy import event
+
+        service = ParticipantService(db_session)
+        db_session.expunge_all()
+        first = await service.get_participant(invitee_user.id)
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(async_engine.sync_engine, "before_cursor_execute", listener)
+        try:
+            second = await service.get_participant(invitee_user.id)
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", listener)
+
+        assert second is first
+        assert statements == []
+
+    async def test_loads_missing_relationships(
+        self, db_session: AsyncSession, sponsor_user: User, invitee_user: User
+    ):
+        """Test an instance loaded without eager options gets its relationships loaded."""
+        from sqlalchemy import inspect, select
+
+        db_session.expunge_all()
+        plain = (await db_session.execute(
+            select(User).where(User.id == invitee_user.id)
+        )).scalar_one()
+        assert "sponsor" in inspect(plain).unloaded
+
+        participant = await ParticipantService(db_session).get_participant(invitee_user.id)
+
+        assert participant is plain
+        unloaded = inspect(participant).unloaded
+        assert not unloaded & set(ParticipantService.PARTICIPANT_RELATIONSHIPS)
+        assert participant.sponsor.id == sponsor_user.id
+
+    async def test_reloads_expired_columns(
+        self, db_session: AsyncSession, invitee_user: User
+    ):
+        """Test server-generated columns expired by an UPDATE are reloaded."""
+        from sqlalchemy import inspect
+
+        service = ParticipantService(db_session)
+        participant = await service.get_participant(invitee_user.id)
+        participant.first_name = "Renamed"
+        await db_session.commit()
+        assert "updated_at" in inspect(participant).expired_attributes
+
+        participant = await service.get_participant(invitee_user.id)
+
+        assert "updated_at" not in inspect(participant).unloaded
+        assert participant.updated_at is not None
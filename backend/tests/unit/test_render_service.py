@@ -0,0 +1,100 @@
+"""Unit tests for the Render service helpers.
+
+Tests the process-wide Gotenberg lease without calling the Render API.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services import render_service
+from app.services.render_service import GotenbergLease
+
+
+@pytest.fixture
+def render():
+    """A Render manager whose Gotenberg start/stop are mocked."""
+    manager = MagicMock(enabled=True)
+    manager.start_gotenberg = AsyncMock(return_value=True)
+    manager.stop_gotenberg = AsyncMock(return_value=True)
+    return manager
+
+
+@pytest.fixture(autouse=True)
+def reset_lease(mocker):
+    """Give each test a fresh lease and no idle delay."""
+    mocker.patch.object(render_service, "GOTENBERG_IDLE_STOP_SECONDS", 0)
+    for name, value in (("_count", 0), ("_running", False), ("_lock", None), ("_stop_task", None)):
+        mocker.patch.object(GotenbergLease, name, value)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGotenbergLease:
+    """Test GotenbergLease reference counting."""
+
+    async def test_overlapping_holders_share_one_start(self, render):
+        """Test concurrent holders start Gotenberg once and stop it once, after the last."""
+        async with GotenbergLease(render) as first:
+            async with GotenbergLease(render) as second:
+                assert first and second
+            render.stop_gotenberg.assert_not_awaited()
+
+        await GotenbergLease._stop_task
+        render.start_gotenberg.assert_awaited_once()
+        render.stop_gotenberg.assert_awaited_once()
+
+    async def test_reacquire_while_idle_cancels_stop(self, render, mocker):
+        """Test a holder arriving during the idle delay keeps Gotenberg running."""
+        mocker.patch.object(render_service, "GOTENBERG_IDLE_STOP_SECONDS", 60)
+
+        async with GotenbergLease(render):
+            pass
+        pending_stop = GotenbergLease._stop_task
+        async with GotenbergLease(render):
+            pass
+
+        await asyncio.sleep(0)
+        assert pending_stop.cancelled()
+        render.start_gotenberg.assert_awaited_once()
+        GotenbergLease._stop_task.cancel()
+
+    async def test_disabled_render_is_a_no_op(self, render):
+        """Test nothing is started or scheduled when the Render API is not configured."""
+        render.enabled = False
+
+        async with GotenbergLease(render) as ready:
+            assert ready
+
+        render.start_gotenberg.assert_not_awaited()
+        assert GotenbergLease._stop_task is None
+
+    async def test_release_does_not_wait_for_a_start(self, render):
+        """Test releasing returns while another holder is still starting Gotenberg."""
+        async with GotenbergLease(render):
+            render.start_gotenberg.side_effect = lambda: asyncio.sleep(60, result=True)
+            GotenbergLease._running = False
+            starting = asyncio.create_task(GotenbergLease(render).__aenter__())
+            await asyncio.sleep(0)
+
+        assert GotenbergLease._count == 1
+        starting.cancel()
+
+    async def test_failed_start_gives_back_its_reference(self, render):
+        """Test a start that raises still lets the next release stop Gotenberg."""
+        render.start_gotenberg.side_effect = RuntimeError("Render API unavailable")
+
+        with pytest.raises(RuntimeError):
+            async with GotenbergLease(render):
+                pass
+        assert GotenbergLease._count == 0
+        await GotenbergLease._stop_task
+
+        render.start_gotenberg.side_effect = None
+        async with GotenbergLease(render) as ready:
+            assert ready
+
+        assert GotenbergLease._count == 0
+        await GotenbergLease._stop_task
+        assert render.stop_gotenberg.await_count == 2
@@ -0,0 +1,42 @@
+"""
+Unit tests for request utility functions.
+
+Tests client metadata extraction and its per-request caching.
+"""
+
+import pytest
+from starlette.requests import Request
+
+from app.api.utils.request import extract_client_metadata
+
+
+def _request(headers=None, client=("203.0.113.7", 4321)):
+    return Request({
+        "type": "http",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "client": client,
+    })
+
+
+@pytest.mark.unit
+class TestExtractClientMetadata:
+    """Test extract_client_metadata."""
+
+    def test_ip_and_user_agent(self):
+        """Test the client host and user agent are returned."""
+        request = _request({"User-Agent": "pytest"})
+
+        assert extract_client_metadata(request) == ("203.0.113.7", "pytest")
+
+    def test_missing_client(self):
+        """Test a request without client info returns None for both."""
+        assert extract_client_metadata(_request(client=None)) == (None, None)
+
+    def test_cached_per_request(self):
+        """Test repeat calls reuse the first result."""
+        request = _request({"User-Agent": "first"})
+        first = extract_client_metadata(request)
+
+        request.scope["client"] = ("198.51.100.1", 1)
+
+        assert extract_client_metadata(request) is first
@@ -0,0 +1,145 @@
+"""
+Unit tests for API response builders.
+
+Tests that the batched participant response builder produces the same
+responses as the per-user builder.
+"""
+
+import orjson
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.api.utils.response_builders import (
+    build_participant_response,
+    build_participant_responses,
+    json_response,
+)
+from app.models.event import EventParticipation, ParticipationStatus
+from app.models.user import User
+from app.models.vpn import VPNCredential
+from app.schemas.participant import SponsorInfo
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBuildParticipantResponses:
+    """Test build_participant_responses."""
+
+    async def test_empty_list(self, db_session):
+        """Test an empty user list returns no responses."""
+        assert await build_participant_responses([], db_session) == []
+
+    async def test_matches_single_builder(
+        self, db_session, admin_user, sponsor_user, invitee_user, active_event
+    ):
+        """Test batched responses match per-user responses."""
+        db_session.add(VPNCredential(
+            interface_ip="10.66.66.10/32",
+            ipv4_address="10.66.66.10",
+            private_key="test_private_key",
+            endpoint="vpn.example.com:51820",
+            key_type="vpn",
+            is_available=False,
+            assigned_to_user_id=invitee_user.id,
+        ))
+        db_session.add(EventParticipation(
+            user_id=invitee_user.id,
+            event_id=active_event.id,
+            status=ParticipationStatus.CONFIRMED.value,
+        ))
+        await db_session.commit()
+
+        result = await db_session.execute(
+            select(User)
+            .options(selectinload(User.sponsor), selectinload(User.event_participations))
+            .order_by(User.id)
+            .execution_options(populate_existing=True)
+        )
+        users = list(result.scalars().all())
+
+        batched = await build_participant_responses(users, db_session)
+        single = [await build_participant_response(u, db_session) for u in users]
+
+        assert [r.model_dump() for r in batched] == [r.model_dump() for r in single]
+
+        by_id = {r.id: r for r in batched}
+        invitee = by_id[invitee_user.id]
+        assert invitee.vpn_count == 1
+        assert invitee.has_vpn is True
+        assert invitee.sponsor.id == sponsor_user.id
+        assert invitee.role_name is not None
+        assert invitee.event_participation_status == ParticipationStatus.CONFIRMED.value
+        assert by_id[admin_user.id].vpn_count == 0
+        assert by_id[admin_user.id].sponsor is None
+
+    async def test_sponsor_loaded_when_relationship_not_loaded(
+        self, db_session, sponsor_user, invitee_user
+    ):
+        """Test sponsors are batch-loaded for users without the relationship loaded."""
+        db_session.expunge_all()
+        result = await db_session.execute(
+            select(User)
+            .options(selectinload(User.event_participations))
+            .where(User.id == invitee_user.id)
+        )
+        invitee = result.scalar_one()
+
+        responses = await build_participant_responses(
+            [invitee], db_session, include_vpn=False
+        )
+
+        assert responses[0].sponsor.id == sponsor_user.id
+        assert responses[0].vpn_count == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestParticipantLoadOptions:
+    """Test participant queries load everything the response builder reads."""
+
+    async def test_list_participants_loads_relationships(
+        self, db_session, sponsor_user, invitee_user
+    ):
+        """Test listed participants have sponsor, participations and role loaded."""
+        from sqlalchemy import inspect
+        from app.services.participant_service import ParticipantService
+
+        db_session.expunge_all()
+        participants, _ = await ParticipantService(db_session).list_participants()
+
+        for p in participants:
+            unloaded = inspect(p).unloaded
+            assert "sponsor" not in unloaded
+            assert "event_participations" not in unloaded
+            assert "role_obj" not in unloaded
+
+
+@pytest.mark.unit
+class TestJsonResponse:
+    """Test json_response."""
+
+    def test_model(self):
+        """Test a single model is dumped in JSON mode."""
+        from datetime import datetime, timezone
+        from app.schemas.audit import AuditLogResponse
+
+        log = AuditLogResponse(
+            id=1, user_id=None, action="LOGOUT", resource_type=None, resource_id=None,
+            details=None, ip_address=None, user_agent=None,
+            created_at=datetime(2026, 1, 2, tzinfo=timezone.utc),
+        )
+
+        body = orjson.loads(json_response(log).body)
+
+        assert body["action"] == "LOGOUT"
+        assert body["created_at"].startswith("2026-01-02T00:00:00")
+
+    def test_list(self):
+        """Test a list of models is dumped as a JSON array."""
+        items = [SponsorInfo(
+            id=1, email="a@test.com", first_name="A", last_name="B", full_name="A B"
+        )]
+
+        assert orjson.loads(json_response(items).body) == [items[0].model_dump(mode="json")]
+
@@ -0,0 +1,92 @@
+"""
+Unit tests for the dashboard statistics cache.
+
+Tests TTL expiry, invalidation, and single-flight loading.
+"""
+
+import asyncio
+
+import pytest
+
+from app.api.utils import stats_cache
+
+
+def _counting_loader(value="stats"):
+    """Return a loader coroutine function and a list recording its calls."""
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return value
+
+    return loader, calls
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStatsCache:
+    """Test stats_cache.cached and invalidate."""
+
+    async def test_cached_within_ttl(self):
+        """Test the loader runs once while the value is fresh."""
+        loader, calls = _counting_loader()
+
+        assert await stats_cache.cached("key", 60, loader) == "stats"
+        assert await stats_cache.cached("key", 60, loader) == "stats"
+        assert len(calls) == 1
+
+    async def test_reloads_after_ttl(self):
+        """Test an expired value is reloaded."""
+        loader, calls = _counting_loader()
+
+        await stats_cache.cached("key", 0, loader)
+        await stats_cache.cached("key", 0, loader)
+
+        assert len(calls) == 2
+
+    async def test_invalidate(self):
+        """Test invalidate forces a reload."""
+        loader, calls = _counting_loader()
+
+        await stats_cache.cached("key", 60, loader)
+        stats_cache.invalidate("key")
+        await stats_cache.cached("key", 60, loader)
+
+        assert len(calls) == 2
+
+    async def test_concurrent_misses_load_once(self):
+        """Test concurrent callers share one loader call."""
+        loader, calls = _counting_loader()
+
+        results = await asyncio.gather(
+            *(stats_cache.cached("key", 60, loader) for _ in range(5))
+        )
+
+        assert results == ["stats"] * 5
+        assert len(calls) == 1
+
+
+@pytest.mark.unit
+class TestGetPut:
+    """Test stats_cache.get and put."""
+
+    def test_put_then_get(self):
+        """Test a stored value is returned until it expires."""
+        stats_cache.put("key", 60, 5)
+        stats_cache.put("expired", 0, 5)
+
+        assert stats_cache.get("key") == 5
+        assert stats_cache.get("expired") is None
+        assert stats_cache.get("missing") is None
+
+    def test_bounded(self, monkeypatch):
+        """Test the oldest entries are dropped when the cache is full."""
+        monkeypatch.setattr(stats_cache, "_MAX_ENTRIES", 2)
+
+        for key in ("a", "b", "c"):
+            stats_cache.put(key, 60, key)
+
+        assert stats_cache.get("a") is None
+        assert stats_cache.get("b") == "b"
+        assert stats_cache.get("c") == "c"